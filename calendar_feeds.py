@@ -0,0 +1,77 @@
+"""
+FIS and IBU World Cup calendar feeds shared by the calendar update scripts
+(parse_fis_calendar, parse_events_combined and update_events_auto).
+
+Feeds are fetched through the HTTP cache and their parse results are
+reused while a feed is unchanged (http_client.fetch_parsed).
+"""
+
+import json
+import sys
+from datetime import datetime
+from typing import Dict, List
+
+from event_store import write_events
+from http_client import fetch_parsed
+from ical_reader import PARSER_VERSION, read_fis_world_cup_events
+
+# IBU API URL for biathlon events
+IBU_API_URL = "https://biathlonresults.com/modules/sportapi/api/Events?SeasonId=2526&Level=1"
+
+# Version of parse_biathlon_events output (bump when it changes)
+IBU_PARSER_VERSION = '1'
+
+
+def fetch_and_parse_calendar(url: str) -> List[Dict]:
+    """Fetch a FIS iCalendar feed and read its World Cup events ([] on error)"""
+    try:
+        return fetch_parsed(url, read_fis_world_cup_events, parser_version=PARSER_VERSION)
+    except Exception as e:
+        print(f"Error fetching calendar: {e}", file=sys.stderr)
+        return []
+
+
+def parse_biathlon_events(api_response: str) -> List[Dict]:
+    """Parse the World Cup events of an IBU API response"""
+    data = json.loads(api_response)
+    
+    events = []
+    # Check if data is a list or has a 'value' key
+    items = data if isinstance(data, list) else data.get('value', [])
+    
+    for item in items:
+        # Only include World Cup events (Level 1)
+        if item.get('Level') != 1:
+            continue
+        
+        start_date = datetime.fromisoformat(item['StartDate'].replace('Z', '+00:00'))
+        
+        event = {
+            'location': item.get('ShortDescription', ''),
+            'date': start_date.strftime('%Y-%m-%d'),
+            'country': item.get('Nat', ''),
+            'event_id': item.get('EventId', '')
+        }
+        events.append(event)
+    
+    return events
+
+
+def fetch_biathlon_events(url: str = IBU_API_URL) -> List[Dict]:
+    """Fetch the IBU World Cup events ([] on error)"""
+    try:
+        return fetch_parsed(url, parse_biathlon_events, parser_version=IBU_PARSER_VERSION)
+    except Exception as e:
+        print(f"Error fetching biathlon events: {e}", file=sys.stderr)
+        return []
+
+
+def update_events_store(events: List[Dict], source: str = 'FIS/IBU calendar') -> bool:
+    """Publish events to the events store (events.jsonl); False if it could not be written"""
+    try:
+        write_events(events, source=source)
+        return True
+    except OSError as e:
+        # Includes StoreLockTimeout and a store held open on Windows
+        print(f"Could not write events store: {e}", file=sys.stderr)
+        return False
@@ -7,11 +7,13 @@ import logging
 import re
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict
-from home_assistant import HomeAssistantNotifier
-from mongodb_client import MongoDBClient
+from typing import List, Dict, Optional
 from config import get_config
-from events_manager import EventsManager
+from event_store import read_identity
+
+# home_assistant (requests) and mongodb_client/events_manager (pymongo)
+# are imported where they are used, so a scheduled run with nothing to
+# do (reminders disabled) exits without loading them
 
 # Set up logging
 logging.basicConfig(
@@ -26,117 +28,98 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+SYNC_MARKER_PATH = Path(__file__).parent / '.last_event_sync'
+
+
+def read_synced_identity() -> Optional[str]:
+    """Events store identity (event_store.read_identity) recorded by the last successful sync"""
+    try:
+        with open(SYNC_MARKER_PATH, 'r') as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
 def should_sync_events() -> bool:
-    """Check if script.js has been modified since last sync"""
-    script_path = Path(__file__).parent / 'script.js'
-    sync_marker_path = Path(__file__).parent / '.last_event_sync'
-    
-    if not script_path.exists():
+    """Check if the events store changed since the last sync"""
+    identity = read_identity()
+    if identity is None:
         return False
     
-    script_mtime = script_path.stat().st_mtime
-    
-    # If marker file doesn't exist, we need to sync
-    if not sync_marker_path.exists():
-        return True
-    
-    try:
-        with open(sync_marker_path, 'r') as f:
-            last_sync_time = float(f.read().strip())
-        
-        # If script.js is newer than last sync, sync again
-        return script_mtime > last_sync_time
-    except:
-        return True
+    # A marker from before identities were recorded never matches
+    return identity != read_synced_identity()
 
 
 def sync_events_to_mongodb() -> bool:
-    """Sync events from script.js to MongoDB (only if changed)"""
+    """Sync events from the events store to MongoDB (only if changed)"""
     try:
         # Check if sync is needed
         if not should_sync_events():
-            logger.debug("script.js hasn't changed, skipping sync")
+            logger.debug("Events store hasn't changed, skipping sync")
             return True
         
+        from events_manager import EventsManager
+        
+        # Record the identity seen before reading the store; a publish
+        # during the sync then triggers another sync next time
+        identity = read_identity()
+        
         events_manager = EventsManager()
         
         if events_manager.events_collection is None:
             logger.warning("MongoDB not connected - skipping event sync")
             return False
         
-        # Clean up past events first
-        cleaned = events_manager.cleanup_past_events()
-        if cleaned > 0:
-            logger.info(f"Removed {cleaned} past events")
-        
-        # Import events from script.js
-        imported = events_manager.import_events_from_js()
+        # Incremental sync: only new/changed events are written, and events
+        # that are gone from the store (including past ones) are removed
+        report = events_manager.sync_events(exclude_past=True)
         events_manager.close()
         
-        if imported > 0:
-            logger.info(f"Synced {imported} events to MongoDB")
-            
-            # Update sync marker
-            script_path = Path(__file__).parent / 'script.js'
-            sync_marker_path = Path(__file__).parent / '.last_event_sync'
-            
-            with open(sync_marker_path, 'w') as f:
-                f.write(str(script_path.stat().st_mtime))
-            
-            return True
-        else:
+        if report is None:
             logger.warning("No events synced to MongoDB")
             return False
-            
+        
+        logger.info(
+            f"Synced events to MongoDB: {len(report['new'])} new, {len(report['changed'])} changed, "
+            f"{len(report['deleted'])} removed, {report['unchanged_count']} unchanged"
+        )
+        
+        # Update sync marker
+        with open(SYNC_MARKER_PATH, 'w') as f:
+            f.write(identity)
+        
+        return True
+    
     except Exception as e:
         logger.error(f"Error syncing events to MongoDB: {e}")
         return False
 
 
-def get_events_from_mongodb() -> List[Dict]:
-    """Get all events from MongoDB"""
+def get_events_from_mongodb(start: Optional[datetime] = None, end: Optional[datetime] = None) -> List[Dict]:
+    """Get events from MongoDB (only those starting in [start, end) if start is given)"""
+    from events_manager import EventsManager
+    
     try:
         events_manager = EventsManager()
         
-        if not events_manager.events_collection:
+        if events_manager.events_collection is None:
             logger.warning("MongoDB not connected")
             return []
         
-        events = events_manager.get_all_events()
+        if start is not None:
+            events = events_manager.get_events_in_window(start, end)
+        else:
+            events = events_manager.get_all_events()
         events_manager.close()
         
         logger.info(f"Loaded {len(events)} events from MongoDB")
         return events
-        
+    
     except Exception as e:
         logger.error(f"Error getting events from MongoDB: {e}")
         return []
 
 
-def parse_event_datetime(event: Dict) -> datetime:
-    """Parse event date and time into datetime object"""
-    try:
-        date_str = event.get('date', '')
-        time_str = event.get('time', '')
-        
-        if not date_str or not time_str:
-            return None
-        
-        # Skip TBA times
-        if time_str.upper() == 'TBA':
-            return None
-        
-        # Parse datetime
-        datetime_str = f"{date_str} {time_str}"
-        event_datetime = datetime.strptime(datetime_str, '%Y-%m-%d %H:%M')
-        
-        return event_datetime
-        
-    except Exception as e:
-        logger.debug(f"Error parsing datetime for event {event.get('id')}: {e}")
-        return None
-
-
 def check_and_send_reminders():
     """Check for upcoming events and send reminders"""
     logger.info("=== Starting reminder check ===")
@@ -148,11 +131,15 @@ def check_and_send_reminders():
         logger.info("Reminders are disabled in configuration")
         return
     
-    # Sync events from script.js to MongoDB
+    # Sync events from the events store to MongoDB
     logger.info("Syncing events to MongoDB...")
     sync_events_to_mongodb()
     
     # Initialize services
+    from events_manager import compute_start_at, event_timezone
+    from home_assistant import HomeAssistantNotifier
+    from mongodb_client import MongoDBClient
+    
     notifier = HomeAssistantNotifier()
     db_client = MongoDBClient()
     
@@ -161,20 +148,23 @@ def check_and_send_reminders():
         logger.error("Cannot connect to Home Assistant. Aborting reminder check.")
         return
     
-    # Get events from MongoDB
-    events = get_events_from_mongodb()
+    # Get the events of the next 24 hours (filtered by MongoDB on start_at)
+    # Event times are in the event time zone, whatever the host's zone is
+    tz = event_timezone()
+    now = datetime.now(tz)
+    events = get_events_from_mongodb(now, now + timedelta(hours=24))
     
     if not events:
-        logger.warning("No events found to check")
+        logger.info("No events in the next 24 hours")
         return
     
-    now = datetime.now()
     reminders_sent = 0
     reminders_skipped = 0
     
-    # Check each event
+    # Collect the reminders that are due in this run
+    candidates = []
     for event in events:
-        event_datetime = parse_event_datetime(event)
+        event_datetime = compute_start_at(event, tz)
         
         if not event_datetime:
             continue
@@ -198,29 +188,49 @@ def check_and_send_reminders():
             window = 10  # minutes
             
             if abs(minutes_until_event - reminder_minutes) <= window:
-                event_id = str(event.get('id', 'unknown'))
-                
-                # Check if reminder already sent
-                if db_client.is_connected() and db_client.has_reminder_been_sent(event_id, reminder_minutes):
-                    logger.debug(f"Reminder already sent for event {event_id} ({reminder_minutes} min)")
-                    reminders_skipped += 1
-                    continue
-                
-                # Send reminder
-                logger.info(f"Sending reminder for: {event.get('title')} (in {minutes_until_event} min)")
-                
-                if notifier.send_reminder(event, reminder_minutes):
-                    # Mark as sent in database
-                    if db_client.is_connected():
-                        db_client.mark_reminder_sent(
-                            event_id,
-                            event.get('title', 'Unknown'),
-                            reminder_minutes,
-                            event_datetime
-                        )
-                    reminders_sent += 1
-                else:
-                    logger.error(f"Failed to send reminder for: {event.get('title')}")
+                candidates.append((event, reminder_minutes, event_datetime, minutes_until_event))
+    
+    # One query for every reminder already sent for the candidate events
+    sent_keys = set()
+    if candidates and db_client.is_connected():
+        sent_keys = db_client.get_sent_reminder_keys(
+            [str(event.get('id', 'unknown')) for event, _, _, _ in candidates]
+        )
+    
+    to_send = []
+    for event, reminder_minutes, event_datetime, minutes_until_event in candidates:
+        event_id = str(event.get('id', 'unknown'))
+        
+        # Check if reminder already sent
+        if (event_id, reminder_minutes) in sent_keys:
+            logger.debug(f"Reminder already sent for event {event_id} ({reminder_minutes} min)")
+            reminders_skipped += 1
+            continue
+        
+        # Don't send the same reminder twice in one run
+        sent_keys.add((event_id, reminder_minutes))
+        logger.info(f"Sending reminder for: {event.get('title')} (in {minutes_until_event} min)")
+        to_send.append((event, reminder_minutes, event_datetime))
+    
+    # Send reminders concurrently (bounded and rate limited per HA instance)
+    results = notifier.send_reminders([(event, minutes) for event, minutes, _ in to_send])
+    
+    newly_sent = []
+    for (event, reminder_minutes, event_datetime), success in zip(to_send, results):
+        if success:
+            newly_sent.append({
+                'event_id': str(event.get('id', 'unknown')),
+                'event_title': event.get('title', 'Unknown'),
+                'minutes_before': reminder_minutes,
+                'event_datetime': event_datetime,
+            })
+            reminders_sent += 1
+        else:
+            logger.error(f"Failed to send reminder for: {event.get('title')}")
+    
+    # Mark all sent reminders in one bulk write
+    if newly_sent and db_client.is_connected():
+        db_client.mark_reminders_sent(newly_sent)
     
     # Cleanup old reminders
     if db_client.is_connected():
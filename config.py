@@ -1,11 +1,28 @@
 """
 Configuration management for Winter Sports TV Schedule
+
+get_config() returns a cached Config. The .env file is only re-read when
+its modification time, inode or size changes (checked at most every
+ENV_CHECK_INTERVAL_SECONDS), and subscribers are notified when a reload
+produces a different configuration. Long-running processes therefore
+pick up settings saved from the web interface without restarting.
 """
 
+import logging
 import os
+import threading
+import time
 from pathlib import Path
-from typing import List
+from typing import Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+logger = logging.getLogger(__name__)
+
+ENV_PATH = Path(__file__).parent / '.env'
+
+# Minimum time between two checks of the .env file for changes
+ENV_CHECK_INTERVAL_SECONDS = 1.0
 
 @dataclass
 class Config:
@@ -15,10 +32,14 @@ class Config:
     home_assistant_url: str = ""
     home_assistant_token: str = ""
     home_assistant_service: str = "notify.persistent_notification"
+    home_assistant_max_concurrency: int = 4
+    home_assistant_rate_limit: float = 5.0  # Requests per second
     
     # MongoDB
     mongodb_uri: str = ""
     mongodb_database: str = "winter_sports"
+    mongodb_max_pool_size: int = 10
+    mongodb_min_pool_size: int = 0
     
     # Reminders
     reminder_intervals: List[int] = None  # Minutes before event
@@ -33,6 +54,9 @@ class Config:
     weekend_start_hour: int = 9
     weekend_end_hour: int = 23
     
+    # Time zone of the event date/time strings (Swedish TV listings)
+    event_timezone: str = "Europe/Stockholm"
+    
     def __post_init__(self):
         if self.reminder_intervals is None:
             self.reminder_intervals = [60, 15]  # Default: 1 hour and 15 minutes
@@ -69,18 +93,29 @@ def load_env_file(env_path: Path) -> dict:
     return env_vars
 
 
-def get_config() -> Config:
-    """Get application configuration from environment variables"""
+def _apply_env_vars(env_vars: Dict[str, str]):
+    """
+    Copy .env values into os.environ.
     
-    # Load .env file if it exists
-    env_path = Path(__file__).parent / '.env'
-    env_vars = load_env_file(env_path)
+    Real environment variables take precedence. Keys set from an earlier
+    version of .env are overwritten, or removed if they left the file.
+    """
+    for key in list(_injected_env):
+        if os.environ.get(key) != _injected_env[key]:
+            # Changed by someone else since we set it - no longer ours
+            del _injected_env[key]
+        elif key not in env_vars:
+            del os.environ[key]
+            del _injected_env[key]
     
-    # Merge with actual environment variables (actual env vars take precedence)
     for key, value in env_vars.items():
-        if key not in os.environ:
+        if key not in os.environ or key in _injected_env:
             os.environ[key] = value
-    
+            _injected_env[key] = value
+
+
+def _build_config() -> Config:
+    """Build a Config from the environment"""
     # Parse reminder intervals
     reminder_intervals_str = os.getenv('REMINDER_INTERVALS', '60,15')
     reminder_intervals = [int(x.strip()) for x in reminder_intervals_str.split(',')]
@@ -92,12 +127,23 @@ def get_config() -> Config:
     # Parse boolean
     reminders_enabled = os.getenv('REMINDERS_ENABLED', 'true').lower() in ('true', '1', 'yes')
     
+    # Validate the time zone here, so a typo in .env keeps the last good config
+    event_timezone = os.getenv('EVENT_TIMEZONE', 'Europe/Stockholm')
+    try:
+        ZoneInfo(event_timezone)
+    except (ZoneInfoNotFoundError, ValueError):
+        raise ValueError(f"Unknown EVENT_TIMEZONE {event_timezone!r}")
+    
     return Config(
         home_assistant_url=os.getenv('HOME_ASSISTANT_URL', ''),
         home_assistant_token=os.getenv('HOME_ASSISTANT_TOKEN', ''),
         home_assistant_service=os.getenv('HOME_ASSISTANT_SERVICE', 'notify.persistent_notification'),
+        home_assistant_max_concurrency=int(os.getenv('HOME_ASSISTANT_MAX_CONCURRENCY', '4')),
+        home_assistant_rate_limit=float(os.getenv('HOME_ASSISTANT_RATE_LIMIT', '5')),
         mongodb_uri=os.getenv('MONGODB_URI', ''),
         mongodb_database=os.getenv('MONGODB_DATABASE', 'winter_sports'),
+        mongodb_max_pool_size=int(os.getenv('MONGODB_MAX_POOL_SIZE', '10')),
+        mongodb_min_pool_size=int(os.getenv('MONGODB_MIN_POOL_SIZE', '0')),
         reminder_intervals=reminder_intervals,
         reminders_enabled=reminders_enabled,
         default_sports=default_sports,
@@ -105,4 +151,120 @@ def get_config() -> Config:
         weekday_end_hour=int(os.getenv('WEEKDAY_END_HOUR', '23')),
         weekend_start_hour=int(os.getenv('WEEKEND_START_HOUR', '9')),
         weekend_end_hour=int(os.getenv('WEEKEND_END_HOUR', '23')),
+        event_timezone=event_timezone,
     )
+
+
+ConfigSubscriber = Callable[[Config, Config], None]
+
+_lock = threading.RLock()
+_config: Optional[Config] = None
+_env_stamp: Optional[Tuple[int, int, int]] = None
+_next_check = 0.0
+_injected_env: Dict[str, str] = {}
+_subscribers: List[ConfigSubscriber] = []
+_metrics = {
+    'reloads': 0,
+    'changes': 0,
+    'errors': 0,
+    'last_reload_ms': None,
+    'max_reload_ms': 0.0,
+    'last_reload_at': None,
+}
+
+
+def _stat_env_file() -> Optional[Tuple[int, int, int]]:
+    """Identity of the current .env contents (None if there is no file)"""
+    try:
+        stat = ENV_PATH.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_ino, stat.st_size)
+
+
+def reload_config(force: bool = True) -> Config:
+    """
+    Re-read .env and rebuild the configuration.
+    
+    Args:
+        force: Reload even if the .env file looks unchanged
+    
+    Returns:
+        The current configuration
+    """
+    global _config, _env_stamp, _next_check
+    
+    with _lock:
+        stamp = _stat_env_file()
+        _next_check = time.monotonic() + ENV_CHECK_INTERVAL_SECONDS
+        if _config is not None and not force and stamp == _env_stamp:
+            return _config
+        
+        started = time.perf_counter()
+        try:
+            _apply_env_vars(load_env_file(ENV_PATH))
+            config = _build_config()
+        except (OSError, ValueError) as e:
+            _metrics['errors'] += 1
+            if _config is None:
+                raise
+            # Retry only once the file changes again
+            _env_stamp = stamp
+            # Keep serving the last good configuration (e.g. a half-saved .env)
+            logger.error(f"Error reloading configuration, keeping previous: {e}")
+            return _config
+        
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        _metrics['reloads'] += 1
+        _metrics['last_reload_ms'] = round(elapsed_ms, 3)
+        _metrics['max_reload_ms'] = round(max(_metrics['max_reload_ms'], elapsed_ms), 3)
+        _metrics['last_reload_at'] = time.time()
+        
+        old_config = _config
+        _env_stamp = stamp
+        if old_config is not None and config == old_config:
+            return old_config
+        
+        _config = config
+        if old_config is None:
+            return config
+        
+        _metrics['changes'] += 1
+        subscribers = list(_subscribers)
+    
+    logger.info("Configuration reloaded from .env")
+    for callback in subscribers:
+        try:
+            callback(old_config, config)
+        except Exception as e:
+            logger.error(f"Error in configuration subscriber: {e}")
+    
+    return config
+
+
+def get_config() -> Config:
+    """Get the application configuration (re-read only when .env changes)"""
+    config = _config
+    if config is not None and time.monotonic() < _next_check:
+        return config
+    return reload_config(force=False)
+
+
+def subscribe(callback: ConfigSubscriber):
+    """Call callback(old_config, new_config) whenever the configuration changes"""
+    with _lock:
+        if callback not in _subscribers:
+            _subscribers.append(callback)
+
+
+def unsubscribe(callback: ConfigSubscriber):
+    """Stop notifying a subscriber"""
+    with _lock:
+        if callback in _subscribers:
+            _subscribers.remove(callback)
+
+
+def get_config_metrics() -> Dict:
+    """Reload counters and latency (milliseconds) for /api/metrics"""
+    with _lock:
+        return dict(_metrics, subscribers=len(_subscribers))
@@ -0,0 +1,72 @@
+"""
+Stable event ids derived from event content.
+
+An id depends only on the normalized sport, date, time, channel, title
+and competition of the event, so re-scraping the same schedule gives
+the same ids regardless of list order. MongoDB upserts stay incremental
+and sent-reminder keys (event_id, minutes_before) survive re-scrapes.
+"""
+
+import hashlib
+import re
+import unicodedata
+from typing import Dict, List
+
+# Fields an id is derived from. Competition separates events that share
+# a title and placeholder time (e.g. the men's and women's sprint).
+EVENT_ID_FIELDS = ('sport', 'date', 'time', 'channel', 'title', 'competition')
+
+# Hex digits kept from the hash (64 bits)
+EVENT_ID_LENGTH = 16
+
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def normalize_id_part(value) -> str:
+    """Normalize a field so cosmetic differences do not change the id"""
+    if value is None:
+        return ''
+    text = unicodedata.normalize('NFKC', str(value)).casefold()
+    return WHITESPACE_PATTERN.sub(' ', text).strip()
+
+
+def make_event_id(event: Dict) -> str:
+    """
+    Derive the id of an event from its content.
+    
+    Args:
+        event: Event dictionary
+    
+    Returns:
+        Hex id string (e.g., '3f2a9c0d1b7e4a55')
+    """
+    key = '\x1f'.join(normalize_id_part(event.get(field)) for field in EVENT_ID_FIELDS)
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()[:EVENT_ID_LENGTH]
+
+
+def assign_event_ids(events: List[Dict]) -> List[Dict]:
+    """
+    Set a content-derived id on every event (in place).
+    
+    Events with identical id fields get a numbered suffix ('-2', '-3', ...)
+    in list order, so ids stay unique.
+    
+    Args:
+        events: List of event dictionaries
+    
+    Returns:
+        The same list
+    """
+    seen = {}
+    for event in events:
+        event_id = make_event_id(event)
+        count = seen.get(event_id, 0) + 1
+        seen[event_id] = count
+        
+        # Keep 'id' as the first key, as in the published events store
+        fields = {key: value for key, value in event.items() if key != 'id'}
+        event.clear()
+        event['id'] = event_id if count == 1 else f"{event_id}-{count}"
+        event.update(fields)
+    
+    return events
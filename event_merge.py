@@ -0,0 +1,290 @@
+"""
+Merge engine for tv.nu broadcasts and FIS/IBU calendar events.
+
+Events are blocked into (sport, date) buckets, so each event is only
+compared with the handful of events of the same sport on the same day:
+
+- Broadcasts in a bucket that share a start time and have near-identical
+  titles (token similarity) are duplicates; the most complete one is kept.
+- A calendar event is covered by a broadcast in its bucket unless their
+  genders or locations conflict. Broadcasts naming the calendar event's
+  location are found through a token index and preferred. Covered
+  calendar events are dropped, uncovered ones are kept.
+
+Run this module to evaluate the merge on the checked-in JSON files;
+tests/test_event_merge.py pins the expected counts.
+"""
+
+import json
+import re
+import sys
+import unicodedata
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# Minimum token similarity for two broadcasts at the same time to be duplicates
+DUPLICATE_THRESHOLD = 0.8
+
+# Words that say nothing about which event a title refers to
+STOPWORDS = {
+    'i', 'fran', 'och', 'med', 'pa', 'av', 'the', 'vm', 'os',
+    'varldscupen', 'varldscup', 'varldscuptavling', 'world', 'cup',
+    'langdskidakning', 'langdskidor', 'skidskytte', 'biathlon', 'alpint',
+    'backhoppning', 'ishockey', 'konstakning', 'curling', 'tba',
+}
+
+# Gender markers in titles and competitions
+WOMEN_PATTERN = re.compile(r'\((?:d|w)\)|\b(?:dam|damer|damernas|women|ladies)\b', re.IGNORECASE)
+MEN_PATTERN = re.compile(r'\((?:h|m)\)|\b(?:herr|herrar|herrarnas|men)\b', re.IGNORECASE)
+
+LOCATION_PATTERN = re.compile(r'(?:\bi|\bfrån)\s+([A-ZÅÄÖ][\w\-]+(?:\s+[A-ZÅÄÖa-zåäö][\w\-]+){0,3})')
+TOKEN_PATTERN = re.compile(r'[a-z]+|\d+')
+
+# Spellings used by the IBU feed ("Oestersund") for Swedish/German letters
+TRANSLITERATIONS = (('oe', 'o'), ('ae', 'a'), ('ue', 'u'), ('aa', 'a'))
+
+
+def fold_text(text: str) -> str:
+    """Casefold and strip accents ("Östersund" -> "ostersund")"""
+    decomposed = unicodedata.normalize('NFKD', text.casefold())
+    return ''.join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def tokenize(text: Optional[str]) -> Set[str]:
+    """Meaningful, normalized tokens of a text"""
+    if not text:
+        return set()
+    return {token for token in TOKEN_PATTERN.findall(fold_text(text)) if token not in STOPWORDS}
+
+
+def normalize_place(token: str) -> str:
+    for spelling, letter in TRANSLITERATIONS:
+        token = token.replace(spelling, letter)
+    return token
+
+
+def similarity(a: Set[str], b: Set[str]) -> float:
+    """Jaccard similarity of two token sets"""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def event_gender(event: Dict) -> Optional[str]:
+    """'W', 'M' or None (unknown / mixed)"""
+    text = ' '.join(str(event.get(field) or '') for field in ('title', 'competition', 'description'))
+    women = WOMEN_PATTERN.search(text) is not None
+    men = MEN_PATTERN.search(text) is not None
+    if women == men:
+        return None
+    return 'W' if women else 'M'
+
+
+def event_location(event: Dict) -> Set[str]:
+    """Normalized location tokens of a calendar event"""
+    location = event.get('location')
+    if not location:
+        match = LOCATION_PATTERN.search(event.get('title') or '')
+        location = match.group(1) if match else ''
+    # Drop country codes such as "(FIN)"
+    location = re.sub(r'\(.*?\)', ' ', location)
+    return {normalize_place(token) for token in tokenize(location)}
+
+
+class _Broadcast:
+    """A tv.nu event with its precomputed match features"""
+    
+    __slots__ = ('event', 'tokens', 'places', 'gender')
+    
+    def __init__(self, event: Dict):
+        self.event = event
+        self.tokens = tokenize(f"{event.get('title', '')} {event.get('description', '')}")
+        self.places = {normalize_place(token) for token in self.tokens}
+        self.gender = event_gender(event)
+
+
+def _completeness(event: Dict) -> Tuple:
+    """Sort key preferring events with a known channel/time and a longer title"""
+    return (event.get('channel') not in (None, '', 'TBA'), event.get('time') not in (None, '', 'TBA'),
+            len(event.get('title') or ''))
+
+
+def dedupe_broadcasts(events: Iterable[Dict]) -> Tuple[List[Dict], int]:
+    """
+    Remove duplicate broadcasts.
+    
+    Broadcasts are duplicates when they have the same sport, date and time,
+    compatible channels (equal, or one unknown) and titles with token
+    similarity of at least DUPLICATE_THRESHOLD.
+    
+    Returns:
+        Tuple of (unique events in input order, number of duplicates removed)
+    """
+    kept: List[_Broadcast] = []
+    buckets: Dict[Tuple, List[int]] = defaultdict(list)
+    removed = 0
+    
+    for event in events:
+        broadcast = _Broadcast(event)
+        key = (event.get('sport'), event.get('date'), event.get('time'))
+        
+        duplicate_of = None
+        for index in buckets[key]:
+            other = kept[index]
+            channels = {other.event.get('channel'), event.get('channel')} - {None, '', 'TBA'}
+            if len(channels) <= 1 and similarity(other.tokens, broadcast.tokens) >= DUPLICATE_THRESHOLD:
+                duplicate_of = index
+                break
+        
+        if duplicate_of is None:
+            buckets[key].append(len(kept))
+            kept.append(broadcast)
+            continue
+        
+        removed += 1
+        if _completeness(event) > _completeness(kept[duplicate_of].event):
+            kept[duplicate_of] = broadcast
+    
+    return [broadcast.event for broadcast in kept], removed
+
+
+class _DayIndex:
+    """Broadcasts of one sport on one day, indexed by place token"""
+    
+    def __init__(self):
+        self.broadcasts: List[_Broadcast] = []
+        self.by_place: Dict[str, List[_Broadcast]] = defaultdict(list)
+    
+    def add(self, broadcast: _Broadcast):
+        self.broadcasts.append(broadcast)
+        for place in broadcast.places:
+            self.by_place[place].append(broadcast)
+
+
+def _genders_compatible(a: Optional[str], b: Optional[str]) -> bool:
+    return a is None or b is None or a == b
+
+
+def find_covering_broadcast(calendar_event: Dict, day: _DayIndex,
+                            known_places: Set[str]) -> Optional[Dict]:
+    """
+    Find the broadcast of a calendar event among the broadcasts of its day.
+    
+    Args:
+        calendar_event: FIS/IBU calendar event
+        day: Broadcasts of the same sport on the same date
+        known_places: Location tokens of all calendar events (used to spot
+            broadcasts from a different venue)
+    
+    Returns:
+        The best matching broadcast event, or None
+    """
+    gender = event_gender(calendar_event)
+    places = event_location(calendar_event)
+    
+    # Blocking: broadcasts that name the venue are looked up directly
+    named = {id(b): b for place in places for b in day.by_place.get(place, ())}
+    candidates = [b for b in named.values() if _genders_compatible(gender, b.gender)]
+    if candidates:
+        tokens = tokenize(f"{calendar_event.get('competition', '')} {calendar_event.get('title', '')}")
+        return max(candidates, key=lambda b: similarity(tokens, b.tokens)).event
+    
+    # Otherwise any gender-compatible broadcast that names no other venue
+    for broadcast in day.broadcasts:
+        if not _genders_compatible(gender, broadcast.gender):
+            continue
+        if (broadcast.places & known_places) - places:
+            continue
+        return broadcast.event
+    
+    return None
+
+
+def merge_events(tv_events: List[Dict], calendar_events: List[Dict],
+                 mark_unverified: bool = False) -> Tuple[List[Dict], Dict[str, int]]:
+    """
+    Merge tv.nu broadcasts with calendar events.
+    
+    Args:
+        tv_events: Events from tv.nu (with 'sport', 'date', 'time', 'channel', 'title')
+        calendar_events: FIS/IBU calendar events
+        mark_unverified: Set verified=False on the calendar events that are kept
+    
+    Returns:
+        Tuple of (merged events - unique broadcasts first, then calendar
+        events not covered by any broadcast - and match statistics)
+    """
+    broadcasts, duplicates = dedupe_broadcasts(tv_events)
+    
+    days: Dict[Tuple, _DayIndex] = defaultdict(_DayIndex)
+    for event in broadcasts:
+        days[(event.get('sport'), event.get('date'))].add(_Broadcast(event))
+    
+    known_places = set()
+    for event in calendar_events:
+        known_places |= event_location(event)
+    
+    merged = list(broadcasts)
+    matched = 0
+    for event in calendar_events:
+        if not event.get('date'):
+            continue
+        
+        day = days.get((event.get('sport'), event.get('date')))
+        if day and find_covering_broadcast(event, day, known_places):
+            matched += 1
+            continue
+        
+        if mark_unverified:
+            event['verified'] = False
+        merged.append(event)
+    
+    stats = {
+        'broadcasts': len(broadcasts),
+        'duplicate_broadcasts': duplicates,
+        'calendar_events': len(calendar_events),
+        'calendar_covered': matched,
+        'calendar_kept': len(merged) - len(broadcasts),
+    }
+    return merged, stats
+
+
+def merge_summary(stats: Dict[str, int]) -> str:
+    """One-line description of merge_events statistics for the scrapers' output"""
+    return (f"{stats['calendar_covered']} calendar events matched a broadcast, "
+            f"{stats['duplicate_broadcasts']} duplicate broadcasts removed")
+
+
+def load_events(path: str) -> List[Dict]:
+    """Load an events JSON file (a list, or an object with a 'value' list)"""
+    for encoding in ('utf-8', 'utf-16'):
+        try:
+            with open(path, 'r', encoding=encoding) as f:
+                data = json.load(f)
+            break
+        except UnicodeError:
+            continue
+    else:
+        raise ValueError(f"{path} is neither UTF-8 nor UTF-16 encoded")
+    return data if isinstance(data, list) else data.get('value', [])
+
+
+def evaluate(tv_file: str = 'tvnu_events_selenium.json', calendar_file: str = 'events.json'):
+    """Compare the merge engine with the old exact (date, sport) merge on saved data"""
+    tv_events = [e for e in load_events(tv_file) if e.get('verified')]
+    calendar_events = load_events(calendar_file)
+    
+    tv_keys = {(e.get('date'), e.get('sport')) for e in tv_events}
+    old_kept = sum(1 for e in calendar_events if (e.get('date'), e.get('sport')) not in tv_keys)
+    
+    merged, stats = merge_events(tv_events, [dict(e) for e in calendar_events])
+    
+    print(f"tv.nu broadcasts: {len(tv_events)} ({stats['duplicate_broadcasts']} duplicates removed)")
+    print(f"Calendar events:  {stats['calendar_events']}")
+    print(f"  covered by a broadcast: {stats['calendar_covered']}")
+    print(f"  kept:                   {stats['calendar_kept']} (exact date+sport merge kept {old_kept})")
+    print(f"Merged events:    {len(merged)}")
+
+
+if __name__ == "__main__":
+    evaluate(*sys.argv[1:3])
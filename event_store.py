@@ -0,0 +1,362 @@
+"""
+Canonical event store: events.jsonl.
+
+The first line is a header object, every following line is one event as
+compact JSON:
+    
+    {"format": "winter-sports-events", "version": 1, "generation": 7, "count": 2, "updated_at": "...", "source": "..."}
+    {"id": "3f2a9c0d1b7e4a55", "sport": "biathlon", ...}
+    {"id": "9b1c44e07d2f8a13", "sport": "cross-country", ...}
+
+Producers publish under an advisory lock (one writer at a time), write a
+temporary file, fsync it and rename it over the store, so readers never
+see a half-written store and a crash leaves either the old or the new
+file. On Windows, where an open file cannot be replaced, the rename is
+retried briefly while a reader has the store open.
+
+Every publish increments the header's generation. Generations are
+counted per machine, and the store is also updated by git pulls and hand
+edits, so readers that need to notice changes compare read_identity (the
+generation plus a hash of the contents) instead of file modification
+times. Events are streamed one line at a time.
+
+Each publish also writes events.js next to the store, the same events as
+`window.EVENTS_STORE = {"header": ..., "events": [...]}`. index.html loads
+it with a <script> tag, which (unlike fetch) works when the page is opened
+straight from disk. After editing events.jsonl by hand, run this module to
+regenerate events.js.
+"""
+
+import hashlib
+import json
+import os
+import stat
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+STORE_FORMAT = 'winter-sports-events'
+STORE_VERSION = 1
+
+# Default location, next to script.js (override with EVENTS_STORE_FILE)
+EVENTS_STORE_PATH = Path(os.getenv('EVENTS_STORE_FILE', Path(__file__).parent / 'events.jsonl'))
+
+# How long a producer waits for another producer to finish publishing
+LOCK_TIMEOUT_SECONDS = float(os.getenv('EVENTS_STORE_LOCK_TIMEOUT', '30'))
+LOCK_POLL_SECONDS = 0.05
+
+# How long a publish retries the rename while a reader has the store open
+# (Windows refuses to replace an open file)
+REPLACE_TIMEOUT_SECONDS = float(os.getenv('EVENTS_STORE_REPLACE_TIMEOUT', '5'))
+
+
+class StoreFormatError(ValueError):
+    """The events store is missing its header, has an unknown version or is truncated"""
+
+
+class StoreLockTimeout(TimeoutError):
+    """Another producer held the store lock for longer than the timeout"""
+
+
+def _store_path(path: Optional[Union[str, Path]]) -> Path:
+    return Path(path) if path is not None else EVENTS_STORE_PATH
+
+
+def _try_lock(f) -> bool:
+    try:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+        return True
+    except OSError:
+        return False
+
+
+def _unlock(f):
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+@contextmanager
+def store_lock(path: Optional[Union[str, Path]] = None, timeout: float = LOCK_TIMEOUT_SECONDS):
+    """
+    Hold the advisory publish lock of the store (<store>.lock).
+    
+    Args:
+        path: Store file (default: EVENTS_STORE_PATH)
+        timeout: Seconds to wait for another producer
+    
+    Raises:
+        StoreLockTimeout: The lock was not acquired within the timeout
+    """
+    path = _store_path(path)
+    lock_path = path.with_name(path.name + '.lock')
+    deadline = time.monotonic() + timeout
+    
+    with open(lock_path, 'a+b') as f:
+        while not _try_lock(f):
+            if time.monotonic() >= deadline:
+                raise StoreLockTimeout(f"Timed out waiting for {lock_path}")
+            time.sleep(LOCK_POLL_SECONDS)
+        try:
+            yield
+        finally:
+            _unlock(f)
+
+
+def inline_script_path(path: Optional[Union[str, Path]] = None) -> Path:
+    """events.js that accompanies a store (events.jsonl -> events.js)"""
+    return _store_path(path).with_suffix('.js')
+
+
+def _fsync_directory(directory: Path):
+    """Persist a rename (not possible, and not needed, on Windows)"""
+    if os.name != 'posix':
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def write_events(events: Iterable[Dict], path: Optional[Union[str, Path]] = None,
+                 source: str = '') -> Dict:
+    """
+    Publish events: replace the store atomically with the next generation.
+    
+    Args:
+        events: Events to store, in display order
+        path: Store file (default: EVENTS_STORE_PATH)
+        source: Producer name recorded in the header (e.g., 'tv.nu')
+    
+    Returns:
+        The header that was written
+    
+    Raises:
+        StoreLockTimeout: Another producer kept publishing for too long
+        PermissionError: A reader kept the store open for longer than
+            REPLACE_TIMEOUT_SECONDS (Windows only)
+    """
+    path = _store_path(path)
+    events = list(events)
+    
+    with store_lock(path):
+        header = {
+            'format': STORE_FORMAT,
+            'version': STORE_VERSION,
+            'generation': (read_generation(path) or 0) + 1,
+            'count': len(events),
+            'updated_at': datetime.now().isoformat(timespec='seconds'),
+            'source': source,
+        }
+        
+        def write_store(f):
+            f.write(json.dumps(header, ensure_ascii=False) + '\n')
+            for event in events:
+                f.write(json.dumps(event, ensure_ascii=False, separators=(',', ':')) + '\n')
+        
+        _replace_file(path, write_store)
+        _write_inline_script(header, events, path)
+        _fsync_directory(path.parent)
+    
+    return header
+
+
+def _published_mode(path: Path) -> int:
+    """Mode of the file being replaced, or 0o644 minus the umask for a new file"""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o644 & ~umask
+
+
+def _replace_with_retry(tmp_path: str, path: Path):
+    """
+    Rename tmp_path over path.
+    
+    On Windows the rename fails with PermissionError while any reader (the
+    web app's send_file, a sync's iter_events) has the target open. Readers
+    only hold it briefly, so retry until REPLACE_TIMEOUT_SECONDS have passed.
+    Callers hold the store lock, so no other producer publishes meanwhile.
+    """
+    deadline = time.monotonic() + REPLACE_TIMEOUT_SECONDS
+    while True:
+        try:
+            os.replace(tmp_path, path)
+            return
+        except PermissionError:
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(LOCK_POLL_SECONDS)
+
+
+def _replace_file(path: Path, write):
+    """Write a file through a temporary file and rename it over path"""
+    # Write next to the target so the rename stays on one filesystem
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='\n') as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates the file owner-only (0600); readers running as
+        # another user (web server, scheduled task) need the usual mode
+        os.chmod(tmp_path, _published_mode(path))
+        _replace_with_retry(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _write_inline_script(header: Dict, events: List[Dict], path: Path):
+    def write_script(f):
+        f.write(f"// Generated from {path.name} by event_store.py - do not edit\n")
+        f.write('window.EVENTS_STORE = ')
+        json.dump({'header': header, 'events': events}, f, ensure_ascii=False, separators=(',', ':'))
+        f.write(';\n')
+    
+    _replace_file(inline_script_path(path), write_script)
+
+
+def write_inline_script(path: Optional[Union[str, Path]] = None) -> Dict:
+    """
+    Regenerate events.js from the store (e.g., after editing it by hand).
+    
+    Returns:
+        The header of the store
+    
+    Raises:
+        FileNotFoundError: The store does not exist
+        StoreFormatError: Bad header or fewer/more events than the header says
+    """
+    path = _store_path(path)
+    with store_lock(path):
+        events = list(iter_events(path))
+        header = read_header(path)
+        _write_inline_script(header, events, path)
+        _fsync_directory(path.parent)
+    return header
+
+
+def _parse_header(line: str, path: Path) -> Dict:
+    try:
+        header = json.loads(line)
+    except ValueError:
+        header = None
+    
+    if not isinstance(header, dict) or header.get('format') != STORE_FORMAT:
+        raise StoreFormatError(f"{path} has no events store header")
+    if header.get('version') != STORE_VERSION:
+        raise StoreFormatError(f"{path} has unsupported store version {header.get('version')!r}")
+    return header
+
+
+def read_header(path: Optional[Union[str, Path]] = None) -> Optional[Dict]:
+    """Read only the header of the store (None if the store does not exist)"""
+    path = _store_path(path)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return _parse_header(f.readline(), path)
+    except FileNotFoundError:
+        return None
+
+
+def read_generation(path: Optional[Union[str, Path]] = None) -> Optional[int]:
+    """
+    Generation of the published store.
+    
+    Returns:
+        The generation (0 for stores written before generations were
+        recorded), or None if there is no valid store
+    """
+    try:
+        header = read_header(path)
+    except StoreFormatError:
+        return None
+    return header.get('generation', 0) if header else None
+
+
+def read_identity(path: Optional[Union[str, Path]] = None) -> Optional[str]:
+    """
+    Identity of the published store contents.
+    
+    Returns:
+        "<generation>:<sha1 of the file>", or None if there is no valid
+        store. Equal identities mean equal contents, however the store
+        got there (publish, git pull, hand edit).
+    """
+    path = _store_path(path)
+    generation = read_generation(path)
+    if generation is None:
+        return None
+    
+    digest = hashlib.sha1()
+    try:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(65536), b''):
+                digest.update(chunk)
+    except FileNotFoundError:
+        return None
+    return f"{generation}:{digest.hexdigest()}"
+
+
+def iter_events(path: Optional[Union[str, Path]] = None) -> Iterator[Dict]:
+    """
+    Stream the events of the store.
+    
+    Args:
+        path: Store file (default: EVENTS_STORE_PATH)
+    
+    Yields:
+        Event dictionaries in stored order
+    
+    Raises:
+        FileNotFoundError: The store does not exist
+        StoreFormatError: Bad header or fewer/more events than the header says
+    """
+    path = _store_path(path)
+    with open(path, 'r', encoding='utf-8') as f:
+        header = _parse_header(f.readline(), path)
+        
+        count = 0
+        for line in f:
+            if not line.strip():
+                continue
+            yield json.loads(line)
+            count += 1
+    
+    if count != header['count']:
+        raise StoreFormatError(f"{path} has {count} events, header says {header['count']}")
+
+
+def load_events(path: Optional[Union[str, Path]] = None) -> Optional[List[Dict]]:
+    """Load all events of the store (None if the store does not exist)"""
+    try:
+        return list(iter_events(path))
+    except FileNotFoundError:
+        return None
+
+
+if __name__ == "__main__":
+    header = write_inline_script()
+    print(f"Wrote {inline_script_path()} ({header['count']} events, generation {header.get('generation', 0)})")
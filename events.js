@@ -0,0 +1,2 @@
+// Generated from events.jsonl by event_store.py - do not edit
+window.EVENTS_STORE = {"header":{"format":"winter-sports-events","version":1,"generation":1,"count":107,"updated_at":"2026-10-17T10:59:33","source":"tv.nu (Selenium)"},"events":[{"id":"8984f4e147f99a55","sport":"ice-hockey","title":"Buffalo Sabres - Edmonton Oilers - Ishockey, NHL (H)","competition":"Världscup","channel":"V Sport Premium","date":"2025-11-17","time":"01:05","description":"Buffalo Sabres - Edmonton Oilers - Ishockey, NHL (H)"},{"id":"68c1cc963709f88a","sport":"ice-hockey","title":"Boston Bruins - Carolina Hurricanes - Ishockey, NHL (H)","competition":"Världscup","channel":"V Sport Extra","date":"2025-11-17","time":"01:05","description":"Boston Bruins - Carolina Hurricanes - Ishockey, NHL (H)"},{"id":"b145f9cb10cbb41a","sport":"ice-hockey","title":"Washington Capitals - Los Angeles Kings - Ishockey, NHL (H)","competition":"Världscup","channel":"V Sport 1","date":"2025-11-17","time":"01:05","description":"Washington Capitals - Los Angeles Kings - Ishockey, NHL (H)"},{"id":"49c086e26f379e6c","sport":"ice-hockey","title":"Florida Panthers - Vancouver Canucks - Ishockey, NHL (H)","competition":"Världscup","channel":"V Sport Vinter","date":"2025-11-17","time":"01:05","description":"Florida Panthers - Vancouver Canucks - Ishockey, NHL (H)"},{"id":"33179a2a6cc55960","sport":"ice-hockey","title":"Columbus Blue Jackets - Montreal Canadiens - Ishockey, NHL (H)","competition":"Världscup","channel":"V Sport Live 1","date":"2025-11-17","time":"01:35","description":"Columbus Blue Jackets - Montreal Canadiens - Ishockey, NHL (H)"},{"id":"fcb3837bc137bed9","sport":"ice-hockey","title":"Anaheim Ducks - Utah Hockey Club - Ishockey, NHL (H)","competition":"Världscup","channel":"V Sport Vinter","date":"2025-11-17","time":"04:05","description":"Anaheim Ducks - Utah Hockey Club - Ishockey, NHL (H)"},{"id":"fda9d697bb1160e4","sport":"ice-hockey","title":"BIK Karlskoga - Östersunds IK - Ishockey, Hockeyallsvenskan (H)","competition":"Världscup","channel":"TV4 Hockey","date":"2025-11-17","time":"18:55","description":"BIK Karlskoga - Östersunds IK - Ishockey, Hockeyallsvenskan (H)"},{"id":"ef29f0fc899ba4fb","sport":"ice-hockey","title":"Toronto Maple Leafs - St. Louis Blues - Ishockey, NHL (H)","competition":"Världscup","channel":"V Sport Extra","date":"2025-11-18","time":"01:05","description":"Toronto Maple Leafs - St. Louis Blues - Ishockey, NHL (H)"},{"id":"8b0e148e6d075235","sport":"ice-hockey","title":"Detroit Red Wings - Seattle Kraken - Ishockey, NHL (H)","competition":"Världscup","channel":"V Sport Premium","date":"2025-11-18","time":"01:05","description":"Detroit Red Wings - Seattle Kraken - Ishockey, NHL (H)"},{"id":"b3fec1f469fb1116","sport":"ice-hockey","title":"Tampa Bay Lightning - New Jersey Devils - Ishockey, NHL (H)","competition":"Världscup","channel":"V Sport Vinter","date":"2025-11-18","time":"01:05","description":"Tampa Bay Lightning - New Jersey Devils - Ishockey, NHL (H)"},{"id":"f417b11591b860fa","sport":"ice-hockey","title":"Winnipeg Jets - Columbus Blue Jackets - Ishockey, NHL (H)","competition":"Världscup","channel":"V Sport Live 1","date":"2025-11-18","time":"02:05","description":"Winnipeg Jets - Columbus Blue Jackets - Ishockey, NHL (H)"},{"id":"2dc95d3112f4c70f","sport":"ice-hockey","title":"Dallas Stars - New York Islanders - Ishockey, NHL (H)","competition":"Världscup","channel":"V Sport Live 2","date":"2025-11-18","time":"02:05","description":"Dallas Stars - New York Islanders - Ishockey, NHL (H)"},{"id":"388e75702e722285","sport":"ice-hockey","title":"Chicago Blackhawks - Calgary Flames - Ishockey, NHL (H)","competition":"Världscup","channel":"V Sport 1","date":"2025-11-18","time":"02:35","description":"Chicago Blackhawks - Calgary Flames - Ishockey, NHL (H)"},{"id":"cfb64d42d1a43a62","sport":"ice-hockey","title":"Vegas Golden Knights - New York Rangers - Ishockey, NHL (H)","competition":"Världscup","channel":"V Sport Vinter","date":"2025-11-18","time":"04:05","description":"Vegas Golden Knights - New York Rangers - Ishockey, NHL (H)"},{"id":"a6e189bfecd94061","sport":"ice-hockey","title":"San Jose Sharks - Utah Hockey Club - Ishockey, NHL (H)","competition":"Världscup","channel":"V Sport Premium","date":"2025-11-18","time":"04:05","description":"San Jose Sharks - Utah Hockey Club - Ishockey, NHL (H)"},{"id":"f1effcf05935be4d","sport":"ice-hockey","title":"HC Kometa Brno - Luleå HF - Ishockey, Champions Hockey League, Åttondelsfinal","competition":"Världscup","channel":"TV10","date":"2025-11-18","time":"17:55","description":"HC Kometa Brno - Luleå HF - Ishockey, Champions Hockey League, Åttondelsfinal"},{"id":"e4ddac20b2773510","sport":"ice-hockey","title":"Frölunda HC - Grenoble Bruleurs de Loups - Ishockey, Champions Hockey League, Åttondelsfinal","competition":"Världscup","channel":"V Sport Vinter","date":"2025-11-18","time":"18:55","description":"Frölunda HC - Grenoble Bruleurs de Loups - Ishockey, Champions Hockey League, Åttondelsfinal"},{"id":"6222388e81ad7da2","sport":"ice-hockey","title":"SC Bern - Brynäs IF - Ishockey, Champions Hockey League, Åttondelsfinal","competition":"Världscup","channel":"V Sport 1","date":"2025-11-18","time":"19:40","description":"SC Bern - Brynäs IF - Ishockey, Champions Hockey League, Åttondelsfinal"},{"id":"7c3521a9fb958b7b","sport":"cross-country","title":"Sprint - Längdskidåkning, Gällivare","competition":"Sprint","channel":"SVT1","date":"2025-11-21","time":"11:00","description":"Sprint - Längdskidåkning, Gällivare"},{"id":"417adc06d7e169f8","sport":"figure-skating","title":"Längdskidåkning","competition":"Världscup","channel":"TBA","date":"2025-11-21","time":"13:00","description":"Längdskidåkning"},{"id":"36015874b58f9fda","sport":"ski-jumping","title":"Längdskidåkning","competition":"Världscup","channel":"TBA","date":"2025-11-21","time":"15:50","description":"Längdskidåkning"},{"id":"bef2b7f924f1cd63","sport":"curling","title":"Schweiz-Sverige, damer - Curling","competition":"Världscup - Damer","channel":"Kunskapskanalen","date":"2025-11-22","time":"08:00","description":"Schweiz-Sverige, damer - Curling"},{"id":"63ea187dbfd3f6b6","sport":"cross-country","title":"10 km klassiskt, herrar - Längdskidåkning, Gällivare","competition":"Klassiskt - Herrar","channel":"SVT1","date":"2025-11-22","time":"10:00","description":"10 km klassiskt, herrar - Längdskidåkning, Gällivare"},{"id":"2e60d68aa6e212e1","sport":"cross-country","title":"10 km klassiskt, damer - Längdskidåkning, Gällivare","competition":"Klassiskt - Damer","channel":"SVT1","date":"2025-11-22","time":"11:30","description":"10 km klassiskt, damer - Längdskidåkning, Gällivare"},{"id":"4d0e4addad6f36c2","sport":"figure-skating","title":"Längdskidåkning","competition":"Världscup","channel":"TBA","date":"2025-11-22","time":"11:30","description":"Längdskidåkning"},{"id":"92f67c53a7276b33","sport":"ski-jumping","title":"Längdskidåkning","competition":"Världscup","channel":"TBA","date":"2025-11-22","time":"11:50","description":"Längdskidåkning"},{"id":"3204fd5520263cef","sport":"curling","title":"Schweiz-Sverige, herrar - Curling","competition":"Världscup - Herrar","channel":"Kunskapskanalen","date":"2025-11-22","time":"13:30","description":"Schweiz-Sverige, herrar - Curling"},{"id":"4dace68c211fe329","sport":"ski-jumping","title":"Längdskidåkning","competition":"Världscup","channel":"TBA","date":"2025-11-22","time":"15:50","description":"Längdskidåkning"},{"id":"d3f7d7f28601d4e4","sport":"cross-country","title":"10 km fri stil, herrar - Längdskidåkning, Gällivare","competition":"Fristil - Herrar","channel":"SVT1","date":"2025-11-23","time":"10:05","description":"10 km fri stil, herrar - Längdskidåkning, Gällivare"},{"id":"035a2d0c6a6dc5bd","sport":"cross-country","title":"10 km fri stil, damer - Längdskidåkning, Gällivare","competition":"Fristil - Damer","channel":"SVT1","date":"2025-11-23","time":"11:30","description":"10 km fri stil, damer - Längdskidåkning, Gällivare"},{"id":"47b31dfc1b457257","sport":"ski-jumping","title":"Längdskidåkning","competition":"Världscup","channel":"TBA","date":"2025-11-23","time":"11:50","description":"Längdskidåkning"},{"id":"647d72117b8fb6b4","sport":"ski-jumping","title":"Längdskidåkning","competition":"Världscup","channel":"TBA","date":"2025-11-23","time":"15:50","description":"Längdskidåkning"},{"id":"185500ca27b28ee6","sport":"curling","title":"Sverige-Norge, herrar - Curling","competition":"Världscup - Herrar","channel":"SVT1","date":"2025-11-24","time":"11:00","description":"Sverige-Norge, herrar - Curling"},{"id":"2e384dac2fb60a17","sport":"curling","title":"Lohja Gruppspel Herrar - Curling","competition":"Världscup - Herrar","channel":"Eurosport 1","date":"2025-11-24","time":"11:00","description":"Lohja Gruppspel Herrar - Curling"},{"id":"3ca0cc7c29b87453","sport":"curling","title":"Lohja Gruppspel Damer - Curling","competition":"Världscup - Damer","channel":"Eurosport 1","date":"2025-11-24","time":"15:00","description":"Lohja Gruppspel Damer - Curling"},{"id":"8a40bd3c37ee0e20","sport":"curling","title":"Lohja Gruppspel Herrar - Curling","competition":"Världscup - Herrar","channel":"Eurosport 2","date":"2025-11-24","time":"19:00","description":"Lohja Gruppspel Herrar - Curling"},{"id":"1eb019ef96b6c01e","sport":"curling","title":"Sverige-Italien, herrar - Curling","competition":"Världscup - Herrar","channel":"Kunskapskanalen","date":"2025-11-26","time":"08:00","description":"Sverige-Italien, herrar - Curling"},{"id":"9497753b38022844","sport":"curling","title":"Lohja Gruppspel Damer - Curling","competition":"Världscup - Damer","channel":"Eurosport 2","date":"2025-11-26","time":"13:00","description":"Lohja Gruppspel Damer - Curling"},{"id":"dd40c2db12332c54","sport":"curling","title":"Sverige-Danmark, damer - Curling","competition":"Världscup - Damer","channel":"SVT2","date":"2025-11-27","time":"08:00","description":"Sverige-Danmark, damer - Curling"},{"id":"af8d0e742172c4a5","sport":"curling","title":"Österrike-Sverige, herrar - Curling","competition":"Världscup - Herrar","channel":"SVT1","date":"2025-11-27","time":"13:00","description":"Österrike-Sverige, herrar - Curling"},{"id":"de0fd29ec6e4699b","sport":"curling","title":"Lohja Gruppspel Herrar - Curling","competition":"Världscup - Herrar","channel":"Eurosport 1","date":"2025-11-27","time":"13:00","description":"Lohja Gruppspel Herrar - Curling"},{"id":"e59cbfacd76a60db","sport":"curling","title":"Lohja Semifinal Damer - Curling, EM","competition":"Världscup - Damer","channel":"Eurosport 2","date":"2025-11-27","time":"18:00","description":"Lohja Semifinal Damer - Curling, EM"},{"id":"3edd26628d593e23","sport":"cross-country","title":"Världscupen i Ruka","competition":"10 km - Herrar","channel":"TBA","date":"2025-11-28","time":"TBA","description":"Världscuptävling i Ruka"},{"id":"9ca7c9c02bfe8002","sport":"cross-country","title":"Världscupen i Ruka","competition":"10 km - Damer","channel":"TBA","date":"2025-11-28","time":"TBA","description":"Världscuptävling i Ruka"},{"id":"1bc76652d0b021fa","sport":"curling","title":"Final, damer - Curling","competition":"Världscup - Damer","channel":"SVT1","date":"2025-11-29","time":"09:00","description":"Final, damer - Curling"},{"id":"42cc9e5d27066e15","sport":"curling","title":"Lohja Damer - Curling, EM","competition":"Världscup - Damer","channel":"Eurosport 1","date":"2025-11-29","time":"09:00","description":"Lohja Damer - Curling, EM"},{"id":"e170f779daf3397d","sport":"biathlon","title":"Stafett, damer - Skidskytte, Världscupen","competition":"Stafett - Damer","channel":"SVT1","date":"2025-11-29","time":"13:15","description":"Stafett, damer - Skidskytte, Världscupen"},{"id":"43cc52a8ac67078b","sport":"curling","title":"Lohja Final Herrar - Curling, EM","competition":"Världscup - Herrar","channel":"Eurosport 1","date":"2025-11-29","time":"14:00","description":"Lohja Final Herrar - Curling, EM"},{"id":"4eb00ef7b789d2d9","sport":"curling","title":"Final, herrar - Curling","competition":"Världscup - Herrar","channel":"SVT2","date":"2025-11-29","time":"14:00","description":"Final, herrar - Curling"},{"id":"9f4d2728d0ea31ba","sport":"biathlon","title":"Stafett, herrar - Skidskytte, Världscupen","competition":"Stafett - Herrar","channel":"SVT1","date":"2025-11-29","time":"16:55","description":"Stafett, herrar - Skidskytte, Världscupen"},{"id":"ea9d26c222971887","sport":"cross-country","title":"Världscupen i Ruka","competition":"Sprint - Damer","channel":"TBA","date":"2025-11-29","time":"TBA","description":"Världscuptävling i Ruka"},{"id":"d7a9e306c14a30dd","sport":"cross-country","title":"Världscupen i Ruka","competition":"Sprint - Herrar","channel":"TBA","date":"2025-11-29","time":"TBA","description":"Världscuptävling i Ruka"},{"id":"63618aeca05b5517","sport":"cross-country","title":"20km fri stil, masstart (H) - Längdskidåkning","competition":"Masstart","channel":"Viaplay Sport","date":"2025-11-30","time":"10:00","description":"20km fri stil, masstart (H) - Längdskidåkning"},{"id":"0bd8c2d960ac77a3","sport":"cross-country","title":"20km fri stil, masstart (D) - Längdskidåkning","competition":"Masstart","channel":"Viaplay Sport","date":"2025-11-30","time":"11:45","description":"20km fri stil, masstart (D) - Längdskidåkning"},{"id":"e50a39027fd83ee5","sport":"biathlon","title":"Singlemixed - Skidskytte, Världscupen","competition":"Världscup","channel":"SVT1","date":"2025-11-30","time":"14:00","description":"Singlemixed - Skidskytte, Världscupen"},{"id":"d3d2fa895bd037ff","sport":"biathlon","title":"Mixedstafett - Skidskytte, Världscupen","competition":"Stafett","channel":"SVT1","date":"2025-11-30","time":"16:40","description":"Mixedstafett - Skidskytte, Världscupen"},{"id":"939d1acb4ff5146f","sport":"cross-country","title":"Världscupen i Trondheim","competition":"Sprint - Herrar","channel":"TBA","date":"2025-12-05","time":"TBA","description":"Världscuptävling i Trondheim"},{"id":"0cebf202e1be09ab","sport":"cross-country","title":"Världscupen i Trondheim","competition":"Sprint - Damer","channel":"TBA","date":"2025-12-05","time":"TBA","description":"Världscuptävling i Trondheim"},{"id":"7e40338b2b04b1d2","sport":"cross-country","title":"Världscupen i Trondheim","competition":"Skiatlon - Herrar","channel":"TBA","date":"2025-12-06","time":"TBA","description":"Världscuptävling i Trondheim"},{"id":"a37b6749356cfb92","sport":"cross-country","title":"Världscupen i Trondheim","competition":"Skiatlon - Damer","channel":"TBA","date":"2025-12-06","time":"TBA","description":"Världscuptävling i Trondheim"},{"id":"1dce5bf20ed4aadc","sport":"cross-country","title":"Världscupen i Trondheim","competition":"10 km - Herrar","channel":"TBA","date":"2025-12-07","time":"TBA","description":"Världscuptävling i Trondheim"},{"id":"19f3e8290fd63c19","sport":"cross-country","title":"Världscupen i Trondheim","competition":"10 km - Damer","channel":"TBA","date":"2025-12-07","time":"TBA","description":"Världscuptävling i Trondheim"},{"id":"595ab425d2eb4040","sport":"biathlon","title":"Världscupen i Hochfilzen","competition":"Världscup","channel":"TBA","date":"2025-12-08","time":"TBA","description":"Skidskytte-världscup i Hochfilzen"},{"id":"93743f276f6e7acc","sport":"cross-country","title":"Världscupen i Davos","competition":"Teamsprint - Damer","channel":"TBA","date":"2025-12-12","time":"TBA","description":"Världscuptävling i Davos"},{"id":"89e17daad7b3af7d","sport":"cross-country","title":"Världscupen i Davos","competition":"Teamsprint - Herrar","channel":"TBA","date":"2025-12-12","time":"TBA","description":"Världscuptävling i Davos"},{"id":"cebc9f989d3c59cf","sport":"cross-country","title":"Världscupen i Davos","competition":"Sprint - Herrar","channel":"TBA","date":"2025-12-13","time":"TBA","description":"Världscuptävling i Davos"},{"id":"f8ab28f223f32a4b","sport":"cross-country","title":"Världscupen i Davos","competition":"Sprint - Damer","channel":"TBA","date":"2025-12-13","time":"TBA","description":"Världscuptävling i Davos"},{"id":"e45ef19fe74e4a79","sport":"cross-country","title":"Världscupen i Davos","competition":"10 km - Herrar","channel":"TBA","date":"2025-12-14","time":"TBA","description":"Världscuptävling i Davos"},{"id":"c4353edeccaa3e0c","sport":"cross-country","title":"Världscupen i Davos","competition":"10 km - Damer","channel":"TBA","date":"2025-12-14","time":"TBA","description":"Världscuptävling i Davos"},{"id":"e4711f9361320b4b","sport":"biathlon","title":"Världscupen i Annecy-Le Grand Bornand","competition":"Världscup","channel":"TBA","date":"2025-12-15","time":"TBA","description":"Skidskytte-världscup i Annecy-Le Grand Bornand"},{"id":"6cd5026cabafc7d7","sport":"cross-country","title":"Världscupen i Tour de Ski","competition":"50 km - Damer","channel":"TBA","date":"2026-01-04","time":"TBA","description":"Världscuptävling i Tour de Ski"},{"id":"c22773a8fe0116a8","sport":"cross-country","title":"Världscupen i Tour de Ski","competition":"50 km - Herrar","channel":"TBA","date":"2026-01-04","time":"TBA","description":"Världscuptävling i Tour de Ski"},{"id":"3f6e5743f82ec524","sport":"biathlon","title":"Världscupen i Oberhof","competition":"Världscup","channel":"TBA","date":"2026-01-05","time":"TBA","description":"Skidskytte-världscup i Oberhof"},{"id":"9f4e99e7ac74d09c","sport":"biathlon","title":"Världscupen i Ruhpolding","competition":"Världscup","channel":"TBA","date":"2026-01-12","time":"TBA","description":"Skidskytte-världscup i Ruhpolding"},{"id":"88a697c34bcfc4bf","sport":"cross-country","title":"Världscupen i Oberhof","competition":"Sprint - Damer","channel":"TBA","date":"2026-01-17","time":"TBA","description":"Världscuptävling i Oberhof"},{"id":"b26776971f2a31d7","sport":"cross-country","title":"Världscupen i Oberhof","competition":"Sprint - Herrar","channel":"TBA","date":"2026-01-17","time":"TBA","description":"Världscuptävling i Oberhof"},{"id":"054eab3466f75eeb","sport":"cross-country","title":"Världscupen i Oberhof","competition":"10 km - Damer","channel":"TBA","date":"2026-01-18","time":"TBA","description":"Världscuptävling i Oberhof"},{"id":"9bb6993971068784","sport":"cross-country","title":"Världscupen i Oberhof","competition":"10 km - Herrar","channel":"TBA","date":"2026-01-18","time":"TBA","description":"Världscuptävling i Oberhof"},{"id":"5d9fc2dbf9d502fb","sport":"biathlon","title":"Världscupen i Nove Mesto na Morave","competition":"Världscup","channel":"TBA","date":"2026-01-19","time":"TBA","description":"Skidskytte-världscup i Nove Mesto na Morave"},{"id":"f867e4540dde5fe4","sport":"cross-country","title":"Världscupen i Goms","competition":"Teamsprint - Herrar","channel":"TBA","date":"2026-01-23","time":"TBA","description":"Världscuptävling i Goms"},{"id":"d2db10c7150bae3c","sport":"cross-country","title":"Världscupen i Goms","competition":"Teamsprint - Damer","channel":"TBA","date":"2026-01-23","time":"TBA","description":"Världscuptävling i Goms"},{"id":"9992d5c6ef1447c0","sport":"cross-country","title":"Världscupen i Goms","competition":"Sprint - Herrar","channel":"TBA","date":"2026-01-24","time":"TBA","description":"Världscuptävling i Goms"},{"id":"e08d949f30a15fa0","sport":"cross-country","title":"Världscupen i Goms","competition":"Sprint - Damer","channel":"TBA","date":"2026-01-24","time":"TBA","description":"Världscuptävling i Goms"},{"id":"fcdd52047f4c2632","sport":"cross-country","title":"Världscupen i Goms","competition":"30 km - Herrar","channel":"TBA","date":"2026-01-25","time":"TBA","description":"Världscuptävling i Goms"},{"id":"1414640ce958e1c6","sport":"cross-country","title":"Världscupen i Goms","competition":"30 km - Damer","channel":"TBA","date":"2026-01-25","time":"TBA","description":"Världscuptävling i Goms"},{"id":"f25ef138cb43a147","sport":"biathlon","title":"Världscupen i Antholz-Anterselva","competition":"Världscup","channel":"TBA","date":"2026-02-06","time":"TBA","description":"Skidskytte-världscup i Antholz-Anterselva"},{"id":"9dbe097f1b8fc45e","sport":"cross-country","title":"Världscupen i Falun","competition":"Sprint - Herrar","channel":"TBA","date":"2026-02-28","time":"TBA","description":"Världscuptävling i Falun"},{"id":"dd175220e053c099","sport":"cross-country","title":"Världscupen i Falun","competition":"Sprint - Damer","channel":"TBA","date":"2026-02-28","time":"TBA","description":"Världscuptävling i Falun"},{"id":"95a4715606a735e2","sport":"cross-country","title":"Världscupen i Falun","competition":"Skiatlon - Herrar","channel":"TBA","date":"2026-03-01","time":"TBA","description":"Världscuptävling i Falun"},{"id":"18226914d091d7d1","sport":"cross-country","title":"Världscupen i Falun","competition":"Skiatlon - Damer","channel":"TBA","date":"2026-03-01","time":"TBA","description":"Världscuptävling i Falun"},{"id":"6140b8d15311ca9e","sport":"biathlon","title":"Världscupen i Kontiolahti","competition":"Världscup","channel":"TBA","date":"2026-03-02","time":"TBA","description":"Skidskytte-världscup i Kontiolahti"},{"id":"09e021e59e243c5c","sport":"cross-country","title":"Världscupen i Lahti","competition":"Sprint - Damer","channel":"TBA","date":"2026-03-07","time":"TBA","description":"Världscuptävling i Lahti"},{"id":"c78512024b9b8581","sport":"cross-country","title":"Världscupen i Lahti","competition":"Sprint - Herrar","channel":"TBA","date":"2026-03-07","time":"TBA","description":"Världscuptävling i Lahti"},{"id":"65507ebbfdcc5469","sport":"cross-country","title":"Världscupen i Lahti","competition":"10 km - Damer","channel":"TBA","date":"2026-03-08","time":"TBA","description":"Världscuptävling i Lahti"},{"id":"9abdeee59559cea8","sport":"cross-country","title":"Världscupen i Lahti","competition":"10 km - Herrar","channel":"TBA","date":"2026-03-08","time":"TBA","description":"Världscuptävling i Lahti"},{"id":"a37ca1a32c059ada","sport":"biathlon","title":"Världscupen i Otepaa","competition":"Världscup","channel":"TBA","date":"2026-03-09","time":"TBA","description":"Skidskytte-världscup i Otepaa"},{"id":"f085a552af6bf2e3","sport":"cross-country","title":"Världscupen i Drammen","competition":"Sprint - Damer","channel":"TBA","date":"2026-03-12","time":"TBA","description":"Världscuptävling i Drammen"},{"id":"512efaad2d438edb","sport":"cross-country","title":"Världscupen i Drammen","competition":"Sprint - Herrar","channel":"TBA","date":"2026-03-12","time":"TBA","description":"Världscuptävling i Drammen"},{"id":"8d130ffb2f12cd3f","sport":"cross-country","title":"Världscupen i Oslo","competition":"50 km - Herrar","channel":"TBA","date":"2026-03-14","time":"TBA","description":"Världscuptävling i Oslo"},{"id":"e59b60ae9292755e","sport":"cross-country","title":"Världscupen i Oslo","competition":"50 km - Damer","channel":"TBA","date":"2026-03-14","time":"TBA","description":"Världscuptävling i Oslo"},{"id":"2f32df2d3af7a52a","sport":"biathlon","title":"Världscupen i Oslo Holmenkollen","competition":"Världscup","channel":"TBA","date":"2026-03-16","time":"TBA","description":"Skidskytte-världscup i Oslo Holmenkollen"},{"id":"a8262df13b88906e","sport":"cross-country","title":"Världscupen i Lake Placid","competition":"10 km - Damer","channel":"TBA","date":"2026-03-20","time":"TBA","description":"Världscuptävling i Lake Placid"},{"id":"7fac4ce72ca9a8d5","sport":"cross-country","title":"Världscupen i Lake Placid","competition":"10 km - Herrar","channel":"TBA","date":"2026-03-20","time":"TBA","description":"Världscuptävling i Lake Placid"},{"id":"50cd0c21cfeb3bd8","sport":"cross-country","title":"Världscupen i Lake Placid","competition":"Sprint - Damer","channel":"TBA","date":"2026-03-21","time":"TBA","description":"Världscuptävling i Lake Placid"},{"id":"550fc1dc831aae89","sport":"cross-country","title":"Världscupen i Lake Placid","competition":"Sprint - Herrar","channel":"TBA","date":"2026-03-21","time":"TBA","description":"Världscuptävling i Lake Placid"},{"id":"677d771a270f91a4","sport":"cross-country","title":"Världscupen i Lake Placid","competition":"30 km - Damer","channel":"TBA","date":"2026-03-22","time":"TBA","description":"Världscuptävling i Lake Placid"},{"id":"f8cae456e511c0f9","sport":"cross-country","title":"Världscupen i Lake Placid","competition":"30 km - Herrar","channel":"TBA","date":"2026-03-22","time":"TBA","description":"Världscuptävling i Lake Placid"}]};
@@ -2,89 +2,374 @@
 Events manager - handles storing and retrieving TV schedule events from MongoDB
 """
 
+import hashlib
 import json
-import re
 import logging
-from pathlib import Path
-from typing import List, Dict, Optional
-from datetime import datetime
-from mongodb_client import MongoDBClient
+from typing import List, Dict, Optional, Tuple
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
+from pymongo import ReplaceOne, UpdateOne
+from pymongo.errors import BulkWriteError
+from config import get_config
+from event_ids import make_event_id
+from event_store import EVENTS_STORE_PATH, StoreFormatError, load_events
+from mongodb_client import MongoDBClient, bootstrap_once
 
 logger = logging.getLogger(__name__)
 
+# Number of upserts sent to MongoDB per bulk_write round trip
+IMPORT_BATCH_SIZE = 500
+
+# Fields stored alongside events that are not part of the event content
+HASH_EXCLUDED_FIELDS = ('content_hash', 'start_at')
+
+# Projection used when returning events to callers
+EVENT_PROJECTION = {'_id': 0, 'content_hash': 0, 'start_at': 0}
+
+
+
+def compute_event_hash(event: Dict) -> str:
+    """Compute a stable content hash for an event"""
+    content = {key: value for key, value in event.items() if key not in HASH_EXCLUDED_FIELDS}
+    serialized = json.dumps(content, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(serialized.encode('utf-8')).hexdigest()
+
+
+def event_timezone() -> ZoneInfo:
+    """Time zone of the event date/time strings (EVENT_TIMEZONE in .env)"""
+    return ZoneInfo(get_config().event_timezone)
+
+
+def event_today() -> date:
+    """Today's date in the event time zone"""
+    return datetime.now(event_timezone()).date()
+
+
+def compute_start_at(event: Dict, tz: Optional[ZoneInfo] = None) -> Optional[datetime]:
+    """Start of an event as a timezone-aware datetime (None for TBA/unparsable times)"""
+    date_str = event.get('date') or ''
+    time_str = event.get('time') or ''
+    
+    if len(date_str) != 10 or len(time_str) != 5 or time_str[2] != ':':
+        return None
+    
+    try:
+        return datetime(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]),
+                        int(time_str[0:2]), int(time_str[3:5]), tzinfo=tz or event_timezone())
+    except ValueError:
+        return None
+
+
+def with_start_at(event: Dict) -> Dict:
+    """Copy of an event with its start_at field (stored as a BSON datetime)"""
+    return dict(event, start_at=compute_start_at(event))
+
 
 class EventsManager:
     """Manage winter sports events in MongoDB"""
     
-    def __init__(self):
-        self.db_client = MongoDBClient()
+    def __init__(self, db_client: Optional[MongoDBClient] = None):
+        # Share the caller's client if given; either way the underlying
+        # connection pool is process-wide
+        self._owns_client = db_client is None
+        self.db_client = db_client or MongoDBClient()
+        self.last_import_stats: Dict[str, int] = {}
         if self.db_client.is_connected():
             self.events_collection = self.db_client.db['events']
-            self._initialize_collection()
+            self.meta_collection = self.db_client.db['events_meta']
+            bootstrap_once(
+                (self.db_client.config.mongodb_uri, self.db_client.config.mongodb_database, 'events'),
+                self._initialize_collection
+            )
         else:
             self.events_collection = None
+            self.meta_collection = None
             logger.warning("MongoDB not connected - EventsManager functionality limited")
     
     def _initialize_collection(self):
-        """Initialize events collection with indexes"""
+        """Initialize events collection with indexes (errors propagate to bootstrap_once)"""
+        # Create indexes (create_index is a no-op for an index that already exists)
+        self.events_collection.create_index('id', unique=True)
+        self.events_collection.create_index('sport')
+        self.events_collection.create_index('date')
+        self.events_collection.create_index([('date', 1), ('time', 1)])
+        # Keyset pagination sorts on (date, time, id)
+        self.events_collection.create_index([('date', 1), ('time', 1), ('id', 1)])
+        # Time-window queries (reminders, upcoming events)
+        self.events_collection.create_index([('start_at', 1), ('sport', 1)])
+        
+        logger.info("Events collection initialized")
+        
+        # Documents stored before start_at existed
+        self._set_start_at()
+    
+    def get_version(self) -> Optional[int]:
+        """Get the events collection version (bumped on every change)"""
+        if self.meta_collection is None:
+            return None
+        
+        try:
+            meta = self.meta_collection.find_one({'_id': 'events'})
+            return meta.get('version', 0) if meta else 0
+        except Exception as e:
+            logger.error(f"Error getting events version: {e}")
+            return None
+    
+    def _bump_version(self):
+        """Record that the events collection changed"""
+        try:
+            self.meta_collection.update_one(
+                {'_id': 'events'},
+                {'$inc': {'version': 1}, '$set': {'updated_at': datetime.now()}},
+                upsert=True
+            )
+        except Exception as e:
+            logger.error(f"Error updating events version: {e}")
+    
+    def _load_events_from_store(self) -> Optional[List[Dict]]:
+        """Read the events from the events store (events.jsonl)"""
+        try:
+            events = load_events()
+        except StoreFormatError as e:
+            logger.error(f"Invalid events store: {e}")
+            return None
+        
+        if events is None:
+            logger.error(f"{EVENTS_STORE_PATH.name} not found")
+        return events
+    
+    def bulk_upsert_events(self, events: List[Dict], batch_size: int = IMPORT_BATCH_SIZE,
+                           replace: bool = False) -> Dict[str, int]:
+        """Upsert events in unordered bulk_write batches.
+        
+        With ``replace`` the stored documents are replaced instead of merged,
+        so fields dropped from an event are removed as well.
+        
+        Returns counts of inserted, modified, unchanged and failed events
+        plus the number of batches (round trips) used.
+        """
+        stats = {'inserted': 0, 'modified': 0, 'unchanged': 0, 'failed': 0, 'batches': 0}
+        
+        if self.events_collection is None:
+            return stats
+        
+        batch_size = max(1, batch_size)
+        
+        operations = []
+        for event in events:
+            if 'id' not in event:
+                logger.error(f"Skipping event without id: {event.get('title')}")
+                stats['failed'] += 1
+                continue
+            event = with_start_at(event)
+            if replace:
+                operations.append(ReplaceOne({'id': event['id']}, event, upsert=True))
+            else:
+                operations.append(UpdateOne({'id': event['id']}, {'$set': event}, upsert=True))
+        
+        for start in range(0, len(operations), batch_size):
+            batch = operations[start:start + batch_size]
+            stats['batches'] += 1
+            
+            try:
+                result = self.events_collection.bulk_write(batch, ordered=False)
+                upserted = result.upserted_count
+                matched = result.matched_count
+                modified = result.modified_count
+                failed = 0
+            except BulkWriteError as e:
+                # Unordered batches keep going past individual failures
+                details = e.details
+                upserted = details.get('nUpserted', 0)
+                matched = details.get('nMatched', 0)
+                modified = details.get('nModified', 0)
+                failed = len(details.get('writeErrors', []))
+                for error in details.get('writeErrors', [])[:5]:
+                    logger.error(f"Error importing event: {error.get('errmsg')}")
+            except Exception as e:
+                logger.error(f"Error importing batch of {len(batch)} events: {e}")
+                upserted = matched = modified = 0
+                failed = len(batch)
+            
+            stats['inserted'] += upserted
+            stats['modified'] += modified
+            stats['unchanged'] += matched - modified
+            stats['failed'] += failed
+        
+        return stats
+    
+    def import_events_from_store(self, batch_size: int = IMPORT_BATCH_SIZE) -> int:
+        """Import events from the events store into MongoDB
+        
+        Events are upserted in batches of ``batch_size``; the per-run counts
+        are kept in ``last_import_stats``.
+        """
+        if self.events_collection is None:
+            logger.warning("MongoDB not connected - cannot import events")
+            return 0
+        
         try:
-            # Create indexes
-            self.events_collection.create_index('id', unique=True)
-            self.events_collection.create_index('sport')
-            self.events_collection.create_index('date')
-            self.events_collection.create_index([('date', 1), ('time', 1)])
+            events = self._load_events_from_store()
+            if events is None:
+                return 0
+            
+            events = [dict(event, content_hash=compute_event_hash(event)) for event in events]
+            stats = self.bulk_upsert_events(events, batch_size=batch_size)
+            self.last_import_stats = stats
             
-            logger.info("Events collection initialized")
+            imported = stats['inserted'] + stats['modified'] + stats['unchanged']
+            if stats['inserted'] or stats['modified']:
+                self._bump_version()
+            logger.info(
+                f"Imported {imported} events from the events store in {stats['batches']} batches "
+                f"({stats['inserted']} inserted, {stats['modified']} modified, "
+                f"{stats['unchanged']} unchanged, {stats['failed']} failed)"
+            )
+            return imported
+        
         except Exception as e:
-            logger.debug(f"Index creation note: {e}")
+            logger.error(f"Error importing events from the events store: {e}")
+            return 0
     
-    def import_events_from_js(self) -> int:
-        """Import events from script.js file into MongoDB"""
-        script_path = Path(__file__).parent / 'script.js'
+    def migrate_start_at(self, recompute: bool = False, batch_size: int = IMPORT_BATCH_SIZE) -> int:
+        """Set start_at on stored events that lack it.
         
-        if not script_path.exists():
-            logger.error("script.js not found")
+        With ``recompute`` every event is updated (e.g. after changing
+        EVENT_TIMEZONE). Returns the number of events updated.
+        """
+        if self.events_collection is None:
             return 0
         
         try:
-            with open(script_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            return self._set_start_at(recompute, batch_size)
+        except Exception as e:
+            logger.error(f"Error migrating start_at: {e}")
+            return 0
+    
+    def _set_start_at(self, recompute: bool = False, batch_size: int = IMPORT_BATCH_SIZE) -> int:
+        """migrate_start_at without the error handling (raises on failure)"""
+        query = {} if recompute else {'start_at': {'$exists': False}}
+        
+        tz = event_timezone()
+        operations = [
+            UpdateOne({'_id': doc['_id']}, {'$set': {'start_at': compute_start_at(doc, tz)}})
+            for doc in self.events_collection.find(query, {'_id': 1, 'date': 1, 'time': 1})
+        ]
+        
+        batch_size = max(1, batch_size)
+        updated = 0
+        for start in range(0, len(operations), batch_size):
+            result = self.events_collection.bulk_write(operations[start:start + batch_size], ordered=False)
+            updated += result.modified_count
+        
+        if updated:
+            logger.info(f"Set start_at on {updated} events")
+        return updated
+    
+    def diff_events(self, events: List[Dict]) -> Dict[str, List]:
+        """Compare events against the stored content hashes.
+        
+        Returns the new, changed and unchanged events plus the ids of stored
+        events that are no longer present. Only events written from the
+        events store (those with a content hash) count as deleted; events
+        added with add_event are left alone.
+        """
+        diff = {'new': [], 'changed': [], 'unchanged': [], 'deleted': []}
+        
+        if self.events_collection is None:
+            return diff
+        
+        # One query for the id -> hash map of everything already stored
+        stored_hashes = {
+            doc['id']: doc.get('content_hash')
+            for doc in self.events_collection.find({}, {'_id': 0, 'id': 1, 'content_hash': 1})
+            if 'id' in doc
+        }
+        
+        seen_ids = set()
+        for event in events:
+            if 'id' not in event or event['id'] in seen_ids:
+                continue
+            seen_ids.add(event['id'])
+            
+            stored_hash = stored_hashes.get(event['id'])
+            if event['id'] not in stored_hashes:
+                diff['new'].append(event)
+            elif stored_hash != compute_event_hash(event):
+                diff['changed'].append(event)
+            else:
+                diff['unchanged'].append(event)
+        
+        diff['deleted'] = [
+            event_id for event_id, stored_hash in stored_hashes.items()
+            if stored_hash is not None and event_id not in seen_ids
+        ]
+        return diff
+    
+    def sync_events(self, events: Optional[List[Dict]] = None, dry_run: bool = False,
+                    exclude_past: bool = False, batch_size: int = IMPORT_BATCH_SIZE) -> Optional[Dict]:
+        """Incrementally sync events (default: from the events store) into MongoDB.
+        
+        Only new and changed events are written and events that disappeared
+        from the store are deleted, so a rerun with unchanged data issues no
+        writes at all. Events added with add_event are never deleted by a
+        sync (see diff_events). Returns a report with the diff and write
+        counts, or None on failure.
+        """
+        if self.events_collection is None:
+            logger.warning("MongoDB not connected - cannot sync events")
+            return None
+        
+        try:
+            if events is None:
+                events = self._load_events_from_store()
+                if events is None:
+                    return None
             
-            # Find the events array in the JavaScript file
-            match = re.search(r'const events = (\[[\s\S]*?\n\];)', content)
+            if exclude_past:
+                cutoff_date = self._past_events_cutoff()
+                events = [e for e in events if e.get('date', '') >= cutoff_date]
             
-            if not match:
-                logger.error("Could not find events array in script.js")
-                return 0
+            diff = self.diff_events(events)
+            report = {
+                'new': diff['new'],
+                'changed': diff['changed'],
+                'deleted': diff['deleted'],
+                'unchanged_count': len(diff['unchanged']),
+                'dry_run': dry_run,
+                'written': 0,
+                'removed': 0,
+                'failed': 0,
+            }
             
-            # Extract the JSON array
-            json_str = match.group(1)
-            # Remove trailing semicolon
-            json_str = json_str.rstrip(';')
-            
-            # Parse JSON
-            events = json.loads(json_str)
-            
-            # Import into MongoDB
-            imported = 0
-            for event in events:
-                try:
-                    # Upsert event (update if exists, insert if not)
-                    self.events_collection.update_one(
-                        {'id': event['id']},
-                        {'$set': event},
-                        upsert=True
-                    )
-                    imported += 1
-                except Exception as e:
-                    logger.error(f"Error importing event {event.get('id')}: {e}")
-            
-            logger.info(f"Imported {imported} events from script.js")
-            return imported
+            if dry_run:
+                return report
             
+            to_write = [
+                dict(event, content_hash=compute_event_hash(event))
+                for event in diff['new'] + diff['changed']
+            ]
+            if to_write:
+                stats = self.bulk_upsert_events(to_write, batch_size=batch_size, replace=True)
+                report['written'] = stats['inserted'] + stats['modified']
+                report['failed'] = stats['failed']
+            
+            if diff['deleted']:
+                result = self.events_collection.delete_many({'id': {'$in': diff['deleted']}})
+                report['removed'] = result.deleted_count
+            
+            if report['written'] or report['removed']:
+                self._bump_version()
+            
+            logger.info(
+                f"Synced events: {len(diff['new'])} new, {len(diff['changed'])} changed, "
+                f"{len(diff['deleted'])} deleted, {len(diff['unchanged'])} unchanged"
+            )
+            return report
+        
         except Exception as e:
-            logger.error(f"Error importing events from script.js: {e}")
-            return 0
+            logger.error(f"Error syncing events: {e}")
+            return None
     
     def get_all_events(self) -> List[Dict]:
         """Get all events from MongoDB"""
@@ -94,7 +379,7 @@ class EventsManager:
         try:
             events = list(self.events_collection.find(
                 {},
-                {'_id': 0}  # Exclude MongoDB _id field
+                EVENT_PROJECTION  # Exclude MongoDB _id and sync bookkeeping
             ).sort([('date', 1), ('time', 1)]))
             
             return events
@@ -102,6 +387,63 @@ class EventsManager:
             logger.error(f"Error getting events: {e}")
             return []
     
+    def query_events(self, sports: Optional[List[str]] = None, date_from: Optional[str] = None,
+                     date_to: Optional[str] = None, channel: Optional[str] = None,
+                     limit: Optional[int] = None,
+                     after: Optional[Tuple] = None) -> Tuple[List[Dict], Optional[Tuple]]:
+        """Get a filtered page of events in (date, time, id) order.
+        
+        ``after`` is the (date, time, id) key of the last event on the
+        previous page. Returns the events and the key to continue from, or
+        None when there are no more results.
+        """
+        if self.events_collection is None:
+            return [], None
+        
+        conditions = []
+        if sports:
+            conditions.append({'sport': {'$in': list(sports)}})
+        if date_from or date_to:
+            date_range = {}
+            if date_from:
+                date_range['$gte'] = date_from
+            if date_to:
+                date_range['$lte'] = date_to
+            conditions.append({'date': date_range})
+        if channel:
+            conditions.append({'channel': channel})
+        if after:
+            # Keyset pagination: continue strictly after the last seen key
+            last_date, last_time, last_id = after
+            conditions.append({'$or': [
+                {'date': {'$gt': last_date}},
+                {'date': last_date, 'time': {'$gt': last_time}},
+                {'date': last_date, 'time': last_time, 'id': {'$gt': last_id}},
+            ]})
+        
+        query = {'$and': conditions} if len(conditions) > 1 else (conditions[0] if conditions else {})
+        
+        try:
+            cursor = self.events_collection.find(query, EVENT_PROJECTION).sort(
+                [('date', 1), ('time', 1), ('id', 1)]
+            )
+            if limit:
+                # Fetch one extra event to know whether another page exists
+                cursor = cursor.limit(limit + 1)
+            
+            events = list(cursor)
+            
+            next_key = None
+            if limit and len(events) > limit:
+                events = events[:limit]
+                last = events[-1]
+                next_key = (last.get('date'), last.get('time'), last.get('id'))
+            
+            return events, next_key
+        except Exception as e:
+            logger.error(f"Error querying events: {e}")
+            return [], None
+    
     def get_events_by_sport(self, sport: str) -> List[Dict]:
         """Get events filtered by sport"""
         if self.events_collection is None:
@@ -110,7 +452,7 @@ class EventsManager:
         try:
             events = list(self.events_collection.find(
                 {'sport': sport},
-                {'_id': 0}
+                EVENT_PROJECTION
             ).sort([('date', 1), ('time', 1)]))
             
             return events
@@ -118,28 +460,52 @@ class EventsManager:
             logger.error(f"Error getting events by sport: {e}")
             return []
     
+    def get_events_in_window(self, start: datetime, end: Optional[datetime] = None,
+                             sports: Optional[List[str]] = None) -> List[Dict]:
+        """Get events starting in [start, end) in start order (uses the start_at index).
+        
+        Events without a known start time (TBA) are not included.
+        """
+        if self.events_collection is None:
+            return []
+        
+        start_range = {'$gte': start}
+        if end is not None:
+            start_range['$lt'] = end
+        query = {'start_at': start_range}
+        if sports:
+            query['sport'] = {'$in': list(sports)}
+        
+        try:
+            return list(self.events_collection.find(query, EVENT_PROJECTION).sort([('start_at', 1), ('id', 1)]))
+        except Exception as e:
+            logger.error(f"Error getting events in window: {e}")
+            return []
+    
     def get_upcoming_events(self, days: int = 7) -> List[Dict]:
-        """Get events happening in the next N days"""
+        """Get events happening in the next N days (today included, TBA times too)"""
         if self.events_collection is None:
             return []
         
         try:
-            from datetime import timedelta
-            today = datetime.now().date()
+            tz = event_timezone()
+            today = datetime.now(tz).date()
             end_date = today + timedelta(days=days)
             
             # Convert to string format (YYYY-MM-DD)
             today_str = today.strftime('%Y-%m-%d')
             end_date_str = end_date.strftime('%Y-%m-%d')
             
+            # Timed events by start_at, TBA events (start_at null) by date
+            window_start = datetime(today.year, today.month, today.day, tzinfo=tz)
+            window_end = datetime(end_date.year, end_date.month, end_date.day, tzinfo=tz) + timedelta(days=1)
+            
             events = list(self.events_collection.find(
-                {
-                    'date': {
-                        '$gte': today_str,
-                        '$lte': end_date_str
-                    }
-                },
-                {'_id': 0}
+                {'$or': [
+                    {'start_at': {'$gte': window_start, '$lt': window_end}},
+                    {'start_at': None, 'date': {'$gte': today_str, '$lte': end_date_str}},
+                ]},
+                EVENT_PROJECTION
             ).sort([('date', 1), ('time', 1)]))
             
             return events
@@ -153,28 +519,25 @@ class EventsManager:
             return False
         
         try:
-            # Ensure event has an ID
+            # Ensure event has an ID (derived from its content, so adding
+            # the same event twice updates it instead of duplicating it)
             if 'id' not in event:
-                # Generate ID from existing events
-                max_id = self.events_collection.find_one(
-                    {},
-                    sort=[('id', -1)]
-                )
-                event['id'] = (max_id['id'] + 1) if max_id else 1
+                event['id'] = make_event_id(event)
             
             self.events_collection.update_one(
                 {'id': event['id']},
-                {'$set': event},
+                {'$set': with_start_at(event)},
                 upsert=True
             )
             
+            self._bump_version()
             logger.info(f"Added/updated event: {event.get('title')}")
             return True
         except Exception as e:
             logger.error(f"Error adding event: {e}")
             return False
     
-    def delete_event(self, event_id: int) -> bool:
+    def delete_event(self, event_id: str) -> bool:
         """Delete an event by ID"""
         if self.events_collection is None:
             return False
@@ -183,6 +546,7 @@ class EventsManager:
             result = self.events_collection.delete_one({'id': event_id})
             
             if result.deleted_count > 0:
+                self._bump_version()
                 logger.info(f"Deleted event {event_id}")
                 return True
             else:
@@ -215,6 +579,68 @@ class EventsManager:
             logger.error(f"Error getting sports list: {e}")
             return []
     
+    def get_stats(self, days: int = 7) -> Optional[Dict]:
+        """Summary statistics computed in one aggregation round trip.
+        
+        Returns the total count, counts by sport, by channel and by day
+        (today onwards), the number of events in the next ``days`` days and
+        the number of events without a known start time, or None on failure.
+        """
+        if self.events_collection is None:
+            return None
+        
+        try:
+            today = event_today()
+            today_str = today.strftime('%Y-%m-%d')
+            end_date_str = (today + timedelta(days=days)).strftime('%Y-%m-%d')
+            
+            def count_by(field: str) -> List[Dict]:
+                return [
+                    {'$group': {'_id': f'${field}', 'count': {'$sum': 1}}},
+                    {'$sort': {'count': -1, '_id': 1}},
+                ]
+            
+            pipeline = [{'$facet': {
+                'total': [{'$count': 'count'}],
+                'by_sport': count_by('sport'),
+                'by_channel': count_by('channel'),
+                'by_day': [
+                    {'$match': {'date': {'$gte': today_str}}},
+                    {'$group': {'_id': '$date', 'count': {'$sum': 1}}},
+                    {'$sort': {'_id': 1}},
+                ],
+                'upcoming': [
+                    {'$match': {'date': {'$gte': today_str, '$lte': end_date_str}}},
+                    {'$count': 'count'},
+                ],
+                'tba_time': [
+                    {'$match': {'time': {'$in': ['TBA', '', None]}}},
+                    {'$count': 'count'},
+                ],
+            }}]
+            
+            facets = next(self.events_collection.aggregate(pipeline), {})
+            
+            def single_count(name: str) -> int:
+                rows = facets.get(name) or []
+                return rows[0]['count'] if rows else 0
+            
+            def counts(name: str) -> Dict[str, int]:
+                return {str(row['_id']): row['count'] for row in facets.get(name) or []}
+            
+            return {
+                'total': single_count('total'),
+                'by_sport': counts('by_sport'),
+                'by_channel': counts('by_channel'),
+                'by_day': counts('by_day'),
+                'upcoming': single_count('upcoming'),
+                'upcoming_days': days,
+                'tba_time': single_count('tba_time'),
+            }
+        except Exception as e:
+            logger.error(f"Error getting event statistics: {e}")
+            return None
+    
     def clear_all_events(self) -> bool:
         """Clear all events (use with caution!)"""
         if self.events_collection is None:
@@ -222,23 +648,26 @@ class EventsManager:
         
         try:
             result = self.events_collection.delete_many({})
+            self._bump_version()
             logger.info(f"Cleared {result.deleted_count} events")
             return True
         except Exception as e:
             logger.error(f"Error clearing events: {e}")
             return False
     
+    def _past_events_cutoff(self) -> str:
+        """Date (YYYY-MM-DD) before which events count as passed"""
+        # Use yesterday's date (to be safe, keep events from yesterday)
+        yesterday = event_today() - timedelta(days=1)
+        return yesterday.strftime('%Y-%m-%d')
+    
     def cleanup_past_events(self) -> int:
         """Delete events that have already passed"""
         if self.events_collection is None:
             return 0
         
         try:
-            from datetime import datetime, timedelta
-            
-            # Get yesterday's date (to be safe, delete events from yesterday and before)
-            yesterday = (datetime.now() - timedelta(days=1)).date()
-            cutoff_date = yesterday.strftime('%Y-%m-%d')
+            cutoff_date = self._past_events_cutoff()
             
             # Delete events before the cutoff date
             result = self.events_collection.delete_many({
@@ -246,15 +675,16 @@ class EventsManager:
             })
             
             if result.deleted_count > 0:
+                self._bump_version()
                 logger.info(f"Cleaned up {result.deleted_count} past events")
             
             return result.deleted_count
-            
+        
         except Exception as e:
             logger.error(f"Error cleaning up past events: {e}")
             return 0
     
     def close(self):
-        """Close MongoDB connection"""
-        if self.db_client:
+        """Release the MongoDB connection if this manager created it"""
+        if self.db_client and self._owns_client:
             self.db_client.close()
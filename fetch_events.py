@@ -7,14 +7,14 @@ a template for manually adding events you find on those sites.
 Future enhancement: Use Selenium or Playwright to automate scraping.
 """
 
-import json
 from datetime import datetime
+from event_ids import assign_event_ids
+from event_store import write_events
 
 # Template for adding events
 EVENTS = [
     # Example entries - replace with real data from FIS-ski.com and tv.nu
     {
-        "id": 1,
         "sport": "cross-country",  # or "biathlon"
         "title": "Världscupen i Ruka",
         "competition": "10 km Klassisk - Herrar",
@@ -30,7 +30,6 @@ EVENTS = [
 def add_event(sport, title, competition, channel, date, time, description=""):
     """Add a new event to the list."""
     event = {
-        "id": len(EVENTS) + 1,
         "sport": sport,
         "title": title,
         "competition": competition,
@@ -42,24 +41,12 @@ def add_event(sport, title, competition, channel, date, time, description=""):
     EVENTS.append(event)
     return event
 
-def export_to_js():
-    """Export events to JavaScript format."""
-    with open("script.js", "r", encoding="utf-8") as f:
-        content = f.read()
-    
-    # Find and replace the events array
-    js_events = "const events = " + json.dumps(EVENTS, indent=4, ensure_ascii=False) + ";"
-    
-    # Replace the existing events array
-    start = content.find("const events = [")
-    end = content.find("];", start) + 2
-    
-    new_content = content[:start] + js_events + content[end:]
-    
-    with open("script.js", "w", encoding="utf-8") as f:
-        f.write(new_content)
-    
-    print(f"✅ Exported {len(EVENTS)} events to script.js")
+def export_to_store():
+    """Export events to the events store (events.jsonl)."""
+    # Content-derived IDs, like the scrapers publish
+    assign_event_ids(EVENTS)
+    write_events(EVENTS, source='manual')
+    print(f"✅ Exported {len(EVENTS)} events to events.jsonl")
 
 def print_event_template():
     """Print a template for adding new events."""
@@ -91,4 +78,4 @@ if __name__ == "__main__":
     print(f"\nCurrently {len(EVENTS)} events in database")
     
     # Uncomment to export
-    # export_to_js()
+    # export_to_store()
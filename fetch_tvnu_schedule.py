@@ -6,9 +6,13 @@ import json
 import os
 import re
 from datetime import datetime, timedelta
-from urllib.request import urlopen, Request
 from urllib.parse import quote
 from html.parser import HTMLParser
+from event_ids import assign_event_ids
+from event_merge import merge_events, merge_summary
+from event_store import EVENTS_STORE_PATH, write_events
+from http_client import fetch_parsed
+from sport_keywords import classify_sport
 
 # Channels to search
 CHANNELS = ['svt1', 'svt2', 'tv4', 'nrk1']
@@ -16,6 +20,9 @@ CHANNELS = ['svt1', 'svt2', 'tv4', 'nrk1']
 # Search terms for winter sports
 SEARCH_TERMS = ['längdskidor', 'skidskytte', 'langrenn']
 
+# Sports shown by the generated schedule
+TRACKED_SPORTS = ('cross-country', 'biathlon')
+
 class TVNuParser(HTMLParser):
     """Parse tv.nu HTML to extract program information."""
     
@@ -96,13 +103,8 @@ def fetch_tvnu_search(search_term, channel=None):
     url = f"{base_url}?{params}"
     
     try:
-        request = Request(url)
-        request.add_header('User-Agent', 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
-        request.add_header('Accept', 'application/json')
-        
-        with urlopen(request, timeout=10) as response:
-            data = json.loads(response.read().decode('utf-8'))
-            return data
+        # Unchanged results come back as 304 and are served from the cache
+        return fetch_parsed(url, json.loads, headers={'Accept': 'application/json'}, timeout=10)
     except Exception as e:
         print(f"Error fetching tv.nu search for '{search_term}': {e}")
         return None
@@ -197,11 +199,12 @@ def scrape_channel_schedule(channel_name, days_ahead=14):
         
         programs = parse_tvnu_json(api_response, channel_name)
         
-        # Determine sport type
-        sport_type = 'biathlon' if 'skytte' in search_term else 'cross-country'
+        # Sport implied by the search term, unless the title says otherwise
+        search_sport = 'biathlon' if 'skytte' in search_term else 'cross-country'
         
         for prog in programs:
-            prog['sport'] = sport_type
+            sport_type = classify_sport(prog['title'], default=None)
+            prog['sport'] = sport_type if sport_type in TRACKED_SPORTS else search_sport
             prog['search_term'] = search_term
         
         all_programs.extend(programs)
@@ -293,129 +296,39 @@ def merge_with_existing_events(tvnu_events, events_file='events.json'):
         except:
             pass
     
-    # Create merged list
-    merged = []
-    tvnu_dates = {(e['date'], e['sport']) for e in tvnu_events if e.get('date')}
-    
-    # Add tv.nu events (they have verified channel/time)
-    merged.extend(tvnu_events)
-    
-    # Add existing events that don't have tv.nu data
-    for event in existing_events:
-        event_key = (event.get('date', ''), event.get('sport', ''))
-        if event_key not in tvnu_dates and event.get('date'):
-            # Keep unverified events
-            event['verified'] = False
-            merged.append(event)
+    # tv.nu events have verified channel/time; existing events without a
+    # matching broadcast are kept as unverified
+    merged, stats = merge_events(tvnu_events, existing_events, mark_unverified=True)
+    print(f"  {merge_summary(stats)}")
     
     # Sort by date
     merged.sort(key=lambda x: x.get('date', ''))
     
     return merged
 
-def update_script_js(events, output_file='script.js'):
+def update_events_store(events, output_file=None):
     """
-    Update script.js with new event data.
+    Publish event data to the events store (events.jsonl).
     
     Args:
         events: List of event dictionaries
-        output_file: Path to script.js file
+        output_file: Path to the store file (default: events.jsonl)
     """
     # Filter future events
     today = datetime.now().date()
     future_events = [e for e in events if e.get('date') and datetime.strptime(e['date'], '%Y-%m-%d').date() >= today]
     
-    # Add IDs
-    for i, event in enumerate(future_events, 1):
-        event['id'] = i
+    for event in future_events:
         # Remove internal fields
         event.pop('verified', None)
         event.pop('source', None)
         event.pop('search_term', None)
     
-    # Format as JavaScript
-    js_content = "// Event data - updated from tv.nu\n"
-    js_content += "const events = "
-    js_content += json.dumps(future_events, indent=4, ensure_ascii=False)
-    js_content += ";\n\n"
-    
-    # Read existing script.js to preserve rendering code
-    existing_code = ""
-    if os.path.exists(output_file):
-        with open(output_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            # Find where events array ends and keep everything after
-            const_match = re.search(r'const events = \[.*?\];', content, re.DOTALL)
-            if const_match:
-                existing_code = content[const_match.end():]
-            elif 'function renderSchedule' in content:
-                existing_code = '\n' + content[content.index('function renderSchedule'):]
-    
-    if not existing_code or 'function renderSchedule' not in existing_code:
-        # Add default rendering code
-        existing_code = """
-function renderSchedule() {
-    const container = document.getElementById('schedule-container');
-    const filterCC = document.getElementById('filterCrossCountry');
-    const filterBiathlon = document.getElementById('filterBiathlon');
-    
-    container.innerHTML = '';
-    
-    const today = new Date();
-    today.setHours(0, 0, 0, 0);
-    
-    const filteredEvents = events.filter(event => {
-        const eventDate = new Date(event.date);
-        eventDate.setHours(0, 0, 0, 0);
-        
-        if (eventDate < today) return false;
-        
-        if (event.sport === 'cross-country' && !filterCC.checked) return false;
-        if (event.sport === 'biathlon' && !filterBiathlon.checked) return false;
-        
-        return true;
-    });
-    
-    if (filteredEvents.length === 0) {
-        container.innerHTML = '<p class="no-events">Inga kommande tävlingar</p>';
-        return;
-    }
-    
-    filteredEvents.forEach(event => {
-        const card = document.createElement('div');
-        card.className = 'event-card';
-        
-        const sportEmoji = event.sport === 'biathlon' ? '🎯' : '⛷️';
-        
-        card.innerHTML = `
-            <div class="event-header">
-                <span class="event-sport">${sportEmoji} ${event.sport === 'biathlon' ? 'Skidskytte' : 'Längdskidor'}</span>
-                <span class="event-channel">${event.channel}</span>
-            </div>
-            <h3 class="event-title">${event.title}</h3>
-            <p class="event-competition">${event.competition}</p>
-            <div class="event-meta">
-                <span class="event-date">${new Date(event.date).toLocaleDateString('sv-SE', { weekday: 'long', year: 'numeric', month: 'long', day: 'numeric' })}</span>
-                <span class="event-time">${event.time}</span>
-            </div>
-        `;
-        
-        container.appendChild(card);
-    });
-}
-
-document.getElementById('filterCrossCountry').addEventListener('change', renderSchedule);
-document.getElementById('filterBiathlon').addEventListener('change', renderSchedule);
-
-renderSchedule();
-"""
-    
-    # Write updated script.js
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(js_content)
-        f.write(existing_code)
+    # Add content-derived IDs (stable across re-scrapes)
+    assign_event_ids(future_events)
     
-    print(f"✅ Updated {output_file} with {len(future_events)} events")
+    write_events(future_events, output_file, source='tv.nu')
+    print(f"✅ Updated {output_file or EVENTS_STORE_PATH.name} with {len(future_events)} events")
 
 def main():
     """Main execution function."""
@@ -456,9 +369,9 @@ def main():
     print("\n🔗 Merging with existing events...")
     merged_events = merge_with_existing_events(valid_events)
     
-    # Update script.js
-    print("\n💾 Updating script.js...")
-    update_script_js(merged_events)
+    # Publish to the events store
+    print("\n💾 Updating events store...")
+    update_events_store(merged_events)
     
     # Save JSON for review
     json_file = 'tvnu_events.json'
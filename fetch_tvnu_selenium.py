@@ -1,17 +1,37 @@
 """
 Scrape tv.nu sport pages using Selenium to handle JavaScript rendering.
+
+By default pages are first fetched without a browser and the server-sent
+__INITIAL_STATE__ data is parsed directly; Selenium is only started for
+pages where that data is missing.
 """
 
 import json
 import os
+import queue
 import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from event_ids import assign_event_ids
+from event_merge import merge_events, merge_summary
+from event_store import EVENTS_STORE_PATH, write_events
+from http_client import fetch_concurrently, fetch_text
+from sport_keywords import classify_sport
+from tvnu_state import SPORT_PAGE_URL, extract_state_key
+
+try:
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.chrome.options import Options
+    from selenium.common.exceptions import TimeoutException, NoSuchElementException
+except ImportError:
+    # Browserless mode works without Selenium installed
+    webdriver = None
 
 # Sport category pages on tv.nu
 SPORT_CATEGORIES = {
@@ -25,8 +45,64 @@ SPORT_CATEGORIES = {
     'curling': 'curling'
 }
 
-def create_driver():
-    """Create a Selenium WebDriver with headless Chrome."""
+# Number of browsers scraping in parallel
+DEFAULT_POOL_SIZE = 4
+
+# Minutes between scrapes in daemon mode
+DEFAULT_DAEMON_INTERVAL = 60
+
+# Resources that are never needed to read the schedule
+BLOCKED_RESOURCE_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    '*.css',
+]
+
+# HTML text fallback: one pattern matching either a date header
+# ("FREDAG 21 NOVEMBER") or a time ("11:00"), so the page is scanned once.
+# The lookahead lets most positions be rejected on their first character.
+HTML_TEXT_TOKEN_PATTERN = re.compile(
+    r'(?=[FLSMTOflsmto\d])'
+    r'(?i:(?:FREDAG|LÖRDAG|SÖNDAG|MÅNDAG|TISDAG|ONSDAG|TORSDAG)\s+(?P<day>\d{1,2})\s+'
+    r'(?P<month>NOVEMBER|DECEMBER|JANUARI|FEBRUARI))'
+    r'|(?P<hour>\d{1,2}):(?P<minute>\d{2})'
+)
+
+SWEDISH_MONTHS = {
+    'januari': 1, 'februari': 2, 'mars': 3, 'april': 4,
+    'maj': 5, 'juni': 6, 'juli': 7, 'augusti': 8,
+    'september': 9, 'oktober': 10, 'november': 11, 'december': 12,
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'nov': 11, 'dec': 12
+}
+
+# Channels looked for near a time, in priority order
+HTML_TEXT_CHANNELS = ['SVT1', 'SVT2', 'SVT Play', 'TV4', 'Viaplay', 'TV6', 'TV10', 'SVT']
+
+COMPETITION_PATTERNS = [
+    re.compile(r'(Sprint|10 km klassiskt|10 km fri stil|Stafett|Jaktstart)', re.IGNORECASE),
+    re.compile(r'(\d+ km [^,<]+)', re.IGNORECASE),
+]
+
+TITLE_PATTERNS = [
+    re.compile(r'<h\d[^>]*>([^<]+)</h\d>'),  # Heading tags
+    re.compile(r'title["\']>([^<]+)<'),       # title attribute
+    re.compile(r'>([A-ZÅÄÖ][^<]{10,100})<'), # Capitalized text
+]
+
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+def create_driver(block_resources=True):
+    """
+    Create a Selenium WebDriver with headless Chrome.
+    
+    Args:
+        block_resources: Skip loading images, fonts and stylesheets
+    """
+    if webdriver is None:
+        print("❌ Selenium is not installed")
+        print("   pip install selenium")
+        return None
+    
     chrome_options = Options()
     chrome_options.add_argument('--headless')  # Run in background
     chrome_options.add_argument('--no-sandbox')
@@ -35,8 +111,23 @@ def create_driver():
     chrome_options.add_argument('--window-size=1920,1080')
     chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
     
+    if block_resources:
+        chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+        chrome_options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+        })
+    
     try:
         driver = webdriver.Chrome(options=chrome_options)
+        
+        if block_resources:
+            # Fonts and stylesheets can only be blocked at the network level
+            try:
+                driver.execute_cdp_cmd('Network.enable', {})
+                driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_RESOURCE_PATTERNS})
+            except Exception as e:
+                print(f"  ⚠️  Could not block resources: {e}")
+        
         return driver
     except Exception as e:
         print(f"❌ Error creating Chrome driver: {e}")
@@ -45,6 +136,90 @@ def create_driver():
         print("   Download chromedriver: https://chromedriver.chromium.org/")
         return None
 
+class DriverPool:
+    """
+    Pool of headless Chrome instances that scrape sport pages in parallel.
+    
+    Browsers are started lazily and stay open until close(), so daemon mode
+    reuses warm browsers between runs.
+    """
+    
+    def __init__(self, size=DEFAULT_POOL_SIZE, block_resources=True):
+        self.size = max(1, size)
+        self.block_resources = block_resources
+        self._idle = queue.Queue()
+        self._drivers = []
+        self._lock = threading.Lock()
+    
+    def _acquire(self):
+        """Get an idle driver, starting a new one while below pool size"""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        
+        with self._lock:
+            can_start = len(self._drivers) < self.size
+            if can_start:
+                # Reserve the slot before the (slow) browser start
+                self._drivers.append(None)
+        
+        if not can_start:
+            return self._idle.get()
+        
+        driver = create_driver(self.block_resources)
+        with self._lock:
+            self._drivers.remove(None)
+            if driver:
+                self._drivers.append(driver)
+        return driver
+    
+    def _release(self, driver):
+        if driver:
+            self._idle.put(driver)
+    
+    def scrape(self, sport_slug, sport_type):
+        """Scrape one sport page on a pooled browser"""
+        driver = self._acquire()
+        if not driver:
+            return []
+        
+        try:
+            return scrape_sport_page(driver, sport_slug, sport_type)
+        finally:
+            self._release(driver)
+    
+    def scrape_all(self, categories):
+        """
+        Scrape all sport pages concurrently.
+        
+        Args:
+            categories: Dict of sport slug -> sport type
+        
+        Returns:
+            List of program dictionaries (in category order)
+        """
+        items = list(categories.items())
+        with ThreadPoolExecutor(max_workers=min(self.size, len(items))) as executor:
+            results = list(executor.map(lambda item: self.scrape(*item), items))
+        
+        return [program for programs in results for program in programs]
+    
+    def close(self):
+        """Quit all browsers"""
+        with self._lock:
+            drivers = [d for d in self._drivers if d]
+            self._drivers = []
+        
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        
+        if drivers:
+            print("\n🔒 Browser closed")
+
 def scrape_sport_page(driver, sport_slug, sport_type):
     """
     Scrape a single sport category page.
@@ -57,7 +232,7 @@ def scrape_sport_page(driver, sport_slug, sport_type):
     Returns:
         List of program dictionaries
     """
-    url = f"https://www.tv.nu/sport/{sport_slug}"
+    url = SPORT_PAGE_URL.format(slug=sport_slug)
     programs = []
     
     try:
@@ -130,83 +305,121 @@ def parse_json_data(html, sport_type):
         List of program dictionaries, or empty list if parsing fails
     """
     try:
-        # Find the __INITIAL_STATE__ JSON data
-        match = re.search(r'__INITIAL_STATE__\s*=\s*"({.*?})"', html, re.DOTALL)
-        if not match:
+        # Only the sport schedule is decoded, not the whole state tree
+        schedule = extract_state_key(html, 'sportPageSchedule')
+        if schedule is None:
             return []
         
-        json_str = match.group(1)
-        # Unescape the JSON string
-        json_str = json_str.replace('\\u002F', '/')
-        json_str = json_str.replace('\\"', '"')
-        json_str = json_str.replace('\\\\', '\\')
+        return parse_sport_schedule(schedule, sport_type)
         
-        data = json.loads(json_str)
+    except Exception as e:
+        print(f"  Debug: JSON parsing error: {e}")
+        return []
+
+def parse_sport_schedule(schedule, sport_type):
+    """
+    Convert a sportPageSchedule list into program dictionaries.
+    
+    Args:
+        schedule: sportPageSchedule entries from __INITIAL_STATE__
+        sport_type: Sport type
+    
+    Returns:
+        List of program dictionaries
+    """
+    programs = []
+    
+    for event in schedule:
+        if event.get('type') != 'sport':
+            continue
         
-        # Extract sport schedule
-        if 'sportPageSchedule' not in data:
-            return []
+        title = event.get('title', 'Sport event')
+        date_str = event.get('scheduleDate', '')
         
-        schedule = data['sportPageSchedule']
-        programs = []
+        # Get channel and time from broadcasts
+        broadcasts = event.get('broadcasts', [])
+        if not broadcasts:
+            continue
         
-        for event in schedule:
-            if event.get('type') != 'sport':
-                continue
-            
-            title = event.get('title', 'Sport event')
-            date_str = event.get('scheduleDate', '')
-            
-            # Get channel and time from broadcasts
-            broadcasts = event.get('broadcasts', [])
-            if not broadcasts:
-                continue
-            
-            # Use first broadcast
-            broadcast = broadcasts[0]
-            channel_info = broadcast.get('channel', {})
-            channel = channel_info.get('name', 'TBA')
-            
-            # Convert timestamp to time
-            start_time = broadcast.get('startTime')
-            if start_time:
-                # startTime is Unix timestamp in milliseconds
-                dt = datetime.fromtimestamp(start_time / 1000)
-                time_str = dt.strftime('%H:%M')
-                
-                # If date_str is empty, get it from timestamp
-                if not date_str:
-                    date_str = dt.strftime('%Y-%m-%d')
-            else:
-                time_str = 'TBA'
+        # Use first broadcast
+        broadcast = broadcasts[0]
+        channel_info = broadcast.get('channel', {})
+        channel = channel_info.get('name', 'TBA')
+        
+        # Convert timestamp to time
+        start_time = broadcast.get('startTime')
+        if start_time:
+            # startTime is Unix timestamp in milliseconds
+            dt = datetime.fromtimestamp(start_time / 1000)
+            time_str = dt.strftime('%H:%M')
             
-            # Extract additional info
-            subtitle = event.get('subtitle', '')
-            if subtitle and subtitle not in title:
-                full_title = f"{title} - {subtitle}"
-            else:
-                full_title = title
-            
-            program = {
-                'title': full_title,
-                'channel': channel,
-                'date': date_str,
-                'time': time_str,
-                'sport_type': sport_type,
-                'datetime': f"{date_str}T{time_str}:00"
-            }
-            programs.append(program)
-        
-        return programs
+            # If date_str is empty, get it from timestamp
+            if not date_str:
+                date_str = dt.strftime('%Y-%m-%d')
+        else:
+            time_str = 'TBA'
         
+        # Extract additional info
+        subtitle = event.get('subtitle', '')
+        if subtitle and subtitle not in title:
+            full_title = f"{title} - {subtitle}"
+        else:
+            full_title = title
+        
+        program = {
+            'title': full_title,
+            'channel': channel,
+            'date': date_str,
+            'time': time_str,
+            'sport_type': sport_type,
+            'datetime': f"{date_str}T{time_str}:00"
+        }
+        programs.append(program)
+    
+    return programs
+
+def scrape_sport_page_browserless(sport_slug, sport_type):
+    """
+    Scrape a sport page without a browser, from its server-sent state data.
+    
+    Args:
+        sport_slug: Sport URL slug (e.g., 'langdskidakning')
+        sport_type: Sport type for categorization
+    
+    Returns:
+        List of program dictionaries, or None if the page has to be
+        rendered with Selenium instead
+    """
+    url = SPORT_PAGE_URL.format(slug=sport_slug)
+    
+    try:
+        html = fetch_text(url, timeout=15)
     except Exception as e:
-        print(f"  Debug: JSON parsing error: {e}")
-        return []
+        print(f"  ⚠️  Error fetching {url}: {e}")
+        return None
+    
+    try:
+        schedule = extract_state_key(html, 'sportPageSchedule')
+    except Exception as e:
+        print(f"  ⚠️  Could not decode state data for {sport_slug}: {e}")
+        return None
+    
+    if schedule is None:
+        print(f"  ⚠️  No state data in {sport_slug}, needs browser rendering")
+        return None
+    
+    programs = parse_sport_schedule(schedule, sport_type)
+    print(f"  ✅ {sport_slug}: {len(programs)} programs (no browser)")
+    return programs
 
 def parse_html_text(html, sport_type):
     """
     Fallback HTML text parsing when JSON extraction fails.
     
+    Walks the page once, emitting a program for each time ("11:00") that
+    follows a date header ("FREDAG 21 NOVEMBER"). Times are held until the
+    next header is reached, since their context must not cross into it.
+    
     Args:
         html: HTML content
         sport_type: Sport type
@@ -215,102 +428,51 @@ def parse_html_text(html, sport_type):
         List of program dictionaries
     """
     programs = []
-    current_year = datetime.now().year
-    
-    # Month mapping
-    month_map = {
-        'januari': 1, 'februari': 2, 'mars': 3, 'april': 4,
-        'maj': 5, 'juni': 6, 'juli': 7, 'augusti': 8,
-        'september': 9, 'oktober': 10, 'november': 11, 'december': 12,
-        'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'nov': 11, 'dec': 12
-    }
-    
-    # Strategy: Find date headers ("FREDAG 21 NOVEMBER"), then find times ("11:00") after them
-    # Date headers format: "FREDAG 21 NOVEMBER" or "21 nov"
-    date_header_pattern = r'(?:FREDAG|LÖRDAG|SÖNDAG|MÅNDAG|TISDAG|ONSDAG|TORSDAG)\s+(\d{1,2})\s+(NOVEMBER|DECEMBER|JANUARI|FEBRUARI)'
-    
-    date_headers = list(re.finditer(date_header_pattern, html, re.IGNORECASE))
-    print(f"  Debug: Found {len(date_headers)} date headers")
-    
-    # For each date header, find all times that follow it (until next date header)
-    for i, date_header in enumerate(date_headers):
-        day = int(date_header.group(1))
-        month_str = date_header.group(2).lower()
+    now = datetime.now()
+    header_count = 0
+    
+    # Date of the current section (None before the first header or after
+    # an invalid one) and the time matches seen in it so far
+    date_str = None
+    section_start = 0
+    pending_times = []
+    
+    def flush_section(section_end):
+        for time_match in pending_times:
+            program = parse_time_match(html, time_match, section_start, section_end, date_str, sport_type)
+            if program:
+                programs.append(program)
+    
+    for token in HTML_TEXT_TOKEN_PATTERN.finditer(html):
+        if token.group('hour') is not None:
+            if date_str:
+                pending_times.append(token)
+            continue
+        
+        # Date header: close the previous section and start a new one
+        flush_section(token.start())
+        pending_times = []
+        header_count += 1
+        section_start = token.end()
+        date_str = None
         
-        month = month_map.get(month_str)
+        day = int(token.group('day'))
+        month = SWEDISH_MONTHS.get(token.group('month').lower())
         if not month:
             continue
         
         # Handle year wraparound
-        year = current_year
-        if month < datetime.now().month:
+        year = now.year
+        if month < now.month:
             year += 1
         
         try:
-            event_date = datetime(year, month, day)
-            date_str = event_date.strftime('%Y-%m-%d')
-        except:
+            date_str = datetime(year, month, day).strftime('%Y-%m-%d')
+        except ValueError:
             continue
-        
-        # Find the section of HTML for this date (until next date header)
-        section_start = date_header.end()
-        if i + 1 < len(date_headers):
-            section_end = date_headers[i + 1].start()
-        else:
-            section_end = len(html)
-        
-        section = html[section_start:section_end]
-        
-        # Find all time patterns in this section ("11:00", "10:00", etc.)
-        time_pattern = r'(\d{1,2}):(\d{2})'
-        time_matches = re.finditer(time_pattern, section)
-        
-        for time_match in time_matches:
-            hour = time_match.group(1)
-            minute = time_match.group(2)
-            time_str = f"{hour}:{minute}"
-            
-            # Get context around this time (400 chars window)
-            ctx_start = max(0, time_match.start() - 200)
-            ctx_end = min(len(section), time_match.end() + 200)
-            context = section[ctx_start:ctx_end]
-            
-            # Find channel
-            channel = 'TBA'
-            for ch in ['SVT1', 'SVT2', 'SVT Play', 'TV4', 'Viaplay', 'TV6', 'TV10', 'SVT']:
-                if ch in context:
-                    channel = ch
-                    break
-            
-            # Extract title from context
-            title = extract_title_from_context(context, time_match.start() - ctx_start)
-            
-            # Look for competition info ("Sprint", "10 km klassiskt", etc.)
-            comp_patterns = [
-                r'(Sprint|10 km klassiskt|10 km fri stil|Stafett|Jaktstart)',
-                r'(\d+ km [^,<]+)',
-            ]
-            for comp_pat in comp_patterns:
-                comp_match = re.search(comp_pat, context, re.IGNORECASE)
-                if comp_match:
-                    comp_text = comp_match.group(1)
-                    if not title or len(title) < 15:
-                        title = f"Längdsidåkning - {comp_text}"
-                    break
-            
-            # Skip if no meaningful content
-            if not title or len(title) < 5:
-                continue
-            
-            program = {
-                'title': title,
-                'channel': channel,
-                'date': date_str,
-                'time': time_str,
-                'sport_type': sport_type,
-                'datetime': f"{date_str}T{time_str}:00"
-            }
-            programs.append(program)
+    
+    flush_section(len(html))
+    print(f"  Debug: Found {header_count} date headers")
     
     # Remove duplicates based on date+time+title
     seen = set()
@@ -323,6 +485,60 @@ def parse_html_text(html, sport_type):
     
     return unique_programs
 
+def parse_time_match(html, time_match, section_start, section_end, date_str, sport_type):
+    """
+    Build a program from one time found in the HTML text.
+    
+    Args:
+        html: HTML content
+        time_match: Match of HTML_TEXT_TOKEN_PATTERN for the time
+        section_start: Start of the date section containing the time
+        section_end: End of the date section containing the time
+        date_str: Date of the section (YYYY-MM-DD)
+        sport_type: Sport type
+    
+    Returns:
+        Program dictionary, or None if no meaningful title was found
+    """
+    time_str = f"{time_match.group('hour')}:{time_match.group('minute')}"
+    
+    # Get context around this time (400 chars window, within the section)
+    ctx_start = max(section_start, time_match.start() - 200)
+    ctx_end = min(section_end, time_match.end() + 200)
+    context = html[ctx_start:ctx_end]
+    
+    # Find channel
+    channel = 'TBA'
+    for ch in HTML_TEXT_CHANNELS:
+        if ch in context:
+            channel = ch
+            break
+    
+    # Extract title from context
+    title = extract_title_from_context(context, time_match.start() - ctx_start)
+    
+    # Look for competition info ("Sprint", "10 km klassiskt", etc.)
+    for comp_pattern in COMPETITION_PATTERNS:
+        comp_match = comp_pattern.search(context)
+        if comp_match:
+            comp_text = comp_match.group(1)
+            if not title or len(title) < 15:
+                title = f"Längdsidåkning - {comp_text}"
+            break
+    
+    # Skip if no meaningful content
+    if not title or len(title) < 5:
+        return None
+    
+    return {
+        'title': title,
+        'channel': channel,
+        'date': date_str,
+        'time': time_str,
+        'sport_type': sport_type,
+        'datetime': f"{date_str}T{time_str}:00"
+    }
+
 def extract_title_from_context(context, match_position):
     """
     Extract event title from surrounding context.
@@ -335,22 +551,15 @@ def extract_title_from_context(context, match_position):
         Event title string
     """
     # Look for text before the date/time
-    before_text = context[:match_position]
+    before_text = context[:match_position][-300:]
     
-    # Common patterns for titles
-    title_patterns = [
-        r'<h\d[^>]*>([^<]+)</h\d>',  # Heading tags
-        r'title["\']>([^<]+)<',       # title attribute
-        r'>([A-ZÅÄÖ][^<]{10,100})<', # Capitalized text
-    ]
-    
-    for pattern in title_patterns:
-        matches = re.findall(pattern, before_text[-300:])
+    for pattern in TITLE_PATTERNS:
+        matches = pattern.findall(before_text)
         if matches:
             title = matches[-1].strip()
             # Clean up
-            title = re.sub(r'\s+', ' ', title)
-            if len(title) > 10 and 'längdskidåkning' in title.lower() or 'skidskytte' in title.lower():
+            title = WHITESPACE_PATTERN.sub(' ', title)
+            if len(title) > 10 and classify_sport(title, default=None) in ('cross-country', 'biathlon'):
                 return title
     
     # Fallback: look for location names
@@ -374,13 +583,10 @@ def merge_with_calendar_events(tvnu_events, calendar_file='events.json'):
         except:
             pass
     
-    # Create a set of verified event dates+sports
-    verified_keys = {(e['date'], e['sport_type']) for e in tvnu_events}
-    
-    # Start with verified tv.nu events
-    merged = []
+    # Convert verified tv.nu events to the calendar format
+    broadcasts = []
     for event in tvnu_events:
-        merged.append({
+        broadcasts.append({
             'sport': event['sport_type'],
             'title': event['title'],
             'competition': extract_competition(event['title']),
@@ -391,11 +597,9 @@ def merge_with_calendar_events(tvnu_events, calendar_file='events.json'):
             'verified': True
         })
     
-    # Add calendar events that don't have TV verification yet
-    for cal_event in calendar_events:
-        event_key = (cal_event.get('date'), cal_event.get('sport'))
-        if event_key not in verified_keys:
-            merged.append(cal_event)
+    # Add calendar events that no broadcast covers yet
+    merged, stats = merge_events(broadcasts, calendar_events)
+    print(f"  {merge_summary(stats)}")
     
     return merged
 
@@ -428,8 +632,8 @@ def extract_competition(title):
     
     return comp
 
-def update_script_js(events, output_file='script.js'):
-    """Update script.js with event data."""
+def update_events_store(events, output_file=None):
+    """Publish event data to the events store (events.jsonl)."""
     # Sort and add IDs
     def sort_key(event):
         date = event.get('date', '')
@@ -439,106 +643,143 @@ def update_script_js(events, output_file='script.js'):
         return (date, time)
     
     events.sort(key=sort_key)
-    for i, event in enumerate(events, 1):
-        event['id'] = i
+    for event in events:
         event.pop('verified', None)
     
-    # Format as JavaScript
-    js_content = "// Event data - updated from tv.nu (Selenium)\n"
-    js_content += "const events = "
-    js_content += json.dumps(events, indent=4, ensure_ascii=False)
-    js_content += ";\n\n"
-    
-    # Preserve existing rendering code
-    existing_code = ""
-    if os.path.exists(output_file):
-        with open(output_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            const_match = re.search(r'const events = \[.*?\];', content, re.DOTALL)
-            if const_match:
-                existing_code = content[const_match.end():]
-            elif 'function renderSchedule' in content:
-                existing_code = '\n' + content[content.index('function renderSchedule'):]
-    
-    if existing_code:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(js_content)
-            f.write(existing_code)
-        print(f"✅ Updated {output_file} with {len(events)} events")
+    # Content-derived IDs, stable across re-scrapes
+    assign_event_ids(events)
+    
+    write_events(events, output_file, source='tv.nu (Selenium)')
+    print(f"✅ Updated {output_file or EVENTS_STORE_PATH.name} with {len(events)} events")
+
+def scrape_all_categories(pool, use_browser=False):
+    """
+    Scrape all sport categories, browserless first.
+    
+    Args:
+        pool: DriverPool used for pages that need rendering
+        use_browser: Always render pages with Selenium
+    
+    Returns:
+        List of program dictionaries
+    """
+    items = list(SPORT_CATEGORIES.items())
+    
+    if use_browser:
+        results = [None] * len(items)
+    else:
+        results = fetch_concurrently(lambda item: scrape_sport_page_browserless(*item), items)
+    
+    # Render only the pages where the state data was missing
+    fallback = {slug: sport_type for (slug, sport_type), programs in zip(items, results) if programs is None}
+    if fallback:
+        print(f"\n🌐 Rendering {len(fallback)} pages with Selenium...")
+        rendered = pool.scrape_all(fallback)
     else:
-        print("⚠️  Could not find rendering code in script.js")
+        rendered = []
+    
+    all_programs = [program for programs in results if programs for program in programs]
+    return all_programs + rendered
 
-def main():
-    """Main execution."""
-    print("🔍 Scraping tv.nu with Selenium (JavaScript rendering)...\n")
+def run_scrape(pool, use_browser=False):
+    """Scrape all sport pages, merge and save the results."""
+    started = time.time()
+    
+    all_programs = scrape_all_categories(pool, use_browser=use_browser)
+    
+    print(f"\n⏱️  Scraped {len(SPORT_CATEGORIES)} pages in {time.time() - started:.1f}s\n")
+    
+    if not all_programs:
+        print("⚠️  No winter sports programs found on tv.nu")
+        print("ℹ️  This might mean no events are scheduled yet\n")
+    else:
+        print(f"✅ Found {len(all_programs)} verified events from tv.nu\n")
+    
+    # Merge with calendar
+    print("🔗 Merging with FIS/IBU calendar...")
+    all_events = merge_with_calendar_events(all_programs)
     
-    # Create Selenium driver
-    driver = create_driver()
-    if not driver:
+    if not all_events:
+        print("❌ No events available")
         return
     
+    print(f"✅ Total: {len(all_events)} events ({len(all_programs)} verified, {len(all_events) - len(all_programs)} from calendar)\n")
+    
+    # Display
+    sport_icons = {
+        'cross-country': '⛷️', 'biathlon': '🎯', 'alpine': '🎿',
+        'ski-jumping': '🪂', 'ice-hockey': '🏒', 'figure-skating': '⛸️',
+        'speed-skating': '⏱️', 'curling': '🥌', 'other': '🏆'
+    }
+    
+    print("📺 Combined schedule:")
+    for event in all_events[:20]:  # Show first 20
+        icon = sport_icons.get(event['sport'], '🏆')
+        channel = event.get('channel', 'TBA')
+        time_str = event.get('time', 'TBA')
+        verified = '✅' if event.get('verified') else '📅'
+        print(f"  {verified} {icon} {event['date']} {time_str:5} - {channel:8} - {event['title'][:60]}")
+    
+    if len(all_events) > 20:
+        print(f"  ... and {len(all_events) - 20} more events")
+    
+    # Save
+    json_file = 'tvnu_events_selenium.json'
+    with open(json_file, 'w', encoding='utf-8') as f:
+        json.dump(all_events, f, indent=2, ensure_ascii=False)
+    print(f"\n✅ Saved to {json_file}")
+    
+    # Publish to the events store
+    update_events_store(all_events)
+    
+    print(f"\n✨ Done! {len(all_events)} total events")
+    print(f"   ✅ {len(all_programs)} verified from TV schedules")
+    print(f"   📅 {len(all_events) - len(all_programs)} from calendar (TBA)")
+
+def get_option(name, default):
+    """Get the value following a --option flag on the command line."""
+    if name in sys.argv:
+        index = sys.argv.index(name)
+        if index + 1 < len(sys.argv):
+            return sys.argv[index + 1]
+    return default
+
+def main():
+    """
+    Main execution.
+    
+    Options:
+        --selenium      Always render pages in a browser (skip direct fetch)
+        --pool-size N   Number of browsers scraping in parallel (default 4)
+        --daemon        Keep browsers warm and rescrape every --interval minutes
+        --interval M    Minutes between scrapes in daemon mode (default 60)
+    """
+    pool_size = int(get_option('--pool-size', DEFAULT_POOL_SIZE))
+    daemon = '--daemon' in sys.argv
+    interval = float(get_option('--interval', DEFAULT_DAEMON_INTERVAL))
+    use_browser = '--selenium' in sys.argv
+    
+    if use_browser:
+        print(f"🔍 Scraping tv.nu with Selenium (JavaScript rendering, {pool_size} browsers)...\n")
+    else:
+        print("🔍 Scraping tv.nu (direct fetch, Selenium only as fallback)...\n")
+    
+    pool = DriverPool(size=pool_size)
+    
     try:
-        all_programs = []
-        
-        # Scrape each sport category
-        for sport_slug, sport_type in SPORT_CATEGORIES.items():
-            print(f"🏅 Scraping {sport_slug}...")
-            programs = scrape_sport_page(driver, sport_slug, sport_type)
-            all_programs.extend(programs)
-        
-        print()
-        
-        if not all_programs:
-            print("⚠️  No winter sports programs found on tv.nu")
-            print("ℹ️  This might mean no events are scheduled yet\n")
-        else:
-            print(f"✅ Found {len(all_programs)} verified events from tv.nu\n")
-        
-        # Merge with calendar
-        print("🔗 Merging with FIS/IBU calendar...")
-        all_events = merge_with_calendar_events(all_programs)
-        
-        if not all_events:
-            print("❌ No events available")
-            return
-        
-        print(f"✅ Total: {len(all_events)} events ({len(all_programs)} verified, {len(all_events) - len(all_programs)} from calendar)\n")
-        
-        # Display
-        sport_icons = {
-            'cross-country': '⛷️', 'biathlon': '🎯', 'alpine': '🎿',
-            'ski-jumping': '🪂', 'ice-hockey': '🏒', 'figure-skating': '⛸️',
-            'speed-skating': '⏱️', 'curling': '🥌', 'other': '🏆'
-        }
-        
-        print("📺 Combined schedule:")
-        for event in all_events[:20]:  # Show first 20
-            icon = sport_icons.get(event['sport'], '🏆')
-            channel = event.get('channel', 'TBA')
-            time = event.get('time', 'TBA')
-            verified = '✅' if event.get('verified') else '📅'
-            print(f"  {verified} {icon} {event['date']} {time:5} - {channel:8} - {event['title'][:60]}")
-        
-        if len(all_events) > 20:
-            print(f"  ... and {len(all_events) - 20} more events")
-        
-        # Save
-        json_file = 'tvnu_events_selenium.json'
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(all_events, f, indent=2, ensure_ascii=False)
-        print(f"\n✅ Saved to {json_file}")
-        
-        # Update script.js
-        update_script_js(all_events)
-        
-        print(f"\n✨ Done! {len(all_events)} total events")
-        print(f"   ✅ {len(all_programs)} verified from TV schedules")
-        print(f"   📅 {len(all_events) - len(all_programs)} from calendar (TBA)")
-        
+        while True:
+            run_scrape(pool, use_browser=use_browser)
+            
+            if not daemon:
+                break
+            
+            print(f"\n💤 Next scrape in {interval:g} minutes (browsers kept open)\n")
+            time.sleep(interval * 60)
+    except KeyboardInterrupt:
+        print("\n\nStopped")
     finally:
-        # Always close the driver
-        driver.quit()
-        print("\n🔒 Browser closed")
+        # Always close the browsers (only started if a page needed one)
+        pool.close()
 
 if __name__ == '__main__':
     main()
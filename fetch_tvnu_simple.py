@@ -7,6 +7,12 @@ import os
 import re
 from datetime import datetime, timedelta
 from urllib.request import urlopen, Request
+from event_ids import assign_event_ids
+from event_merge import merge_events, merge_summary
+from event_store import EVENTS_STORE_PATH, write_events
+from http_client import DEFAULT_WORKERS, fetch_concurrently, fetch_parsed
+from sport_keywords import classify_sport, is_winter_sport
+from tvnu_state import SPORT_PAGE_URL
 
 # Channels to check
 CHANNELS = {
@@ -28,57 +34,22 @@ SPORT_CATEGORIES = [
     'curling'
 ]
 
-# Keywords for winter sports (all Winter Olympic sports)
-WINTER_SPORTS_KEYWORDS = [
-    # Cross-country skiing
-    'längdskidor', 'längdsidåkning', 'längd', 'cross-country', 'langrenn',
-    # Biathlon
-    'skidskytte', 'biathlon',
-    # Alpine skiing  
-    'alpint', 'alpine', 'slalom', 'storslalom', 'super-g', 'störtlopp', 'downhill',
-    # Ski jumping
-    'backhoppning', 'backhoppare', 'ski jumping', 'skidflygning',
-    # Ice hockey
-    'ishockey', 'hockey', 'ice hockey',
-    # Figure skating
-    'konståkning', 'figure skating',
-    # Speed skating
-    'skridsko', 'skridskor', 'speed skating', 'short track',
-    # Curling
-    'curling',
-    # Freestyle & Snowboard
-    'freestyle', 'snowboard', 'slopestyle', 'halfpipe', 'big air',
-    # Nordic combined
-    'nordisk kombination', 'nordic combined',
-    # Bobsleigh, Skeleton, Luge
-    'bob', 'bobsleigh', 'skeleton', 'rodel', 'luge',
-    # General
-    'världscup', 'world cup', 'vm', 'world championship', 'os', 'olympi',
-    # Locations
-    'ruka', 'trondheim', 'davos', 'falun', 'lillehammer', 'oslo', 'drammen',
-    'kitzbühel', 'wengen', 'cortina', 'are', 'schladming', 'val gardena',
-    'tour de ski'
-]
-
-def fetch_sport_category_page(sport_slug):
+def fetch_sport_page_programs(sport_slug):
     """
-    Fetch sport category page from tv.nu (e.g., tv.nu/sport/langdskidakning).
+    Fetch and parse a sport category page, reusing the cached page when it
+    has not changed. The parse is not cached: it fills in the year from
+    today's date.
     
     Args:
         sport_slug: Sport category slug (e.g., 'langdskidakning')
     
     Returns:
-        HTML content
+        List of programs, or None if the page could not be fetched
     """
-    url = f"https://www.tv.nu/sport/{sport_slug}"
+    url = SPORT_PAGE_URL.format(slug=sport_slug)
     
     try:
-        request = Request(url)
-        request.add_header('User-Agent', 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
-        
-        with urlopen(request, timeout=15) as response:
-            html = response.read().decode('utf-8')
-            return html
+        return fetch_parsed(url, extract_programs_from_sport_page, timeout=15)
     except Exception as e:
         print(f"  Error fetching sport page {sport_slug}: {e}")
         return None
@@ -211,8 +182,7 @@ def extract_programs_from_html(html, channel_name):
                         continue
                     
                     # Check if it's a winter sports program
-                    name_lower = name.lower()
-                    if not any(kw in name_lower for kw in WINTER_SPORTS_KEYWORDS):
+                    if not is_winter_sport(name):
                         continue
                     
                     try:
@@ -235,10 +205,16 @@ def extract_programs_from_html(html, channel_name):
     
     return programs
 
-def scrape_winter_sports_from_sport_pages():
+def scrape_winter_sports_from_sport_pages(max_workers=DEFAULT_WORKERS):
     """
     Scrape winter sports programs from tv.nu sport category pages.
     
+    All category pages are fetched concurrently, so the run takes about as
+    long as the slowest page.
+    
+    Args:
+        max_workers: Number of pages fetched in parallel
+    
     Returns:
         List of all winter sports programs
     """
@@ -257,17 +233,15 @@ def scrape_winter_sports_from_sport_pages():
         'curling': 'curling'
     }
     
-    for sport_slug in SPORT_CATEGORIES:
+    results = fetch_concurrently(fetch_sport_page_programs, SPORT_CATEGORIES, max_workers=max_workers)
+    
+    for sport_slug, programs in zip(SPORT_CATEGORIES, results):
         print(f"🏅 Checking {sport_slug}...")
         
-        html = fetch_sport_category_page(sport_slug)
-        if not html:
+        if programs is None:
             print(f"  Could not fetch {sport_slug}")
             continue
         
-        # Extract programs using sport page parser
-        programs = extract_programs_from_sport_page(html)
-        
         # Tag with sport type
         sport_type = sport_map.get(sport_slug, 'other')
         for prog in programs:
@@ -298,30 +272,8 @@ def categorize_programs(programs):
         if 'sport_type' in prog:
             sport = prog['sport_type']
         # Otherwise determine from title keywords
-        elif any(kw in title_lower for kw in ['skidskytte', 'biathlon']):
-            sport = 'biathlon'
-        elif any(kw in title_lower for kw in ['alpint', 'alpine', 'slalom', 'storslalom', 'super-g', 'störtlopp', 'downhill']):
-            sport = 'alpine'
-        elif any(kw in title_lower for kw in ['backhoppning', 'backhoppare', 'ski jumping', 'skidflygning']):
-            sport = 'ski-jumping'
-        elif any(kw in title_lower for kw in ['ishockey', 'hockey']):
-            sport = 'ice-hockey'
-        elif any(kw in title_lower for kw in ['konståkning', 'figure skating']):
-            sport = 'figure-skating'
-        elif any(kw in title_lower for kw in ['skridsko', 'skridskor', 'speed skating', 'short track']):
-            sport = 'speed-skating'
-        elif any(kw in title_lower for kw in ['curling']):
-            sport = 'curling'
-        elif any(kw in title_lower for kw in ['freestyle', 'snowboard', 'slopestyle', 'halfpipe', 'big air']):
-            sport = 'other'
-        elif any(kw in title_lower for kw in ['nordisk kombination', 'nordic combined']):
-            sport = 'other'
-        elif any(kw in title_lower for kw in ['bob', 'bobsleigh', 'skeleton', 'rodel', 'luge']):
-            sport = 'other'
-        elif any(kw in title_lower for kw in ['längdskidor', 'längdsidåkning', 'längd', 'cross-country', 'langrenn']):
-            sport = 'cross-country'
         else:
-            sport = 'other'
+            sport = classify_sport(prog['title'])
         
         # Extract location
         location_match = re.search(r'(?:i|från)\s+([A-ZÅÄÖ][a-zåäö]+)', prog['title'])
@@ -381,28 +333,16 @@ def merge_with_calendar_events(tvnu_events, calendar_file='events.json'):
         except:
             pass
     
-    # Create a set of verified event dates+sports for quick lookup
-    verified_keys = {(e['date'], e['sport']) for e in tvnu_events}
-    
-    # Start with verified tv.nu events
-    merged = list(tvnu_events)
-    
-    # Add calendar events that don't have TV verification yet
-    for cal_event in calendar_events:
-        event_key = (cal_event.get('date'), cal_event.get('sport'))
-        
-        # Skip if we already have verified TV data for this date+sport
-        if event_key in verified_keys:
-            continue
-        
-        # Add calendar event (these are marked with TBA)
-        merged.append(cal_event)
+    # Verified events take precedence; calendar events (marked with TBA)
+    # are kept unless a broadcast of the same sport, day and venue covers them
+    merged, stats = merge_events(tvnu_events, calendar_events)
+    print(f"  {merge_summary(stats)}")
     
     return merged
 
-def update_script_js(events, output_file='script.js'):
+def update_events_store(events, output_file=None):
     """
-    Update script.js with event data.
+    Publish event data to the events store (events.jsonl).
     """
     # Sort and add IDs
     # TBA times should sort to end of day
@@ -415,122 +355,15 @@ def update_script_js(events, output_file='script.js'):
         return (date, time)
     
     events.sort(key=sort_key)
-    for i, event in enumerate(events, 1):
-        event['id'] = i
-        # Remove internal 'verified' field before writing to JS
+    for event in events:
+        # Remove internal 'verified' field before publishing
         event.pop('verified', None)
     
-    # Format as JavaScript
-    js_content = "// Event data - updated from tv.nu\n"
-    js_content += "const events = "
-    js_content += json.dumps(events, indent=4, ensure_ascii=False)
-    js_content += ";\n\n"
-    
-    # Preserve existing rendering code
-    existing_code = ""
-    if os.path.exists(output_file):
-        with open(output_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            const_match = re.search(r'const events = \[.*?\];', content, re.DOTALL)
-            if const_match:
-                existing_code = content[const_match.end():]
-            elif 'function renderSchedule' in content:
-                existing_code = '\n' + content[content.index('function renderSchedule'):]
-    
-    if not existing_code or 'function renderSchedule' not in existing_code:
-        existing_code = """
-// Sport display configuration
-const sportConfig = {
-    'cross-country': { emoji: '⛷️', name: 'Längdskidor' },
-    'biathlon': { emoji: '🎯', name: 'Skidskytte' },
-    'alpine': { emoji: '🎿', name: 'Alpint' },
-    'ski-jumping': { emoji: '🪂', name: 'Backhoppning' },
-    'ice-hockey': { emoji: '🏒', name: 'Ishockey' },
-    'figure-skating': { emoji: '⛸️', name: 'Konståkning' },
-    'speed-skating': { emoji: '⏱️', name: 'Skridsko' },
-    'curling': { emoji: '🥌', name: 'Curling' },
-    'other': { emoji: '🏆', name: 'Övrigt' }
-};
-
-function renderSchedule() {
-    const container = document.getElementById('schedule-container');
-    const filters = {
-        'cross-country': document.getElementById('filterCrossCountry'),
-        'biathlon': document.getElementById('filterBiathlon'),
-        'alpine': document.getElementById('filterAlpine'),
-        'ski-jumping': document.getElementById('filterSkiJumping'),
-        'ice-hockey': document.getElementById('filterIceHockey'),
-        'figure-skating': document.getElementById('filterFigureSkating'),
-        'speed-skating': document.getElementById('filterSpeedSkating'),
-        'curling': document.getElementById('filterCurling'),
-        'other': document.getElementById('filterOther')
-    };
-    
-    container.innerHTML = '';
-    
-    const today = new Date();
-    today.setHours(0, 0, 0, 0);
-    
-    const filteredEvents = events.filter(event => {
-        const eventDate = new Date(event.date);
-        eventDate.setHours(0, 0, 0, 0);
-        
-        if (eventDate < today) return false;
-        
-        // Check if sport filter is active
-        const filter = filters[event.sport];
-        if (filter && !filter.checked) return false;
-        
-        return true;
-    });
-    
-    if (filteredEvents.length === 0) {
-        container.innerHTML = '<p class="no-events">Inga kommande tävlingar</p>';
-        return;
-    }
-    
-    filteredEvents.forEach(event => {
-        const card = document.createElement('div');
-        card.className = 'event-card';
-        
-        const config = sportConfig[event.sport] || sportConfig['other'];
-        
-        card.innerHTML = `
-            <div class="event-header">
-                <span class="event-sport">${config.emoji} ${config.name}</span>
-                <span class="event-channel">${event.channel}</span>
-            </div>
-            <h3 class="event-title">${event.title}</h3>
-            <p class="event-competition">${event.competition}</p>
-            <div class="event-meta">
-                <span class="event-date">${new Date(event.date).toLocaleDateString('sv-SE', { weekday: 'long', year: 'numeric', month: 'long', day: 'numeric' })}</span>
-                <span class="event-time">${event.time}</span>
-            </div>
-        `;
-        
-        container.appendChild(card);
-    });
-}
-
-// Add event listeners for all filters
-document.getElementById('filterCrossCountry').addEventListener('change', renderSchedule);
-document.getElementById('filterBiathlon').addEventListener('change', renderSchedule);
-document.getElementById('filterAlpine').addEventListener('change', renderSchedule);
-document.getElementById('filterSkiJumping').addEventListener('change', renderSchedule);
-document.getElementById('filterIceHockey').addEventListener('change', renderSchedule);
-document.getElementById('filterFigureSkating').addEventListener('change', renderSchedule);
-document.getElementById('filterSpeedSkating').addEventListener('change', renderSchedule);
-document.getElementById('filterCurling').addEventListener('change', renderSchedule);
-document.getElementById('filterOther').addEventListener('change', renderSchedule);
-
-renderSchedule();
-"""
-    
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(js_content)
-        f.write(existing_code)
+    # Content-derived IDs, stable across re-scrapes
+    assign_event_ids(events)
     
-    print(f"✅ Updated {output_file} with {len(events)} events\n")
+    write_events(events, output_file, source='tv.nu')
+    print(f"✅ Updated {output_file or EVENTS_STORE_PATH.name} with {len(events)} events")
 
 def main():
     """Main execution."""
@@ -583,8 +416,8 @@ def main():
         json.dump(all_events, f, indent=2, ensure_ascii=False)
     print(f"\n✅ Saved to {json_file}")
     
-    # Update script.js
-    update_script_js(all_events)
+    # Publish to the events store
+    update_events_store(all_events)
     
     print(f"\n✨ Done! {len(all_events)} total events")
     print(f"   ✅ {len(tvnu_events)} verified from TV schedules")
@@ -4,12 +4,75 @@ Home Assistant integration for sending event reminders
 
 import requests
 import logging
-from typing import Dict, Optional
+import threading
+import time as time_module
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, time
+from requests.adapters import HTTPAdapter
 from config import get_config
 
 logger = logging.getLogger(__name__)
 
+
+class RateLimiter:
+    """Token bucket limiting how many requests per second go to one target"""
+    
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time_module.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a request may be sent"""
+        if self.rate <= 0:
+            return
+        
+        while True:
+            with self._lock:
+                now = time_module.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                
+                wait = (1 - self._tokens) / self.rate
+            
+            time_module.sleep(wait)
+
+
+# Keep-alive sessions and rate limiters shared by all notifiers, per HA URL
+_registry_lock = threading.Lock()
+_sessions: Dict[str, requests.Session] = {}
+_rate_limiters: Dict[str, RateLimiter] = {}
+
+
+def get_session(base_url: str, pool_size: int = 4) -> requests.Session:
+    """Get the pooled keep-alive session for a Home Assistant URL"""
+    with _registry_lock:
+        session = _sessions.get(base_url)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, pool_size))
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _sessions[base_url] = session
+        return session
+
+
+def get_rate_limiter(base_url: str, rate: float, burst: int) -> RateLimiter:
+    """Get the shared rate limiter for a Home Assistant URL"""
+    with _registry_lock:
+        limiter = _rate_limiters.get(base_url)
+        if limiter is None or limiter.rate != rate or limiter.capacity != max(1, burst):
+            limiter = RateLimiter(rate, burst)
+            _rate_limiters[base_url] = limiter
+        return limiter
+
 class HomeAssistantNotifier:
     """Send event reminders to Home Assistant"""
     
@@ -27,6 +90,15 @@ class HomeAssistantNotifier:
             'Authorization': f'Bearer {self.ha_token}',
             'Content-Type': 'application/json',
         }
+        
+        # Reuse TCP/TLS connections across calls and notifier instances
+        self.max_concurrency = max(1, self.config.home_assistant_max_concurrency)
+        self.session = get_session(self.ha_url or '', pool_size=self.max_concurrency)
+        self.rate_limiter = get_rate_limiter(
+            self.ha_url or '',
+            self.config.home_assistant_rate_limit,
+            burst=self.max_concurrency
+        )
     
     def _is_notification_time_allowed(self) -> bool:
         """Check if current time is within allowed notification hours"""
@@ -61,7 +133,7 @@ class HomeAssistantNotifier:
                 logger.error("Home Assistant token not configured")
                 return False
             
-            response = requests.get(
+            response = self.session.get(
                 f"{self.ha_url}/api/",
                 headers=self.headers,
                 timeout=10
@@ -118,6 +190,23 @@ class HomeAssistantNotifier:
             logger.error(f"Error sending reminder: {e}")
             return False
     
+    def send_reminders(self, reminders: List[Tuple[Dict, int]]) -> List[bool]:
+        """Send several reminders concurrently
+        
+        Takes (event, minutes_before) pairs and returns one success flag per
+        pair, in order. At most ``max_concurrency`` requests are in flight and
+        the shared rate limiter paces them for this Home Assistant instance.
+        """
+        if not reminders:
+            return []
+        
+        if len(reminders) == 1 or self.max_concurrency == 1:
+            return [self.send_reminder(event, minutes) for event, minutes in reminders]
+        
+        workers = min(self.max_concurrency, len(reminders))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda item: self.send_reminder(*item), reminders))
+    
     def _format_message(self, event: Dict) -> str:
         """Format the reminder message"""
         try:
@@ -196,7 +285,8 @@ class HomeAssistantNotifier:
             # Make service call
             url = f"{self.ha_url}/api/services/{domain}/{service}"
             
-            response = requests.post(
+            self.rate_limiter.acquire()
+            response = self.session.post(
                 url,
                 json=service_data,
                 headers=self.headers,
@@ -237,7 +327,7 @@ class HomeAssistantNotifier:
     def get_services(self) -> Optional[Dict]:
         """Get available Home Assistant services"""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.ha_url}/api/services",
                 headers=self.headers,
                 timeout=10
@@ -0,0 +1,319 @@
+"""
+Shared HTTP fetching for the scrapers - pooled keep-alive connections,
+per-host concurrency limits, retries with jittered backoff and an on-disk
+conditional-request cache.
+"""
+
+import hashlib
+import json
+import os
+import random
+import re
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# Defaults for fetches
+DEFAULT_TIMEOUT = 15
+MAX_RETRIES = 3
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_MAX_SECONDS = 8.0
+
+# Concurrency limits
+DEFAULT_WORKERS = 8
+PER_HOST_LIMIT = 8
+
+# Status codes worth retrying
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Directory for cached response bodies and parse results
+# (override with HTTP_CACHE_DIR)
+CACHE_DIR = os.getenv('HTTP_CACHE_DIR', str(Path(__file__).parent / '.http_cache'))
+
+MAX_AGE_PATTERN = re.compile(r'max-age=(\d+)')
+
+_lock = threading.Lock()
+_session: Optional[requests.Session] = None
+_host_slots: Dict[str, threading.BoundedSemaphore] = {}
+
+
+class RetryableHTTPError(requests.HTTPError):
+    """Server answered with a status that may succeed on retry"""
+
+
+def get_session() -> requests.Session:
+    """Get the process-wide keep-alive session"""
+    global _session
+    
+    with _lock:
+        if _session is None:
+            _session = requests.Session()
+            _session.headers['User-Agent'] = USER_AGENT
+            adapter = HTTPAdapter(pool_connections=8, pool_maxsize=max(DEFAULT_WORKERS, PER_HOST_LIMIT))
+            _session.mount('http://', adapter)
+            _session.mount('https://', adapter)
+        return _session
+
+
+@contextmanager
+def host_slot(url: str):
+    """Hold one of the PER_HOST_LIMIT concurrent request slots for a host"""
+    host = urlsplit(url).netloc
+    
+    with _lock:
+        slot = _host_slots.get(host)
+        if slot is None:
+            slot = threading.BoundedSemaphore(PER_HOST_LIMIT)
+            _host_slots[host] = slot
+    
+    with slot:
+        yield
+
+
+def backoff_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff for a retry attempt (0-based)"""
+    ceiling = min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * (2 ** attempt))
+    return random.uniform(0, ceiling)
+
+
+def fetch_response(url: str, headers: Optional[Dict[str, str]] = None,
+                   timeout: float = DEFAULT_TIMEOUT, retries: int = MAX_RETRIES) -> requests.Response:
+    """GET a URL through the shared session, retrying transient failures.
+    
+    Raises the last error when all attempts fail.
+    """
+    session = get_session()
+    last_error: Optional[Exception] = None
+    
+    for attempt in range(retries + 1):
+        try:
+            with host_slot(url):
+                response = session.get(url, headers=headers, timeout=timeout)
+            
+            if response.status_code in RETRY_STATUSES:
+                raise RetryableHTTPError(f"{response.status_code} for {url}", response=response)
+            
+            response.raise_for_status()
+            return response
+        
+        except (requests.ConnectionError, requests.Timeout, RetryableHTTPError) as e:
+            last_error = e
+            if attempt < retries:
+                time.sleep(backoff_delay(attempt))
+    
+    raise last_error
+
+
+def fetch_text(url: str, headers: Optional[Dict[str, str]] = None, timeout: float = DEFAULT_TIMEOUT,
+               retries: int = MAX_RETRIES, encoding: str = 'utf-8') -> str:
+    """GET a URL and decode the body (see fetch_response for retries)"""
+    response = fetch_response(url, headers=headers, timeout=timeout, retries=retries)
+    return response.content.decode(encoding)
+
+
+def fetch_concurrently(fetch: Callable, items: Iterable, max_workers: int = DEFAULT_WORKERS) -> List:
+    """Run a fetch function over items on a worker pool, keeping input order"""
+    items = list(items)
+    if not items:
+        return []
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(fetch, items))
+
+
+class CachedResponse:
+    """Response body served through the on-disk cache"""
+    
+    def __init__(self, url: str, content: bytes, not_modified: bool, from_network: bool):
+        self.url = url
+        self.content = content
+        # True when the cached body is still valid (fresh by max-age, or
+        # the server answered 304 Not Modified)
+        self.not_modified = not_modified
+        # False when served without contacting the server at all
+        self.from_network = from_network
+    
+    def text(self, encoding: str = 'utf-8') -> str:
+        return self.content.decode(encoding)
+
+
+def _cache_paths(url: str, cache_dir: str):
+    key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+    base = os.path.join(cache_dir, key)
+    return base + '.body', base + '.json'
+
+
+def _read_json(path: str) -> Optional[Dict]:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_atomic(path: str, data: bytes):
+    """Write a file via a temp file and rename, so readers never see a partial file"""
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _max_age(response: requests.Response) -> Optional[int]:
+    """Seconds the response may be reused without revalidation (None: always revalidate)"""
+    cache_control = response.headers.get('Cache-Control', '').lower()
+    if 'no-cache' in cache_control:
+        return 0
+    match = MAX_AGE_PATTERN.search(cache_control)
+    return int(match.group(1)) if match else None
+
+
+def fetch_cached(url: str, headers: Optional[Dict[str, str]] = None, timeout: float = DEFAULT_TIMEOUT,
+                 retries: int = MAX_RETRIES, cache_dir: str = CACHE_DIR) -> CachedResponse:
+    """GET a URL through the on-disk cache.
+    
+    A stored body is reused without a request while Cache-Control max-age
+    says it is fresh. Otherwise the request carries If-None-Match /
+    If-Modified-Since from the stored ETag / Last-Modified, and a 304
+    answer reuses the stored body. Raises like fetch_response on failure.
+    """
+    body_path, meta_path = _cache_paths(url, cache_dir)
+    meta = _read_json(meta_path)
+    
+    cached_body = None
+    if meta is not None:
+        try:
+            with open(body_path, 'rb') as f:
+                cached_body = f.read()
+        except OSError:
+            meta = None
+    
+    if meta is not None:
+        max_age = meta.get('max_age')
+        if max_age and time.time() < meta.get('stored_at', 0) + max_age:
+            return CachedResponse(url, cached_body, not_modified=True, from_network=False)
+    
+    request_headers = dict(headers or {})
+    if meta is not None:
+        if meta.get('etag'):
+            request_headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            request_headers['If-Modified-Since'] = meta['last_modified']
+    
+    response = fetch_response(url, headers=request_headers, timeout=timeout, retries=retries)
+    
+    if 'no-store' in response.headers.get('Cache-Control', '').lower():
+        return CachedResponse(url, response.content, not_modified=False, from_network=True)
+    
+    if response.status_code == 304 and meta is not None:
+        meta['stored_at'] = time.time()
+        meta['max_age'] = _max_age(response)
+        meta['etag'] = response.headers.get('ETag', meta.get('etag'))
+        meta['last_modified'] = response.headers.get('Last-Modified', meta.get('last_modified'))
+        _write_atomic(meta_path, json.dumps(meta).encode('utf-8'))
+        return CachedResponse(url, cached_body, not_modified=True, from_network=True)
+    
+    content = response.content
+    meta = {
+        'url': url,
+        'stored_at': time.time(),
+        'max_age': _max_age(response),
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+        'sha1': hashlib.sha1(content).hexdigest(),
+    }
+    # Body first, so the metadata never points at a missing body
+    _write_atomic(body_path, content)
+    _write_atomic(meta_path, json.dumps(meta).encode('utf-8'))
+    
+    return CachedResponse(url, content, not_modified=False, from_network=True)
+
+
+def _code_fingerprint(code, digest):
+    """Feed a code object's bytecode and constants (nested code included) to a hash"""
+    digest.update(code.co_code)
+    for const in code.co_consts:
+        digest.update(_const_fingerprint(const))
+
+
+def _const_fingerprint(const) -> bytes:
+    """Stable bytes for a code constant.
+    
+    Set literals are compiled to frozensets, whose repr() order depends on
+    the string hash seed, so their members are fingerprinted in sorted order.
+    """
+    if hasattr(const, 'co_code'):
+        digest = hashlib.sha1()
+        _code_fingerprint(const, digest)
+        return b'code:' + digest.digest()
+    if isinstance(const, frozenset):
+        members = sorted(_const_fingerprint(member) for member in const)
+        return b'frozenset:' + hashlib.sha1(b'\0'.join(members)).digest()
+    if isinstance(const, tuple):
+        members = [_const_fingerprint(member) for member in const]
+        return b'tuple:' + hashlib.sha1(b'\0'.join(members)).digest()
+    return repr(const).encode('utf-8')
+
+
+def fetch_parsed(url: str, parse: Callable[[str], Any], parser_version: Optional[str] = None,
+                 headers: Optional[Dict[str, str]] = None, timeout: float = DEFAULT_TIMEOUT,
+                 retries: int = MAX_RETRIES, encoding: str = 'utf-8', cache_dir: str = CACHE_DIR) -> Any:
+    """Fetch a URL through the cache and parse its body.
+    
+    With a parser_version, the parse result is stored and reused while the
+    body is unchanged. The result must then be JSON-serializable. It is
+    keyed on the body hash, parser_version and the bytecode and constants
+    of parse. Helpers that parse calls are not covered: bump parser_version
+    when they change. Parsers whose result depends on more than the body
+    (e.g. the current date) must not pass a parser_version; their body is
+    still cached, but it is parsed on every call.
+    """
+    response = fetch_cached(url, headers=headers, timeout=timeout, retries=retries, cache_dir=cache_dir)
+    
+    if parser_version is None:
+        return parse(response.text(encoding))
+    
+    body_hash = hashlib.sha1(response.content).hexdigest()
+    digest = hashlib.sha1(str(parser_version).encode('utf-8'))
+    code = getattr(parse, '__code__', None)
+    if code is not None:
+        _code_fingerprint(code, digest)
+    else:
+        digest.update(getattr(parse, '__qualname__', repr(parse)).encode('utf-8'))
+    parser_hash = digest.hexdigest()
+    parsed_path = os.path.join(cache_dir, hashlib.sha1(url.encode('utf-8')).hexdigest() + '.parsed.json')
+    
+    if response.not_modified:
+        stored = _read_json(parsed_path)
+        if stored and stored.get('body_sha1') == body_hash and stored.get('parser') == parser_hash:
+            return stored['result']
+    
+    result = parse(response.text(encoding))
+    
+    stored = {'body_sha1': body_hash, 'parser': parser_hash, 'result': result}
+    try:
+        _write_atomic(parsed_path, json.dumps(stored, ensure_ascii=False).encode('utf-8'))
+    except (OSError, TypeError, ValueError):
+        # Parse results are only an optimization
+        pass
+    
+    return result
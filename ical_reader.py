@@ -0,0 +1,272 @@
+"""
+Streaming iCalendar (RFC 5545) reader for the FIS event feeds.
+
+Lines are consumed one at a time from any iterable (a file, a response's
+iter_lines(), io.StringIO), folded lines are joined, TEXT escapes are
+decoded and one IcalEvent is yielded per VEVENT. Only the event being
+read is held in memory.
+"""
+
+import re
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+# Escapes in TEXT property values (RFC 5545, 3.3.11)
+TEXT_ESCAPES = {'n': '\n', 'N': '\n', '\\': '\\', ',': ',', ';': ';'}
+TEXT_ESCAPE_PATTERN = re.compile(r'\\(.)', re.DOTALL)
+
+# Version of the parsed event format. Bump it when the reader's output
+# changes, so cached parse results (http_client.fetch_parsed) are dropped.
+PARSER_VERSION = '2'
+
+# FIS discipline codes -> display names
+FIS_DISCIPLINES = {
+    # Cross-country
+    'SP': 'Sprint',
+    '10k': '10 km',
+    '30k': '30 km',
+    '50k': '50 km',
+    '15k': '15 km',
+    'Skt': 'Skiatlon',
+    'Tsp': 'Teamsprint',
+    'HMS': 'Mass Start',
+    'Pur': 'Pursuit',
+    # Alpine
+    'SL': 'Slalom',
+    'GS': 'Giant Slalom',
+    'SG': 'Super G',
+    'DH': 'Downhill',
+    'AC': 'Alpine Combined',
+    'PGS': 'Parallel Giant Slalom',
+    'PSL': 'Parallel Slalom',
+    # Ski jumping / Nordic combined
+    'NH': 'Normal Hill',
+    'LH': 'Large Hill',
+    'FH': 'Ski Flying',
+    # Freestyle
+    'MO': 'Moguls',
+    'DM': 'Dual Moguls',
+    'AE': 'Aerials',
+    'SX': 'Ski Cross',
+    'SS': 'Slopestyle',
+    'HP': 'Halfpipe',
+    'BA': 'Big Air'
+}
+
+
+@dataclass
+class IcalEvent:
+    """One VEVENT with its common properties decoded"""
+    
+    uid: str = ''
+    summary: str = ''
+    location: str = ''
+    description: str = ''
+    start: Optional[Union[date, datetime]] = None
+    end: Optional[Union[date, datetime]] = None
+    # Every property as name -> raw (still escaped) value, last one wins
+    properties: Dict[str, str] = field(default_factory=dict)
+
+
+def iter_text_lines(text: str) -> Iterator[str]:
+    """Iterate over the lines of an in-memory document without splitting it all at once"""
+    start = 0
+    while True:
+        end = text.find('\n', start)
+        if end == -1:
+            if start < len(text):
+                yield text[start:]
+            return
+        yield text[start:end]
+        start = end + 1
+
+
+def unfold_lines(lines: Iterable[str]) -> Iterator[str]:
+    """Join folded lines (continuations start with a space or tab)"""
+    current = None
+    
+    for line in lines:
+        line = line.rstrip('\r\n')
+        if line[:1] in (' ', '\t'):
+            if current is not None:
+                current += line[1:]
+            continue
+        
+        if current:
+            yield current
+        current = line
+    
+    if current:
+        yield current
+
+
+def unescape_text(value: str) -> str:
+    """Decode backslash escapes in a TEXT value"""
+    if '\\' not in value:
+        return value
+    return TEXT_ESCAPE_PATTERN.sub(_replace_text_escape, value)
+
+
+def _replace_text_escape(match) -> str:
+    escaped = match.group(1)
+    return TEXT_ESCAPES.get(escaped, escaped)
+
+
+def split_content_line(line: str) -> Tuple[str, Dict[str, str], str]:
+    """
+    Split a content line into name, parameters and raw value.
+    
+    "DTSTART;VALUE=DATE:20261128" -> ('DTSTART', {'VALUE': 'DATE'}, '20261128')
+    """
+    colon = line.find(':')
+    if '"' in line[:colon]:
+        # The value starts at the first colon outside a quoted parameter value
+        in_quotes = False
+        colon = -1
+        for i, char in enumerate(line):
+            if char == '"':
+                in_quotes = not in_quotes
+            elif char == ':' and not in_quotes:
+                colon = i
+                break
+    
+    if colon == -1:
+        return line.upper(), {}, ''
+    
+    head, value = line[:colon], line[colon + 1:]
+    name, _, param_text = head.partition(';')
+    
+    params = {}
+    if param_text:
+        for param in param_text.split(';'):
+            key, _, param_value = param.partition('=')
+            params[key.upper()] = param_value.strip('"')
+    
+    return name.upper(), params, value
+
+
+def parse_date_value(value: str) -> Optional[Union[date, datetime]]:
+    """Parse a DATE ("20261128") or DATE-TIME ("20261128T100000Z") value"""
+    value = value.strip()
+    try:
+        day = date(int(value[0:4]), int(value[4:6]), int(value[6:8]))
+        if len(value) < 15 or value[8] != 'T':
+            return day
+        return datetime(day.year, day.month, day.day,
+                        int(value[9:11]), int(value[11:13]), int(value[13:15]))
+    except (ValueError, IndexError):
+        return None
+
+
+def iter_events(lines: Union[str, Iterable[str]]) -> Iterator[IcalEvent]:
+    """
+    Read VEVENTs from iCalendar lines.
+    
+    Args:
+        lines: Iterable of text lines (line endings are stripped), or the
+            whole document as one string
+    
+    Yields:
+        IcalEvent for each VEVENT, in feed order
+    """
+    if isinstance(lines, str):
+        lines = iter_text_lines(lines)
+    
+    event = None
+    nested = 0
+    
+    for line in unfold_lines(lines):
+        name, params, value = split_content_line(line)
+        
+        if name == 'BEGIN':
+            if value.upper() == 'VEVENT':
+                event = IcalEvent()
+            elif event is not None:
+                # Sub-component such as VALARM
+                nested += 1
+            continue
+        
+        if name == 'END':
+            if value.upper() == 'VEVENT' and event is not None:
+                yield event
+                event = None
+                nested = 0
+            elif event is not None and nested:
+                nested -= 1
+            continue
+        
+        if event is None or nested:
+            continue
+        
+        event.properties[name] = value
+        
+        if name == 'DTSTART':
+            event.start = parse_date_value(value)
+        elif name == 'DTEND':
+            event.end = parse_date_value(value)
+        elif name == 'UID':
+            event.uid = unescape_text(value)
+        elif name == 'SUMMARY':
+            event.summary = unescape_text(value).strip()
+        elif name == 'LOCATION':
+            event.location = unescape_text(value).strip()
+        elif name == 'DESCRIPTION':
+            event.description = unescape_text(value)
+
+
+def parse_description_fields(description: str) -> Dict[str, str]:
+    """Parse "Key: value" lines of a FIS event description"""
+    fields = {}
+    for line in description.splitlines():
+        key, sep, value = line.partition(':')
+        if sep:
+            fields[key.strip()] = value.strip()
+    return fields
+
+
+def fis_world_cup_event(record: IcalEvent) -> Optional[Dict]:
+    """
+    Convert a FIS calendar VEVENT into an event dictionary.
+    
+    Args:
+        record: Event read by iter_events
+    
+    Returns:
+        Event dictionary, or None if it is not a dated World Cup event
+    """
+    if not record.summary or not record.location or record.start is None:
+        return None
+    
+    fields = parse_description_fields(record.description)
+    
+    # Only include World Cup (WC) events
+    if fields.get('Category') != 'WC':
+        return None
+    
+    gender = fields.get('Gender', '')[:1]
+    if gender not in ('W', 'M'):
+        gender = None
+    discipline = fields.get('Discipline')
+    
+    discipline_name = FIS_DISCIPLINES.get(discipline, discipline)
+    gender_text = "Damer" if gender == "W" else "Herrar"
+    
+    return {
+        'location': record.location,
+        'date': record.start.strftime("%Y-%m-%d"),
+        'gender': gender,
+        'discipline': discipline_name,
+        'competition': f"{discipline_name} - {gender_text}",
+        'summary': record.summary
+    }
+
+
+def read_fis_world_cup_events(lines: Union[str, Iterable[str]]) -> List[Dict]:
+    """Parse the World Cup events of a FIS iCalendar feed"""
+    events = []
+    for record in iter_events(lines):
+        event = fis_world_cup_event(record)
+        if event:
+            events.append(event)
+    return events
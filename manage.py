@@ -4,12 +4,14 @@ Management script for Winter Sports TV Schedule reminders
 
 import sys
 import logging
+import re
 from pathlib import Path
-from home_assistant import HomeAssistantNotifier
-from mongodb_client import MongoDBClient
 from config import get_config
-from check_reminders import check_and_send_reminders
-from events_manager import EventsManager
+
+# Commands import pymongo, requests and flask (through events_manager,
+# home_assistant, mongodb_client and web_app) only when they need them,
+# so quick commands such as help and show-config start fast. The
+# check-startup command guards this.
 
 # Set up logging
 logging.basicConfig(
@@ -19,9 +21,30 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Packages that quick commands must not import (checked by check-startup)
+HEAVY_MODULES = ('pymongo', 'requests', 'flask', 'flask_cors', 'selenium')
+
+# Commands whose startup check-startup measures
+STARTUP_CHECK_COMMANDS = ('help', 'show-config')
+
+# "import time: self [us] | cumulative | name" lines of python -X importtime
+IMPORTTIME_PATTERN = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)', re.MULTILINE)
+
+
+def get_option(name: str, default=None):
+    """Get the value following a --option flag on the command line"""
+    args = sys.argv[2:]
+    if name in args:
+        index = args.index(name)
+        if index + 1 < len(args):
+            return args[index + 1]
+    return default
+
 
 def test_ha_connection():
     """Test Home Assistant connection"""
+    from home_assistant import HomeAssistantNotifier
+    
     print("\n=== Testing Home Assistant Connection ===\n")
     
     config = get_config()
@@ -69,6 +92,8 @@ def test_ha_connection():
 
 def test_notification():
     """Send a test notification"""
+    from home_assistant import HomeAssistantNotifier
+    
     print("\n=== Sending Test Notification ===\n")
     
     config = get_config()
@@ -91,6 +116,8 @@ def test_notification():
 
 def test_mongodb():
     """Test MongoDB connection"""
+    from mongodb_client import MongoDBClient, get_pool_stats
+    
     print("\n=== Testing MongoDB Connection ===\n")
     
     config = get_config()
@@ -114,6 +141,11 @@ def test_mongodb():
         else:
             print("\nNo reminders sent yet")
         
+        stats = get_pool_stats()
+        print(f"\nConnection pool: {stats['connections_open']} open, "
+              f"{stats['reuses']}/{stats['acquisitions']} client reuses, "
+              f"connect took {stats['last_connect_ms']} ms")
+        
         db_client.close()
         return True
     else:
@@ -128,6 +160,9 @@ def test_mongodb():
 
 def init_database():
     """Initialize MongoDB collections and indexes"""
+    from events_manager import EventsManager
+    from mongodb_client import MongoDBClient
+    
     print("\n=== Initializing MongoDB Database ===\n")
     
     config = get_config()
@@ -161,8 +196,10 @@ def init_database():
 
 
 def import_events():
-    """Import events from script.js into MongoDB"""
-    print("\n=== Importing Events from script.js ===\n")
+    """Import events from the events store into MongoDB"""
+    from events_manager import EventsManager, IMPORT_BATCH_SIZE
+    
+    print("\n=== Importing Events from events.jsonl ===\n")
     
     try:
         events_manager = EventsManager()
@@ -176,11 +213,18 @@ def import_events():
         print(f"Current events in database: {current_count}")
         
         # Import
-        imported = events_manager.import_events_from_js()
+        batch_size = int(get_option('--batch-size', IMPORT_BATCH_SIZE))
+        imported = events_manager.import_events_from_store(batch_size=batch_size)
         
         if imported > 0:
+            stats = events_manager.last_import_stats
             new_count = events_manager.get_event_count()
-            print(f"\n✅ Imported {imported} events")
+            print(f"\n✅ Imported {imported} events in {stats['batches']} batches (batch size {batch_size})")
+            print(f"  - Inserted:  {stats['inserted']}")
+            print(f"  - Modified:  {stats['modified']}")
+            print(f"  - Unchanged: {stats['unchanged']}")
+            if stats['failed']:
+                print(f"  - Failed:    {stats['failed']}")
             print(f"Total events in database: {new_count}")
             
             # Show sports breakdown
@@ -193,14 +237,67 @@ def import_events():
             print("\n❌ No events imported")
             events_manager.close()
             return False
-            
+    
     except Exception as e:
         print(f"\n❌ Error importing events: {e}")
         return False
 
 
+def sync_events():
+    """Incrementally sync events from the events store into MongoDB"""
+    from events_manager import EventsManager
+    
+    dry_run = '--dry-run' in sys.argv[2:]
+    print(f"\n=== Syncing Events from events.jsonl{' (dry run)' if dry_run else ''} ===\n")
+    
+    try:
+        events_manager = EventsManager()
+        
+        if events_manager.events_collection is None:
+            print("❌ MongoDB not connected")
+            return False
+        
+        report = events_manager.sync_events(dry_run=dry_run, exclude_past=True)
+        events_manager.close()
+        
+        if report is None:
+            print("❌ Sync failed")
+            return False
+        
+        print(f"New:       {len(report['new'])}")
+        print(f"Changed:   {len(report['changed'])}")
+        print(f"Deleted:   {len(report['deleted'])}")
+        print(f"Unchanged: {report['unchanged_count']}")
+        
+        for label, events in [('New', report['new']), ('Changed', report['changed'])]:
+            if events:
+                print(f"\n{label} events:")
+                for event in events[:20]:
+                    print(f"  + [{event['id']}] {event.get('date')} {event.get('time')} - {event.get('title')}")
+                if len(events) > 20:
+                    print(f"  ... and {len(events) - 20} more")
+        
+        if report['deleted']:
+            print(f"\nDeleted event ids: {', '.join(str(i) for i in report['deleted'][:20])}")
+            if len(report['deleted']) > 20:
+                print(f"  ... and {len(report['deleted']) - 20} more")
+        
+        if dry_run:
+            print("\nℹ️  Dry run - no changes written")
+        else:
+            print(f"\n✅ Wrote {report['written']} events, removed {report['removed']}")
+        
+        return True
+    
+    except Exception as e:
+        print(f"\n❌ Error syncing events: {e}")
+        return False
+
+
 def show_events():
     """Show event statistics"""
+    from events_manager import EventsManager
+    
     print("\n=== Event Statistics ===\n")
     
     try:
@@ -210,23 +307,56 @@ def show_events():
             print("❌ MongoDB not connected")
             return False
         
-        total = events_manager.get_event_count()
-        sports = events_manager.get_sports_list()
-        upcoming = events_manager.get_upcoming_events(days=7)
+        # One aggregation instead of a full fetch per sport
+        stats = events_manager.get_stats(days=7)
+        if stats is None:
+            print("❌ Could not compute event statistics")
+            events_manager.close()
+            return False
         
-        print(f"Total events: {total}")
-        print(f"Sports: {len(sports)}")
-        print(f"Upcoming (next 7 days): {len(upcoming)}")
+        print(f"Total events: {stats['total']}")
+        print(f"Sports: {len(stats['by_sport'])}")
+        print(f"Upcoming (next {stats['upcoming_days']} days): {stats['upcoming']}")
+        print(f"Without start time (TBA): {stats['tba_time']}")
         
-        if sports:
+        if stats['by_sport']:
             print(f"\nAvailable sports:")
-            for sport in sports:
-                count = len(events_manager.get_events_by_sport(sport))
+            for sport, count in sorted(stats['by_sport'].items()):
                 print(f"  - {sport}: {count} events")
         
+        if stats['by_channel']:
+            print(f"\nChannels:")
+            for channel, count in stats['by_channel'].items():
+                print(f"  - {channel}: {count} events")
+        
         events_manager.close()
         return True
+    
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        return False
+
+
+def migrate_start_at():
+    """Set the start_at datetime on stored events"""
+    from events_manager import EventsManager, event_timezone
+    
+    recompute = '--all' in sys.argv[2:]
+    print(f"\n=== Migrating start_at{' (all events)' if recompute else ''} ===\n")
+    
+    try:
+        events_manager = EventsManager()
         
+        if events_manager.events_collection is None:
+            print("❌ MongoDB not connected")
+            return False
+        
+        updated = events_manager.migrate_start_at(recompute=recompute)
+        events_manager.close()
+        
+        print(f"✅ Updated {updated} events (time zone {event_timezone().key})")
+        return True
+    
     except Exception as e:
         print(f"\n❌ Error: {e}")
         return False
@@ -250,6 +380,8 @@ def start_web_interface():
 
 def check_reminders_now():
     """Run reminder check now"""
+    from check_reminders import check_and_send_reminders
+    
     print("\n=== Checking for Reminders ===\n")
     
     try:
@@ -261,6 +393,24 @@ def check_reminders_now():
         return False
 
 
+def run_reminder_daemon():
+    """Run the long-running reminder daemon"""
+    print("\n=== Starting Reminder Daemon ===\n")
+    print("Reminders are sent at their exact time; press Ctrl+C to stop\n")
+    
+    from reminder_daemon import ReminderDaemon
+    
+    daemon = ReminderDaemon()
+    try:
+        daemon.run_forever()
+    except KeyboardInterrupt:
+        daemon.stop()
+        print("\n\nReminder daemon stopped")
+    finally:
+        daemon.close()
+    return True
+
+
 def show_config():
     """Show current configuration"""
     print("\n=== Current Configuration ===\n")
@@ -271,6 +421,7 @@ def show_config():
     print(f"Home Assistant URL: {config.home_assistant_url or '(not set)'}")
     print(f"HA Service: {config.home_assistant_service}")
     print(f"Reminder Intervals: {config.reminder_intervals} minutes")
+    print(f"Event Time Zone: {config.event_timezone}")
     print(f"\nNotification Times:")
     print(f"  Weekdays: {config.weekday_start_hour}:00 - {config.weekday_end_hour}:59")
     print(f"  Weekends: {config.weekend_start_hour}:00 - {config.weekend_end_hour}:59")
@@ -310,12 +461,72 @@ def init_config():
         print("3. Run 'python manage.py test-notification' to test notifications")
         
         return True
-        
+    
     except Exception as e:
         print(f"❌ Error creating .env file: {e}")
         return False
 
 
+def measure_imports(args):
+    """
+    Run Python with -X importtime.
+    
+    Args:
+        args: Arguments after the interpreter options (e.g., ['manage.py', 'help'])
+    
+    Returns:
+        Tuple of (total import milliseconds, set of imported module names)
+    """
+    import subprocess
+    
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime'] + list(args),
+        cwd=Path(__file__).parent, capture_output=True, text=True, stdin=subprocess.DEVNULL
+    )
+    
+    total_us = 0
+    modules = set()
+    for _, cumulative, indent, name in IMPORTTIME_PATTERN.findall(result.stderr):
+        modules.add(name)
+        if not indent:
+            total_us += int(cumulative)
+    
+    return total_us / 1000, modules
+
+
+def check_startup():
+    """Check that quick commands start without importing heavy packages"""
+    print("\n=== Checking Command Startup ===\n")
+    
+    budget = get_option('--budget-ms')
+    baseline_ms, _ = measure_imports(['-c', 'pass'])
+    print(f"Interpreter baseline: {baseline_ms:.1f} ms")
+    
+    ok = True
+    for command in STARTUP_CHECK_COMMANDS:
+        total_ms, modules = measure_imports(['manage.py', command])
+        startup_ms = max(0.0, total_ms - baseline_ms)
+        heavy = sorted({name.split('.')[0] for name in modules} & set(HEAVY_MODULES))
+        
+        status = '✅'
+        if heavy or (budget is not None and startup_ms > float(budget)):
+            status = '❌'
+            ok = False
+        
+        print(f"{status} {command:<13} {startup_ms:7.1f} ms of imports"
+              + (f" (imports {', '.join(heavy)})" if heavy else ""))
+    
+    if budget is not None:
+        print(f"\nBudget: {float(budget):.1f} ms per command")
+    
+    if not ok:
+        print("\n❌ Startup check failed - move heavy imports into the commands that use them")
+        sys.exit(1)
+    
+    print("\n✅ Startup check passed")
+    return True
+
+
 def show_help():
     """Show help message"""
     print("\n=== Winter Sports TV Schedule - Management Commands ===\n")
@@ -326,8 +537,13 @@ def show_help():
     print("  init-db               Initialize MongoDB collections and indexes")
     print("  test-mongodb          Test MongoDB connection")
     print("\nEvents:")
-    print("  import-events         Import events from script.js into MongoDB")
+    print("  import-events         Import events from events.jsonl into MongoDB")
+    print("                        (--batch-size N upserts per round trip, default 500)")
+    print("  sync-events           Sync only new/changed/deleted events from events.jsonl")
+    print("                        (--dry-run shows the diff without writing)")
     print("  show-events           Show event statistics")
+    print("  migrate-start-at      Set start_at on events stored before it existed")
+    print("                        (--all recomputes every event, e.g. after changing EVENT_TIMEZONE)")
     print("\nTesting:")
     print("  test-ha               Test Home Assistant connection")
     print("  test-notification     Send a test notification")
@@ -335,6 +551,10 @@ def show_help():
     print("  start-web             Start web interface (http://localhost:5001)")
     print("\nReminders:")
     print("  check-reminders       Check for upcoming events and send reminders")
+    print("  reminder-daemon       Run continuously and send each reminder on time")
+    print("\nMaintenance:")
+    print("  check-startup         Check that quick commands don't import heavy packages")
+    print("                        (--budget-ms N also fails commands slower than N ms)")
     print("\nHelp:")
     print("  help                  Show this help message")
     print()
@@ -352,12 +572,16 @@ def main():
         'show-config': show_config,
         'init-db': init_database,
         'import-events': import_events,
+        'sync-events': sync_events,
         'show-events': show_events,
+        'migrate-start-at': migrate_start_at,
         'test-ha': test_ha_connection,
         'test-notification': test_notification,
         'test-mongodb': test_mongodb,
         'start-web': start_web_interface,
         'check-reminders': check_reminders_now,
+        'reminder-daemon': run_reminder_daemon,
+        'check-startup': check_startup,
         'help': show_help,
     }
     
@@ -2,9 +2,13 @@
 MongoDB client for tracking sent reminders
 """
 
+import atexit
 import logging
-from typing import Optional, Dict, List
+import threading
+import time
+from typing import Optional, Dict, List, Callable, Set, Tuple
 from datetime import datetime
+from pymongo import UpdateOne, monitoring
 from pymongo.mongo_client import MongoClient
 from pymongo.server_api import ServerApi
 from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError
@@ -12,6 +16,223 @@ from config import get_config
 
 logger = logging.getLogger(__name__)
 
+# After a failed connect, callers fail fast for this long before the next
+# attempt (instead of each waiting for the server selection timeout)
+CONNECT_RETRY_BACKOFF_SECONDS = 10
+
+
+class PoolMetricsListener(monitoring.ConnectionPoolListener):
+    """Count connection pool events for the shared clients"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counts = {
+            'connections_created': 0,
+            'connections_closed': 0,
+            'checkouts': 0,
+            'checkins': 0,
+            'checkout_failures': 0,
+        }
+    
+    def _increment(self, key: str):
+        with self._lock:
+            self.counts[key] += 1
+    
+    def pool_created(self, event):
+        pass
+    
+    def pool_ready(self, event):
+        pass
+    
+    def pool_cleared(self, event):
+        pass
+    
+    def pool_closed(self, event):
+        pass
+    
+    def connection_created(self, event):
+        self._increment('connections_created')
+    
+    def connection_ready(self, event):
+        pass
+    
+    def connection_closed(self, event):
+        self._increment('connections_closed')
+    
+    def connection_check_out_started(self, event):
+        pass
+    
+    def connection_check_out_failed(self, event):
+        self._increment('checkout_failures')
+    
+    def connection_checked_out(self, event):
+        self._increment('checkouts')
+    
+    def connection_checked_in(self, event):
+        self._increment('checkins')
+
+
+# Process-wide registry of MongoClient instances, keyed by (uri, pool sizes).
+# MongoClient is thread-safe and keeps its own connection pool, so every
+# MongoDBClient/EventsManager in the process shares one client per cluster.
+_registry_lock = threading.Lock()
+_shared_clients: Dict[Tuple[str, int, int], MongoClient] = {}
+# Serialize the first connect per key without holding _registry_lock
+_connect_locks: Dict[Tuple[str, int, int], threading.Lock] = {}
+# Key -> (monotonic time until which connects are not retried, error)
+_connect_failures: Dict[Tuple[str, int, int], Tuple[float, str]] = {}
+_bootstrapped: set = set()
+_bootstrap_locks: Dict[Tuple, threading.Lock] = {}
+_pool_listener = PoolMetricsListener()
+_registry_stats = {
+    'clients_created': 0,
+    'acquisitions': 0,
+    'reuses': 0,
+    'connect_failures': 0,
+    'connect_backoffs': 0,
+    'index_bootstraps': 0,
+    'bootstrap_failures': 0,
+    'last_connect_ms': None,
+}
+
+
+def _lookup_client(key: Tuple[str, int, int]) -> Optional[MongoClient]:
+    """Registered client for a key (call with _registry_lock held).
+    
+    Raises ConnectionFailure while a recent connect failure is backing off.
+    """
+    client = _shared_clients.get(key)
+    if client is not None:
+        _registry_stats['reuses'] += 1
+        return client
+    
+    failure = _connect_failures.get(key)
+    if failure is not None and time.monotonic() < failure[0]:
+        _registry_stats['connect_backoffs'] += 1
+        raise ConnectionFailure(f"MongoDB connect failed recently, retrying after backoff: {failure[1]}")
+    return None
+
+
+def get_shared_client(uri: str, max_pool_size: int = 10, min_pool_size: int = 0) -> MongoClient:
+    """Get the shared MongoClient for a URI, connecting on first use.
+    
+    The connect and ping run under a per-key lock, not the registry lock,
+    so callers of other clients and get_pool_stats never wait for them.
+    Raises the pymongo connection error if the connect fails. Failed
+    clients are not cached; for CONNECT_RETRY_BACKOFF_SECONDS afterwards
+    callers get ConnectionFailure at once instead of each waiting for
+    the server selection timeout.
+    """
+    key = (uri, max_pool_size, min_pool_size)
+    
+    with _registry_lock:
+        _registry_stats['acquisitions'] += 1
+        client = _lookup_client(key)
+        connect_lock = _connect_locks.setdefault(key, threading.Lock())
+    if client is not None:
+        return client
+    
+    with connect_lock:
+        # Another caller may have connected (or failed) while we waited
+        with _registry_lock:
+            client = _lookup_client(key)
+        if client is not None:
+            return client
+        
+        started = time.perf_counter()
+        client = MongoClient(
+            uri,
+            server_api=ServerApi('1'),
+            tls=True,
+            tlsAllowInvalidCertificates=True,
+            serverSelectionTimeoutMS=5000,
+            maxPoolSize=max_pool_size,
+            minPoolSize=min_pool_size,
+            event_listeners=[_pool_listener],
+        )
+        
+        try:
+            # Test connection once per process instead of once per instance
+            client.admin.command('ping')
+        except Exception as e:
+            client.close()
+            with _registry_lock:
+                _registry_stats['connect_failures'] += 1
+                _connect_failures[key] = (time.monotonic() + CONNECT_RETRY_BACKOFF_SECONDS, str(e))
+            raise
+        
+        with _registry_lock:
+            _registry_stats['clients_created'] += 1
+            _registry_stats['last_connect_ms'] = round((time.perf_counter() - started) * 1000, 1)
+            _shared_clients[key] = client
+            _connect_failures.pop(key, None)
+        logger.info(f"Successfully connected to MongoDB Atlas (pool size {min_pool_size}-{max_pool_size})")
+        return client
+
+
+def bootstrap_once(key: Tuple, initializer: Callable[[], None]) -> bool:
+    """Run an index/collection initializer once per process for a key.
+    
+    Concurrent first callers for a key wait until the initializer has
+    finished. The key only counts as bootstrapped once the initializer
+    returns; if it raises, the error is logged and the next caller retries.
+    
+    Returns:
+        True if the key is bootstrapped
+    """
+    with _registry_lock:
+        if key in _bootstrapped:
+            return True
+        bootstrap_lock = _bootstrap_locks.setdefault(key, threading.Lock())
+    
+    with bootstrap_lock:
+        with _registry_lock:
+            if key in _bootstrapped:
+                return True
+        
+        try:
+            initializer()
+        except Exception as e:
+            # The key holds the URI (with credentials); log the collection only
+            logger.warning(f"Initializing the {key[-1]} collection failed, retrying on next use: {e}")
+            with _registry_lock:
+                _registry_stats['bootstrap_failures'] += 1
+            return False
+        
+        with _registry_lock:
+            _bootstrapped.add(key)
+            _registry_stats['index_bootstraps'] += 1
+        return True
+
+
+def get_pool_stats() -> Dict:
+    """Get reuse metrics for the shared MongoDB clients"""
+    with _registry_lock:
+        stats = dict(_registry_stats)
+        stats['open_clients'] = len(_shared_clients)
+    
+    stats.update(_pool_listener.counts)
+    stats['connections_open'] = stats['connections_created'] - stats['connections_closed']
+    return stats
+
+
+def close_shared_clients():
+    """Close all shared MongoDB clients (on process shutdown)"""
+    with _registry_lock:
+        clients = list(_shared_clients.values())
+        _shared_clients.clear()
+        _bootstrapped.clear()
+        _connect_failures.clear()
+    
+    for client in clients:
+        client.close()
+    
+    if clients:
+        logger.info("MongoDB connections closed")
+
+
+atexit.register(close_shared_clients)
+
 class MongoDBClient:
     """MongoDB client for reminder tracking"""
     
@@ -35,26 +256,24 @@ class MongoDBClient:
                 self.reminders_collection = None
                 return
             
-            # Create client with SSL/TLS settings
-            self.client = MongoClient(
+            # Reuse the process-wide client (connects and pings on first use)
+            self.client = get_shared_client(
                 uri,
-                server_api=ServerApi('1'),
-                tls=True,
-                tlsAllowInvalidCertificates=True,
-                serverSelectionTimeoutMS=5000
+                max_pool_size=self.config.mongodb_max_pool_size,
+                min_pool_size=self.config.mongodb_min_pool_size,
             )
             
-            # Test connection
-            self.client.admin.command('ping')
-            
             self.db = self.client[self.config.mongodb_database]
             self.reminders_collection = self.db['sent_reminders']
             
-            # Initialize collections and indexes
-            self._initialize_collections()
-            
-            logger.info(f"Successfully connected to MongoDB Atlas (database: {self.config.mongodb_database})")
+            # Initialize collections and indexes (once per process)
+            bootstrap_once(
+                (uri, self.config.mongodb_database, 'sent_reminders'),
+                self._initialize_collections
+            )
             
+            logger.debug(f"Using MongoDB Atlas connection (database: {self.config.mongodb_database})")
+        
         except (ConnectionFailure, ServerSelectionTimeoutError) as e:
             logger.warning(f"MongoDB connection failed: {e}. Reminders will work but duplicates may occur.")
             self.client = None
@@ -67,25 +286,21 @@ class MongoDBClient:
             self.reminders_collection = None
     
     def _initialize_collections(self):
-        """Initialize collections and indexes"""
-        try:
-            # Create index on event_id and minutes_before for faster lookups and to prevent duplicates
-            self.reminders_collection.create_index([
-                ('event_id', 1),
-                ('minutes_before', 1)
-            ], unique=True)
-            
-            # Create index on event_datetime for cleanup queries
-            self.reminders_collection.create_index('event_datetime')
-            
-            # Create index on sent_at for sorting recent reminders
-            self.reminders_collection.create_index([('sent_at', -1)])
-            
-            logger.info("MongoDB collections and indexes initialized")
-            
-        except Exception as e:
-            # Indexes might already exist, which is fine
-            logger.debug(f"Index creation note: {e}")
+        """Initialize collections and indexes (errors propagate to bootstrap_once)"""
+        # Create index on event_id and minutes_before for faster lookups and to prevent duplicates
+        # (create_index is a no-op for an index that already exists)
+        self.reminders_collection.create_index([
+            ('event_id', 1),
+            ('minutes_before', 1)
+        ], unique=True)
+        
+        # Create index on event_datetime for cleanup queries
+        self.reminders_collection.create_index('event_datetime')
+        
+        # Create index on sent_at for sorting recent reminders
+        self.reminders_collection.create_index([('sent_at', -1)])
+        
+        logger.info("MongoDB collections and indexes initialized")
     
     def is_connected(self) -> bool:
         """Check if MongoDB is connected"""
@@ -104,7 +319,7 @@ class MongoDBClient:
             })
             
             return result is not None
-            
+        
         except Exception as e:
             logger.error(f"Error checking reminder status: {e}")
             return False
@@ -136,11 +351,78 @@ class MongoDBClient:
             
             logger.debug(f"Marked reminder as sent: {event_title} ({minutes_before} min)")
             return True
-            
+        
         except Exception as e:
             logger.error(f"Error marking reminder as sent: {e}")
             return False
     
+    def get_sent_reminder_keys(self, event_ids: List[str]) -> Set[Tuple[str, int]]:
+        """Get the (event_id, minutes_before) keys already sent for a set of events
+        
+        Uses a single $in query instead of one lookup per reminder.
+        """
+        if not self.is_connected():
+            logger.warning("MongoDB not connected, cannot check reminder status")
+            return set()
+        
+        if not event_ids:
+            return set()
+        
+        try:
+            cursor = self.reminders_collection.find(
+                {'event_id': {'$in': list(set(event_ids))}},
+                {'_id': 0, 'event_id': 1, 'minutes_before': 1}
+            )
+            return {(doc['event_id'], doc['minutes_before']) for doc in cursor}
+        
+        except Exception as e:
+            logger.error(f"Error checking reminder status: {e}")
+            return set()
+    
+    def mark_reminders_sent(self, reminders: List[Dict]) -> int:
+        """Mark several reminders as sent with one bulk write
+        
+        Each reminder dict has event_id, event_title, minutes_before and
+        event_datetime. Returns the number of reminders recorded.
+        """
+        if not self.is_connected():
+            logger.warning("MongoDB not connected, cannot mark reminders as sent")
+            return 0
+        
+        if not reminders:
+            return 0
+        
+        try:
+            sent_at = datetime.now()
+            operations = [
+                UpdateOne(
+                    {
+                        'event_id': reminder['event_id'],
+                        'minutes_before': reminder['minutes_before']
+                    },
+                    {
+                        '$set': {
+                            'event_id': reminder['event_id'],
+                            'event_title': reminder['event_title'],
+                            'minutes_before': reminder['minutes_before'],
+                            'event_datetime': reminder['event_datetime'],
+                            'sent_at': sent_at,
+                        }
+                    },
+                    upsert=True
+                )
+                for reminder in reminders
+            ]
+            
+            self.reminders_collection.bulk_write(operations, ordered=False)
+            
+            logger.debug(f"Marked {len(reminders)} reminders as sent")
+            return len(reminders)
+        
+        except Exception as e:
+            logger.error(f"Error marking reminders as sent: {e}")
+            return 0
+    
     def get_sent_reminders(self, limit: int = 100) -> List[Dict]:
         """Get list of sent reminders"""
         if not self.is_connected():
@@ -154,7 +436,7 @@ class MongoDBClient:
             ).sort('sent_at', -1).limit(limit))
             
             return reminders
-            
+        
         except Exception as e:
             logger.error(f"Error getting sent reminders: {e}")
             return []
@@ -178,13 +460,17 @@ class MongoDBClient:
                 logger.info(f"Cleaned up {deleted_count} old reminders")
             
             return deleted_count
-            
+        
         except Exception as e:
             logger.error(f"Error cleaning up old reminders: {e}")
             return 0
     
     def close(self):
-        """Close MongoDB connection"""
-        if self.client:
-            self.client.close()
-            logger.info("MongoDB connection closed")
+        """Release this client's handle on the shared MongoDB connection.
+        
+        The underlying pool stays open for reuse; use close_shared_clients()
+        to shut it down.
+        """
+        self.client = None
+        self.db = None
+        self.reminders_collection = None
@@ -0,0 +1,259 @@
+"""
+Long-running reminder daemon - sends reminders at their exact fire time
+"""
+
+import heapq
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from check_reminders import sync_events_to_mongodb
+from config import get_config, subscribe, unsubscribe
+from events_manager import EventsManager, compute_event_hash, compute_start_at, event_timezone
+from home_assistant import HomeAssistantNotifier
+from mongodb_client import MongoDBClient
+
+logger = logging.getLogger(__name__)
+
+# How often the daemon looks for changed events (seconds)
+REFRESH_INTERVAL_SECONDS = 60
+
+# Reminders whose fire time passed less than this long ago are still sent
+# (e.g. right after the daemon starts)
+LATE_WINDOW_MINUTES = 10
+
+
+def _now() -> datetime:
+    """Current time in the event time zone (fire times are timezone-aware)"""
+    return datetime.now(event_timezone())
+
+
+class ReminderDaemon:
+    """Keep every future (event, interval) reminder in a min-heap and sleep
+    until the next one is due instead of polling all events."""
+    
+    def __init__(self, refresh_seconds: float = REFRESH_INTERVAL_SECONDS):
+        self.config = get_config()
+        self.refresh_seconds = refresh_seconds
+        self.notifier = HomeAssistantNotifier()
+        self.db_client = MongoDBClient()
+        self.events_manager = EventsManager(self.db_client)
+        
+        # Heap entries: (fire_at, event_id, minutes_before, event_hash)
+        self._queue: List[Tuple[datetime, str, int, str]] = []
+        self._events: Dict[str, Dict] = {}
+        self._hashes: Dict[str, str] = {}
+        self._version: Optional[int] = None
+        self._stop = threading.Event()
+        
+        self.stats = {'sent': 0, 'skipped': 0, 'failed': 0, 'refreshes': 0}
+        
+        # Settings saved while running are applied by the daemon loop
+        self._pending_config = None
+        subscribe(self._on_config_change)
+    
+    def _on_config_change(self, old_config, new_config):
+        """Config subscriber (may run on another thread)"""
+        self._pending_config = new_config
+    
+    def apply_config_changes(self):
+        """Switch to a configuration reloaded from .env"""
+        get_config()  # Picks up .env changes and notifies subscribers
+        config, self._pending_config = self._pending_config, None
+        if config is None:
+            return
+        
+        old_config, self.config = self.config, config
+        
+        if (config.reminder_intervals, config.event_timezone) != \
+                (old_config.reminder_intervals, old_config.event_timezone):
+            # Rebuild the queue for the new intervals/time zone on the next refresh
+            self._queue = []
+            self._hashes = {}
+            self._version = None
+        
+        if (config.home_assistant_url, config.home_assistant_token, config.home_assistant_service) != \
+                (old_config.home_assistant_url, old_config.home_assistant_token, old_config.home_assistant_service):
+            self.notifier = HomeAssistantNotifier()
+        
+        logger.info(f"Reminder daemon applied new configuration "
+                    f"(intervals {config.reminder_intervals}, enabled {config.reminders_enabled})")
+    
+    def refresh(self):
+        """Sync the events store and reschedule events that changed since last refresh"""
+        sync_events_to_mongodb()
+        
+        version = self.events_manager.get_version()
+        if self._events and version is not None and version == self._version:
+            return
+        
+        # Only events that have not started yet (TBA times have no start_at)
+        events = self.events_manager.get_events_in_window(_now())
+        self._version = version
+        self.stats['refreshes'] += 1
+        
+        current_hashes = {}
+        current_events = {}
+        for event in events:
+            event_id = str(event.get('id', 'unknown'))
+            current_events[event_id] = event
+            current_hashes[event_id] = compute_event_hash(event)
+        
+        rescheduled = 0
+        for event_id, event_hash in current_hashes.items():
+            if self._hashes.get(event_id) != event_hash:
+                self._schedule(event_id, current_events[event_id], event_hash)
+                rescheduled += 1
+        
+        # Entries for removed or changed events are dropped lazily when
+        # popped, since their hash no longer matches
+        removed = len(set(self._hashes) - set(current_hashes))
+        self._events = current_events
+        self._hashes = current_hashes
+        
+        if rescheduled or removed:
+            logger.info(f"Reminder queue refreshed: {rescheduled} events scheduled, "
+                        f"{removed} removed, {len(self._queue)} pending reminders")
+    
+    def _schedule(self, event_id: str, event: Dict, event_hash: str):
+        """Push the future reminders of one event onto the queue"""
+        event_datetime = compute_start_at(event)
+        if not event_datetime:
+            return
+        
+        now = _now()
+        if event_datetime <= now:
+            return
+        
+        for reminder_minutes in self.config.reminder_intervals:
+            fire_at = event_datetime - timedelta(minutes=reminder_minutes)
+            if fire_at < now - timedelta(minutes=LATE_WINDOW_MINUTES):
+                continue
+            heapq.heappush(self._queue, (fire_at, event_id, reminder_minutes, event_hash))
+    
+    def run_pending(self) -> int:
+        """Send every reminder that is due now; returns number sent
+        
+        The reminders due at one wake-up are checked with a single query,
+        sent concurrently and marked sent with one bulk write.
+        """
+        now = _now()
+        due = []
+        
+        while self._queue and self._queue[0][0] <= now:
+            fire_at, event_id, reminder_minutes, event_hash = heapq.heappop(self._queue)
+            
+            # Reminders are disabled: drop what comes due
+            if not self.config.reminders_enabled:
+                continue
+            
+            # Stale entry (event changed or was removed)
+            if self._hashes.get(event_id) != event_hash:
+                continue
+            
+            event = self._events[event_id]
+            event_datetime = compute_start_at(event)
+            if not event_datetime or event_datetime <= now:
+                continue
+            
+            due.append((event_id, event, reminder_minutes, event_datetime))
+        
+        if not due:
+            return 0
+        
+        # One query for every reminder already sent for the due events
+        sent_keys = set()
+        if self.db_client.is_connected():
+            sent_keys = self.db_client.get_sent_reminder_keys([event_id for event_id, _, _, _ in due])
+        
+        to_send = []
+        for event_id, event, reminder_minutes, event_datetime in due:
+            if (event_id, reminder_minutes) in sent_keys:
+                logger.debug(f"Reminder already sent for event {event_id} ({reminder_minutes} min)")
+                self.stats['skipped'] += 1
+                continue
+            
+            sent_keys.add((event_id, reminder_minutes))
+            minutes_until_event = int((event_datetime - now).total_seconds() / 60)
+            logger.info(f"Sending reminder for: {event.get('title')} (in {minutes_until_event} min)")
+            to_send.append((event_id, event, reminder_minutes, event_datetime))
+        
+        # Send concurrently (bounded and rate limited per HA instance)
+        results = self.notifier.send_reminders([(event, minutes) for _, event, minutes, _ in to_send])
+        
+        newly_sent = []
+        for (event_id, event, reminder_minutes, event_datetime), success in zip(to_send, results):
+            if success:
+                newly_sent.append({
+                    'event_id': event_id,
+                    'event_title': event.get('title', 'Unknown'),
+                    'minutes_before': reminder_minutes,
+                    'event_datetime': event_datetime,
+                })
+            else:
+                logger.error(f"Failed to send reminder for: {event.get('title')}")
+                self.stats['failed'] += 1
+        
+        # Mark all sent reminders in one bulk write
+        if newly_sent and self.db_client.is_connected():
+            self.db_client.mark_reminders_sent(newly_sent)
+        
+        self.stats['sent'] += len(newly_sent)
+        return len(newly_sent)
+    
+    def next_fire_time(self) -> Optional[datetime]:
+        """Fire time of the next queued reminder"""
+        return self._queue[0][0] if self._queue else None
+    
+    def run_forever(self):
+        """Run until stop() is called"""
+        logger.info("=== Reminder daemon started ===")
+        
+        # With reminders disabled the daemon keeps running (and keeps the
+        # queue current), so enabling them in .env takes effect on the next
+        # refresh without a restart
+        if not self.config.reminders_enabled:
+            logger.info("Reminders are disabled in configuration; waiting for them to be enabled")
+        elif not self.notifier.test_connection():
+            logger.error("Cannot connect to Home Assistant. Reminder daemon not started.")
+            return
+        
+        next_refresh = _now()
+        
+        while not self._stop.is_set():
+            now = _now()
+            
+            if now >= next_refresh:
+                try:
+                    self.apply_config_changes()
+                    self.refresh()
+                except Exception as e:
+                    logger.error(f"Error refreshing reminder queue: {e}")
+                next_refresh = now + timedelta(seconds=self.refresh_seconds)
+            
+            try:
+                self.run_pending()
+            except Exception as e:
+                logger.error(f"Error sending reminders: {e}")
+            
+            # Sleep until the next reminder or the next refresh, whichever is first
+            wake_at = next_refresh
+            next_fire = self.next_fire_time()
+            if next_fire and next_fire < wake_at:
+                wake_at = next_fire
+            
+            timeout = max(0.0, (wake_at - _now()).total_seconds())
+            self._stop.wait(timeout)
+        
+        logger.info(f"=== Reminder daemon stopped: {self.stats['sent']} sent, "
+                    f"{self.stats['skipped']} skipped, {self.stats['failed']} failed ===")
+    
+    def stop(self):
+        """Ask the daemon loop to exit"""
+        self._stop.set()
+    
+    def close(self):
+        """Release connections"""
+        unsubscribe(self._on_config_change)
+        self.events_manager.close()
+        self.db_client.close()
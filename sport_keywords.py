@@ -0,0 +1,111 @@
+"""
+Winter sports keyword matching shared by the tv.nu scrapers.
+
+All keywords are compiled into one pattern, so a title is scanned once to
+find every keyword it contains. Most keywords are stems that may appear
+anywhere in a word, as in Swedish compounds ("slalom" matches
+"Damslalom", "olympi" matches "olympiska"). Keywords in
+WHOLE_WORD_KEYWORDS must be whole words ("os" matches "OS i Milano" but
+not "Oslo").
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+# Keywords per sport, in classification priority order: a title matching
+# several sports gets the first one (e.g. "Skidskytte, längdskidor" is
+# biathlon)
+SPORT_KEYWORDS = [
+    ('biathlon', ['skidskytte', 'biathlon']),
+    ('alpine', ['alpint', 'alpine', 'slalom', 'storslalom', 'super-g', 'störtlopp', 'downhill']),
+    ('ski-jumping', ['backhoppning', 'backhoppare', 'ski jumping', 'skidflygning']),
+    ('ice-hockey', ['ishockey', 'hockey', 'ice hockey']),
+    ('figure-skating', ['konståkning', 'figure skating']),
+    ('speed-skating', ['skridsko', 'speed skating', 'short track']),
+    ('curling', ['curling']),
+    # Freestyle & Snowboard
+    ('other', ['freestyle', 'snowboard', 'slopestyle', 'halfpipe', 'big air']),
+    # Nordic combined
+    ('other', ['nordisk kombination', 'nordic combined']),
+    # Bobsleigh, Skeleton, Luge
+    ('other', ['bob', 'bobsleigh', 'skeleton', 'rodel', 'luge']),
+    ('cross-country', ['längdskidor', 'längdskidåkning', 'längdsidåkning', 'längd', 'cross-country', 'langrenn']),
+]
+
+# Keywords that mark a winter sports program without naming the sport
+GENERAL_KEYWORDS = ['världscup', 'world cup', 'vm', 'world championship', 'os', 'olympi']
+
+LOCATION_KEYWORDS = [
+    'ruka', 'trondheim', 'davos', 'falun', 'lillehammer', 'oslo', 'drammen',
+    'kitzbühel', 'wengen', 'cortina', 'åre', 'schladming', 'val gardena',
+    'tour de ski'
+]
+
+# Short keywords that are also common word stems ("bob" in "bobby",
+# "vm" in "vmware")
+WHOLE_WORD_KEYWORDS = {'os', 'vm', 'bob', 'åre', 'luge'}
+
+
+def _build_pattern(keywords: List[str]) -> re.Pattern:
+    alternatives = []
+    # Longest first, so the most specific keyword is reported
+    for keyword in sorted(set(keywords), key=len, reverse=True):
+        alternative = re.escape(keyword)
+        if keyword in WHOLE_WORD_KEYWORDS:
+            alternative = r'(?<!\w)%s(?!\w)' % alternative
+        alternatives.append(alternative)
+    
+    return re.compile('|'.join(alternatives))
+
+
+def _build_keyword_sports() -> Dict[str, Tuple[int, str]]:
+    keyword_sports = {}
+    for priority, (sport, keywords) in enumerate(SPORT_KEYWORDS):
+        for keyword in keywords:
+            keyword_sports.setdefault(keyword, (priority, sport))
+    return keyword_sports
+
+
+# Keyword -> (priority, sport)
+_KEYWORD_SPORTS = _build_keyword_sports()
+
+SPORT_PATTERN = _build_pattern(list(_KEYWORD_SPORTS))
+WINTER_SPORTS_PATTERN = _build_pattern(list(_KEYWORD_SPORTS) + GENERAL_KEYWORDS + LOCATION_KEYWORDS)
+
+
+def find_keywords(text: str) -> List[str]:
+    """
+    Find every winter sports keyword in a text.
+    
+    Args:
+        text: Title or description
+    
+    Returns:
+        Matched keywords in order of appearance
+    """
+    return WINTER_SPORTS_PATTERN.findall(text.lower())
+
+
+def is_winter_sport(text: str) -> bool:
+    """Check if a text mentions a winter sport, event or venue"""
+    return WINTER_SPORTS_PATTERN.search(text.lower()) is not None
+
+
+def classify_sport(text: str, default: Optional[str] = 'other') -> Optional[str]:
+    """
+    Determine the sport of a program from its title.
+    
+    Args:
+        text: Title or description
+        default: Sport returned when no sport keyword matches
+    
+    Returns:
+        Sport (e.g., 'biathlon'), or default
+    """
+    best = None
+    for keyword in SPORT_PATTERN.findall(text.lower()):
+        match = _KEYWORD_SPORTS[keyword]
+        if best is None or match < best:
+            best = match
+    
+    return best[1] if best else default
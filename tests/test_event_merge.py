@@ -0,0 +1,123 @@
+from pathlib import Path
+
+import pytest
+
+from event_merge import dedupe_broadcasts, load_events, merge_events
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def broadcast(title, date='2025-12-06', time='12:00', channel='SVT1', sport='biathlon'):
+    return {'sport': sport, 'title': title, 'description': title, 'channel': channel,
+            'date': date, 'time': time, 'verified': True}
+
+
+def calendar(title, competition, date='2025-12-06', sport='biathlon', location=None):
+    event = {'sport': sport, 'title': title, 'competition': competition, 'channel': 'TBA',
+             'date': date, 'time': 'TBA', 'verified': False}
+    if location:
+        event['location'] = location
+    return event
+
+
+def test_saved_data_match_counts():
+    tv_events = [e for e in load_events(ROOT / 'tvnu_events_selenium.json') if e.get('verified')]
+    calendar_events = load_events(ROOT / 'events.json')
+
+    merged, stats = merge_events(tv_events, [dict(e) for e in calendar_events])
+
+    assert stats == {
+        'broadcasts': 52,
+        'duplicate_broadcasts': 0,
+        'calendar_events': 58,
+        'calendar_covered': 3,
+        'calendar_kept': 55,
+    }
+    assert len(merged) == 107
+
+    kept = {(e['date'], e['title'], e['competition']) for e in merged}
+    assert ('2025-11-29', 'Världscupen i Oestersund', 'Världscup') not in kept
+    assert ('2025-11-30', 'Världscupen i Ruka', '30 km - Damer') not in kept
+    assert ('2025-11-30', 'Världscupen i Ruka', '30 km - Herrar') not in kept
+
+
+def test_duplicate_broadcasts_collapse_to_most_complete():
+    events = [
+        broadcast('Skidskytte: Sprint damer från Östersund', channel='TBA'),
+        broadcast('Skidskytte: Sprint damer från Östersund'),
+        broadcast('Skidskytte: Sprint herrar från Östersund', time='15:00'),
+    ]
+
+    unique, removed = dedupe_broadcasts(events)
+
+    assert removed == 1
+    assert [e['channel'] for e in unique] == ['SVT1', 'SVT1']
+
+
+def test_broadcasts_on_different_channels_are_kept():
+    events = [
+        broadcast('Skidskytte: Sprint damer från Östersund'),
+        broadcast('Skidskytte: Sprint damer från Östersund', channel='NRK1'),
+    ]
+
+    unique, removed = dedupe_broadcasts(events)
+
+    assert removed == 0
+    assert len(unique) == 2
+
+
+def test_gender_conflict_keeps_calendar_event():
+    tv_events = [broadcast('Skidskytte: Sprint herrar från Östersund')]
+    calendar_events = [
+        calendar('Världscupen i Östersund', 'Sprint - Damer'),
+        calendar('Världscupen i Östersund', 'Sprint - Herrar'),
+    ]
+
+    merged, stats = merge_events(tv_events, calendar_events)
+
+    assert stats['calendar_covered'] == 1
+    assert [e['competition'] for e in merged[1:]] == ['Sprint - Damer']
+
+
+def test_venue_conflict_keeps_calendar_event():
+    tv_events = [broadcast('Skidskytte: Sprint från Hochfilzen')]
+    calendar_events = [
+        calendar('Världscupen i Hochfilzen', 'Sprint'),
+        calendar('Världscupen i Oestersund', 'Sprint'),
+    ]
+
+    merged, stats = merge_events(tv_events, calendar_events, mark_unverified=True)
+
+    assert stats['calendar_covered'] == 1
+    assert [e['title'] for e in merged[1:]] == ['Världscupen i Oestersund']
+    assert merged[1]['verified'] is False
+
+
+def test_transliterated_venue_is_covered():
+    tv_events = [broadcast('Skidskytte: Sprint från Östersund')]
+    calendar_events = [calendar('Världscupen i Oestersund', 'Sprint')]
+
+    _, stats = merge_events(tv_events, calendar_events)
+
+    assert stats['calendar_covered'] == 1
+
+
+def test_other_day_or_sport_is_not_covered():
+    tv_events = [broadcast('Skidskytte: Sprint från Östersund')]
+    calendar_events = [
+        calendar('Världscupen i Östersund', 'Sprint', date='2025-12-07'),
+        calendar('Världscupen i Östersund', 'Sprint', sport='cross-country'),
+    ]
+
+    _, stats = merge_events(tv_events, calendar_events)
+
+    assert stats['calendar_covered'] == 0
+    assert stats['calendar_kept'] == 2
+
+
+def test_load_events_rejects_undecodable_file(tmp_path):
+    path = tmp_path / 'events.json'
+    path.write_bytes(b'\xff')
+
+    with pytest.raises(ValueError, match='neither UTF-8 nor UTF-16'):
+        load_events(path)
@@ -0,0 +1,49 @@
+import pytest
+
+mongomock = pytest.importorskip('mongomock')
+
+import mongodb_client
+from events_manager import EventsManager
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    monkeypatch.setenv('MONGODB_URI', 'mongodb://sync-test')
+    monkeypatch.setattr(mongodb_client, 'MongoClient', mongomock.MongoClient)
+    mongodb_client.close_shared_clients()
+    manager = EventsManager()
+    yield manager
+    manager.close()
+    mongodb_client.close_shared_clients()
+
+
+def event(event_id, title, date='2099-01-10'):
+    return {'id': event_id, 'sport': 'biathlon', 'title': title, 'channel': 'SVT1',
+            'date': date, 'time': '12:00'}
+
+
+def test_sync_deletes_only_events_from_the_store(manager):
+    manager.sync_events([event('a', 'Sprint damer'), event('b', 'Sprint herrar')])
+    manager.add_event(event('manual', 'Extra sändning'))
+    
+    report = manager.sync_events([event('a', 'Sprint damer')])
+    
+    assert report['deleted'] == ['b']
+    assert sorted(e['id'] for e in manager.get_all_events()) == ['a', 'manual']
+
+
+def test_rerun_with_unchanged_events_writes_nothing(manager):
+    events = [event('a', 'Sprint damer'), event('b', 'Sprint herrar')]
+    manager.sync_events(events)
+    
+    report = manager.sync_events(events)
+    
+    assert (report['written'], report['removed'], report['unchanged_count']) == (0, 0, 2)
+
+
+@pytest.mark.parametrize('batch_size', [0, 1, 500])
+def test_migrate_start_at_updates_every_event(manager, batch_size):
+    manager.events_collection.insert_many([event(str(i), f'Sprint {i}') for i in range(3)])
+    
+    assert manager.migrate_start_at(batch_size=batch_size) == 3
+    assert manager.events_collection.count_documents({'start_at': {'$exists': False}}) == 0
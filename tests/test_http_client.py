@@ -0,0 +1,36 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+FINGERPRINT_SCRIPT = """
+import hashlib
+from http_client import _code_fingerprint
+
+def parse(text):
+    return [line for line in text.split() if line in {'alpine', 'biathlon', 'curling', 'luge'}]
+
+digest = hashlib.sha1()
+_code_fingerprint(parse.__code__, digest)
+print(digest.hexdigest())
+"""
+
+
+def fingerprint(hash_seed):
+    env = dict(os.environ, PYTHONHASHSEED=str(hash_seed))
+    result = subprocess.run([sys.executable, '-c', FINGERPRINT_SCRIPT], cwd=ROOT, env=env,
+                            capture_output=True, text=True, check=True)
+    return result.stdout.strip()
+
+
+def test_parser_fingerprint_is_stable_across_processes():
+    assert len({fingerprint(seed) for seed in range(4)}) == 1
+
+
+def test_cache_dir_is_next_to_the_module():
+    import http_client
+    
+    if 'HTTP_CACHE_DIR' not in os.environ:
+        assert Path(http_client.CACHE_DIR) == ROOT / '.http_cache'
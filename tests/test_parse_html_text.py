@@ -0,0 +1,43 @@
+import json
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+import fetch_tvnu_selenium
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Output of the original section-by-section parse_html_text on the saved
+# debug_*.html pages, with today fixed at 2025-11-20 (the year of each date
+# header depends on it)
+GOLDEN = json.loads((ROOT / 'tests' / 'fixtures' / 'parse_html_text.json').read_text(encoding='utf-8'))
+
+
+class FrozenDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2025, 11, 20, 12, 0)
+
+
+@pytest.mark.parametrize('slug', sorted(GOLDEN))
+def test_parse_html_text_matches_golden_output(slug, monkeypatch):
+    monkeypatch.setattr(fetch_tvnu_selenium, 'datetime', FrozenDatetime)
+    html = (ROOT / f'debug_{slug}.html').read_text(encoding='utf-8')
+    
+    programs = fetch_tvnu_selenium.parse_html_text(html, fetch_tvnu_selenium.SPORT_CATEGORIES[slug])
+    
+    assert programs == GOLDEN[slug]
+
+
+def test_parse_html_text_keeps_context_within_date_section(monkeypatch):
+    monkeypatch.setattr(fetch_tvnu_selenium, 'datetime', FrozenDatetime)
+    html = ('<p>09:00 SVT2</p><h2>FREDAG 21 NOVEMBER</h2><p>Falun</p><p>11:00</p>'
+            '<h2>LÖRDAG 22 NOVEMBER</h2><p>SVT1 Ruka 12:00</p>')
+    
+    programs = fetch_tvnu_selenium.parse_html_text(html, 'cross-country')
+    
+    assert [(p['date'], p['time'], p['channel'], p['title']) for p in programs] == [
+        ('2025-11-21', '11:00', 'TBA', 'Längdskidåkning, Falun'),
+        ('2025-11-22', '12:00', 'SVT1', 'Längdskidåkning, Ruka'),
+    ]
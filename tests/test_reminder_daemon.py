@@ -0,0 +1,85 @@
+import dataclasses
+from datetime import timedelta
+
+import pytest
+
+mongomock = pytest.importorskip('mongomock')
+
+import mongodb_client
+import reminder_daemon
+from events_manager import compute_event_hash
+
+
+class FakeNotifier:
+    def __init__(self, fail_titles=()):
+        self.batches = []
+        self.fail_titles = set(fail_titles)
+        self.connection_tests = 0
+    
+    def send_reminders(self, reminders):
+        self.batches.append(reminders)
+        return [event['title'] not in self.fail_titles for event, _ in reminders]
+    
+    def test_connection(self):
+        self.connection_tests += 1
+        return True
+
+
+@pytest.fixture
+def daemon(monkeypatch):
+    monkeypatch.setenv('MONGODB_URI', 'mongodb://daemon-test')
+    monkeypatch.setattr(mongodb_client, 'MongoClient', mongomock.MongoClient)
+    mongodb_client.close_shared_clients()
+    daemon = reminder_daemon.ReminderDaemon()
+    daemon.notifier = FakeNotifier(fail_titles={'Stafett'})
+    yield daemon
+    daemon.close()
+    mongodb_client.close_shared_clients()
+
+
+def queue_due(daemon, event_id, title, minutes_before):
+    start = reminder_daemon._now() + timedelta(minutes=minutes_before - 1)
+    event = {'id': event_id, 'title': title, 'sport': 'biathlon', 'channel': 'SVT1',
+             'date': start.strftime('%Y-%m-%d'), 'time': start.strftime('%H:%M')}
+    event_hash = compute_event_hash(event)
+    daemon._events[event_id] = event
+    daemon._hashes[event_id] = event_hash
+    daemon._queue.append((reminder_daemon._now() - timedelta(minutes=1), event_id, minutes_before, event_hash))
+
+
+def test_run_pending_batches_due_reminders(daemon):
+    queue_due(daemon, 'a', 'Sprint damer', 30)
+    queue_due(daemon, 'b', 'Sprint herrar', 30)
+    queue_due(daemon, 'c', 'Stafett', 30)
+    daemon.db_client.mark_reminders_sent([{'event_id': 'b', 'event_title': 'Sprint herrar',
+                                           'minutes_before': 30, 'event_datetime': None}])
+    lookups = []
+    original_lookup = daemon.db_client.get_sent_reminder_keys
+    daemon.db_client.get_sent_reminder_keys = lambda ids: lookups.append(ids) or original_lookup(ids)
+    
+    sent = daemon.run_pending()
+    
+    assert sent == 1
+    assert len(lookups) == 1
+    assert [[event['id'] for event, _ in batch] for batch in daemon.notifier.batches] == [['a', 'c']]
+    assert daemon.db_client.get_sent_reminder_keys(['a', 'b', 'c']) == {('a', 30), ('b', 30)}
+    assert (daemon.stats['sent'], daemon.stats['skipped'], daemon.stats['failed']) == (1, 1, 1)
+    assert daemon._queue == []
+
+
+def test_run_forever_keeps_running_while_disabled(daemon, monkeypatch):
+    daemon.config = dataclasses.replace(daemon.config, reminders_enabled=False)
+    daemon.refresh_seconds = 0
+    refreshes = []
+    
+    def refresh():
+        refreshes.append(daemon.config.reminders_enabled)
+        if len(refreshes) == 3:
+            daemon.stop()
+    
+    monkeypatch.setattr(daemon, 'refresh', refresh)
+    
+    daemon.run_forever()
+    
+    assert refreshes == [False, False, False]
+    assert daemon.notifier.connection_tests == 0
@@ -0,0 +1,139 @@
+"""
+Decoder for the __INITIAL_STATE__ data that tv.nu embeds in its pages.
+
+The state is a JSON document stored as a JavaScript string literal:
+    
+    window.__INITIAL_STATE__ = "{\"sportPageSchedule\":[...],...}";
+
+The literal is located with one regex scan, decoded in a single pass and
+then parsed - either completely, or only the value of one top-level key.
+
+The module also holds SPORT_PAGE_URL, the tv.nu sport page URL shared by
+the scrapers.
+"""
+
+import json
+import os
+import re
+from typing import Any, Optional, Tuple
+
+# Sport page URL template (override with TVNU_SPORT_URL, e.g. to point at a
+# local server serving the debug_*.html fixtures)
+SPORT_PAGE_URL = os.getenv('TVNU_SPORT_URL', 'https://www.tv.nu/sport/{slug}')
+
+# Assignment up to the opening quote of the string literal
+INITIAL_STATE_PATTERN = re.compile(r'__INITIAL_STATE__\s*=\s*(?=")')
+
+# Body of a string literal (escapes kept as-is), used for JavaScript-only escapes
+JS_STRING_BODY_PATTERN = re.compile(r'"((?:[^"\\]|\\.)*)"', re.DOTALL)
+
+# JavaScript escape sequences that are not valid JSON
+JS_ESCAPE_PATTERN = re.compile(r'\\(u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|\r\n|.)', re.DOTALL)
+
+SIMPLE_ESCAPES = {
+    'n': '\n', 'r': '\r', 't': '\t', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0',
+}
+
+_decoder = json.JSONDecoder()
+
+# Literal newlines are allowed inside the state string
+_string_decoder = json.JSONDecoder(strict=False)
+
+
+def _replace_js_escape(match) -> str:
+    escape = match.group(1)
+    if escape[0] in 'ux' and len(escape) > 1:
+        return chr(int(escape[1:], 16))
+    if escape in ('\n', '\r', '\r\n', '\u2028', '\u2029'):
+        # Line continuation
+        return ''
+    return SIMPLE_ESCAPES.get(escape, escape)
+
+
+def decode_js_string(text: str, start: int) -> Tuple[str, int]:
+    """
+    Decode a double-quoted JavaScript string literal in one pass.
+    
+    Args:
+        text: Text containing the literal
+        start: Index of the opening quote
+    
+    Returns:
+        Tuple of (decoded string, index just after the closing quote)
+    """
+    try:
+        # JSON string escapes are a subset of JavaScript's, so the C JSON
+        # scanner finds the closing quote and decodes every escape
+        # (including \uXXXX) without copying the literal first
+        return _string_decoder.raw_decode(text, start)
+    except ValueError:
+        pass
+    
+    # Literal uses JavaScript-only escapes such as \x41 or \'
+    match = JS_STRING_BODY_PATTERN.match(text, start)
+    if not match:
+        raise ValueError(f"Unterminated string literal at index {start}")
+    
+    return JS_ESCAPE_PATTERN.sub(_replace_js_escape, match.group(1)), match.end()
+
+
+def find_initial_state(html: str) -> Optional[str]:
+    """
+    Locate and decode the __INITIAL_STATE__ string in a page.
+    
+    Args:
+        html: HTML content
+    
+    Returns:
+        Decoded JSON text, or None if the page has no state data
+    """
+    match = INITIAL_STATE_PATTERN.search(html)
+    if not match:
+        return None
+    
+    state_json, _ = decode_js_string(html, match.end())
+    return state_json
+
+
+def extract_initial_state(html: str) -> Optional[dict]:
+    """
+    Extract and decode the full __INITIAL_STATE__ data from a page.
+    
+    Args:
+        html: HTML content
+    
+    Returns:
+        Decoded state dictionary, or None if the page has no state data
+    """
+    state_json = find_initial_state(html)
+    if state_json is None:
+        return None
+    
+    return json.loads(state_json)
+
+
+def extract_state_key(html: str, key: str) -> Optional[Any]:
+    """
+    Parse only the value of one key from the __INITIAL_STATE__ data.
+    
+    The rest of the state tree is never turned into Python objects.
+    
+    Args:
+        html: HTML content
+        key: State key (e.g., 'sportPageSchedule')
+    
+    Returns:
+        The decoded value, or None if the page or key is missing
+    """
+    state_json = find_initial_state(html)
+    if state_json is None:
+        return None
+    
+    # In decoded JSON an unescaped '"key":' can only be an object key
+    marker = re.compile(r'"%s"\s*:\s*' % re.escape(key))
+    match = marker.search(state_json)
+    if not match:
+        return None
+    
+    value, _ = _decoder.raw_decode(state_json, match.end())
+    return value
@@ -4,148 +4,90 @@ Runs without user prompts for scheduled automation.
 """
 
 import json
-import re
+import os
 from datetime import datetime
-from urllib.request import urlopen
+from calendar_feeds import fetch_and_parse_calendar, fetch_biathlon_events, update_events_store
+from event_ids import assign_event_ids
+from http_client import DEFAULT_WORKERS, fetch_concurrently
 import sys
 
-# FIS Calendar URLs
-FIS_CC_URL = "https://data.fis-ski.com/services/public/icalendar-feed-fis-events.html?seasoncode=2026&sectorcode=CC&categorycode=WC"
+# FIS World Cup calendar feed, one per sector and season
+FIS_CALENDAR_URL = "https://data.fis-ski.com/services/public/icalendar-feed-fis-events.html?seasoncode={season}&sectorcode={sector}&categorycode=WC"
 
-# IBU API URL for biathlon events
-IBU_API_URL = "https://biathlonresults.com/modules/sportapi/api/Events?SeasonId=2526&Level=1"
+# FIS sector code -> (sport, Swedish name)
+FIS_SECTORS = {
+    'CC': ('cross-country', 'Längdskidor'),
+    'AL': ('alpine', 'Alpint'),
+    'JP': ('ski-jumping', 'Backhoppning'),
+    'NK': ('other', 'Nordisk kombination'),
+    'FS': ('other', 'Freestyle'),
+}
 
-def parse_ical_event(event_text):
-    """Parse a single VEVENT from iCalendar format."""
-    event = {}
-    
-    # Extract fields using regex
-    summary_match = re.search(r'SUMMARY:(.+)', event_text)
-    location_match = re.search(r'LOCATION:(.+)', event_text)
-    dtstart_match = re.search(r'DTSTART(?:;VALUE=DATE)?:(\d{8})', event_text)
-    description_match = re.search(r'DESCRIPTION:(.+?)(?=\n[A-Z])', event_text, re.DOTALL)
-    
-    if not summary_match or not location_match or not dtstart_match:
-        return None
-    
-    summary = summary_match.group(1).strip()
-    location = location_match.group(1).strip()
-    date_str = dtstart_match.group(1)
-    
-    # Extract gender and discipline
-    gender = None
-    discipline = None
-    category = None
-    
-    if description_match:
-        desc = description_match.group(1)
-        gender_match = re.search(r'Gender: ([WM])', desc)
-        discipline_match = re.search(r'Discipline: (.+?)\\n', desc)
-        category_match = re.search(r'Category: (.+?)\\n', desc)
-        
-        if gender_match:
-            gender = gender_match.group(1)
-        if discipline_match:
-            discipline = discipline_match.group(1)
-        if category_match:
-            category = category_match.group(1)
-    
-    # Only include World Cup (WC) events
-    if category != "WC":
-        return None
-    
-    # Parse date
-    try:
-        event_date = datetime.strptime(date_str, "%Y%m%d")
-    except:
-        return None
-    
-    # Format discipline names
-    discipline_map = {
-        'SP': 'Sprint',
-        '10k': '10 km',
-        '30k': '30 km',
-        '50k': '50 km',
-        '15k': '15 km',
-        'Skt': 'Skiatlon',
-        'Tsp': 'Teamsprint',
-        'HMS': 'Mass Start',
-        'Pur': 'Pursuit'
-    }
-    
-    discipline_name = discipline_map.get(discipline, discipline)
-    gender_text = "Damer" if gender == "W" else "Herrar"
-    
-    event = {
-        'location': location,
-        'date': event_date.strftime("%Y-%m-%d"),
-        'gender': gender,
-        'discipline': discipline_name,
-        'competition': f"{discipline_name} - {gender_text}",
-        'summary': summary
-    }
-    
-    return event
+def current_fis_season(today=None):
+    """FIS season code for a date (the 2025/26 season is 2026)."""
+    today = today or datetime.now()
+    return today.year + 1 if today.month >= 7 else today.year
 
-def fetch_and_parse_calendar(url):
-    """Fetch and parse iCalendar data."""
-    try:
-        with urlopen(url) as response:
-            ical_data = response.read().decode('utf-8')
-        
-        # Split into individual events
-        events = []
-        event_blocks = re.findall(r'BEGIN:VEVENT(.+?)END:VEVENT', ical_data, re.DOTALL)
-        
-        for block in event_blocks:
-            event = parse_ical_event(block)
-            if event:
-                events.append(event)
-        
-        return events
-    except Exception as e:
-        print(f"Error fetching calendar: {e}", file=sys.stderr)
-        return []
+def env_list(name, default):
+    """Comma-separated list from an environment variable."""
+    value = os.getenv(name)
+    if not value:
+        return default
+    return [item.strip() for item in value.split(',') if item.strip()]
 
-def fetch_biathlon_events():
-    """Fetch biathlon events from IBU API."""
-    try:
-        with urlopen(IBU_API_URL) as response:
-            data = json.loads(response.read().decode('utf-8'))
-        
-        events = []
-        # Check if data is a list or has a 'value' key
-        items = data if isinstance(data, list) else data.get('value', [])
-        
-        for item in items:
-            # Only include World Cup events (Level 1)
-            if item.get('Level') != 1:
+# Sectors and seasons to fetch (override with FIS_SECTORS / FIS_SEASONS,
+# e.g. FIS_SECTORS=CC,AL FIS_SEASONS=2026,2027)
+FETCH_SECTORS = env_list('FIS_SECTORS', list(FIS_SECTORS))
+FETCH_SEASONS = [int(season) for season in env_list('FIS_SEASONS', [current_fis_season()])]
+
+def fetch_fis_calendars(sectors=None, seasons=None, max_workers=DEFAULT_WORKERS):
+    """
+    Fetch the FIS World Cup calendars for every sector and season.
+    
+    All feeds are fetched concurrently (bounded by max_workers and the
+    per-host limit), so adding a sector costs about one extra feed in
+    parallel rather than one more sequential download.
+    
+    Args:
+        sectors: FIS sector codes (default: FETCH_SECTORS)
+        seasons: FIS season codes (default: FETCH_SEASONS)
+        max_workers: Number of feeds fetched in parallel
+    
+    Returns:
+        Events from all feeds, each tagged with sport, sector and season,
+        without duplicates and sorted by date
+    """
+    sectors = sectors or FETCH_SECTORS
+    seasons = seasons or FETCH_SEASONS
+    
+    feeds = [(sector, season) for sector in sectors for season in seasons if sector in FIS_SECTORS]
+    urls = [FIS_CALENDAR_URL.format(season=season, sector=sector) for sector, season in feeds]
+    results = fetch_concurrently(fetch_and_parse_calendar, urls, max_workers=max_workers)
+    
+    events = []
+    seen = set()
+    for (sector, season), feed_events in zip(feeds, results):
+        sport, sector_name = FIS_SECTORS[sector]
+        for event in feed_events:
+            key = (sector, event['date'], event['location'], event['competition'])
+            if key in seen:
                 continue
-            
-            start_date = datetime.fromisoformat(item['StartDate'].replace('Z', '+00:00'))
-            
-            event = {
-                'location': item.get('ShortDescription', ''),
-                'date': start_date.strftime('%Y-%m-%d'),
-                'country': item.get('Nat', ''),
-                'event_id': item.get('EventId', '')
-            }
-            events.append(event)
-        
-        return events
-    except Exception as e:
-        print(f"Error fetching biathlon events: {e}", file=sys.stderr)
-        return []
+            seen.add(key)
+            events.append({**event, 'sport': sport, 'sector': sector, 'sector_name': sector_name, 'season': season})
+    
+    events.sort(key=lambda x: x['date'])
+    return events
 
-def generate_js_events(cc_events, biathlon_events):
+def generate_js_events(fis_events, biathlon_events):
     """Generate JavaScript events array with channel placeholders."""
     js_events = []
-    event_id = 1
     
-    # Process cross-country events
-    cc_events.sort(key=lambda x: x['date'])
+    # Process FIS events (cross-country unless tagged by fetch_fis_calendars)
+    fis_events.sort(key=lambda x: x['date'])
     
-    for event in cc_events:
+    for event in fis_events:
+        sport = event.get('sport', 'cross-country')
+        
         # Default channels for Swedish broadcasts
         channel = "SVT2"
         time = "13:00"
@@ -156,19 +98,25 @@ def generate_js_events(cc_events, biathlon_events):
         elif "Oslo" in event['location'] or "Drammen" in event['location']:
             channel = "SVT2"
         
+        title = f"Världscupen i {event['location']}"
+        description = f"Världscuptävling i {event['location']}"
+        if sport == 'other':
+            # The sport filter does not tell these apart, so the title does
+            title = f"{event['sector_name']}: {title}"
+        if event.get('sector', 'CC') != 'CC':
+            description = f"{event['sector_name']}, världscuptävling i {event['location']}"
+        
         js_event = {
-            "id": event_id,
-            "sport": "cross-country",
-            "title": f"Världscupen i {event['location']}",
+            "sport": sport,
+            "title": title,
             "competition": event['competition'],
             "channel": channel,
             "date": event['date'],
             "time": time,
-            "description": f"Världscuptävling i {event['location']}"
+            "description": description
         }
         
         js_events.append(js_event)
-        event_id += 1
     
     # Process biathlon events
     biathlon_events.sort(key=lambda x: x['date'])
@@ -181,7 +129,6 @@ def generate_js_events(cc_events, biathlon_events):
             channel = "SVT1"
         
         js_event = {
-            "id": event_id,
             "sport": "biathlon",
             "title": f"Världscupen i {event['location']}",
             "competition": "Världscup",
@@ -192,64 +139,37 @@ def generate_js_events(cc_events, biathlon_events):
         }
         
         js_events.append(js_event)
-        event_id += 1
     
     # Sort all events by date
     js_events.sort(key=lambda x: x['date'])
     
-    # Renumber IDs
-    for idx, event in enumerate(js_events, 1):
-        event['id'] = idx
-    
-    return js_events
-
-def update_script_js(events):
-    """Update script.js with new events."""
-    try:
-        with open("script.js", "r", encoding="utf-8") as f:
-            content = f.read()
-        
-        # Generate JavaScript array
-        js_code = "const events = " + json.dumps(events, indent=4, ensure_ascii=False) + ";"
-        
-        # Replace the existing events array
-        start = content.find("const events = [")
-        if start == -1:
-            print("Could not find events array in script.js", file=sys.stderr)
-            return False
-        
-        end = content.find("];", start) + 2
-        
-        new_content = content[:start] + js_code + content[end:]
-        
-        with open("script.js", "w", encoding="utf-8") as f:
-            f.write(new_content)
-        
-        return True
-    except Exception as e:
-        print(f"Error updating script.js: {e}", file=sys.stderr)
-        return False
+    # Content-derived IDs, stable across runs
+    return assign_event_ids(js_events)
 
 def main():
     print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Starting automatic update...")
     
-    print("Fetching FIS Cross-Country World Cup Calendar...")
-    cc_events = fetch_and_parse_calendar(FIS_CC_URL)
-    print(f"Found {len(cc_events)} cross-country World Cup events")
+    print(f"Fetching FIS World Cup calendars ({', '.join(FETCH_SECTORS)}; "
+          f"seasons {', '.join(str(season) for season in FETCH_SEASONS)})...")
+    fis_events = fetch_fis_calendars()
+    print(f"Found {len(fis_events)} FIS World Cup events")
     
     print("Fetching IBU Biathlon World Cup Calendar...")
     biathlon_events = fetch_biathlon_events()
     print(f"Found {len(biathlon_events)} biathlon World Cup events")
     
-    if not cc_events and not biathlon_events:
+    if not fis_events and not biathlon_events:
         print("ERROR: No events found or error fetching data", file=sys.stderr)
         sys.exit(1)
     
     # Generate JavaScript events
-    js_events = generate_js_events(cc_events, biathlon_events)
+    js_events = generate_js_events(fis_events, biathlon_events)
     
     print(f"Generated {len(js_events)} total events")
-    print(f"  - {len(cc_events)} cross-country events")
+    for sector in FETCH_SECTORS:
+        if sector in FIS_SECTORS:
+            count = sum(1 for event in fis_events if event['sector'] == sector)
+            print(f"  - {count} {FIS_SECTORS[sector][1].lower()} events")
     print(f"  - {len(biathlon_events)} biathlon events")
     
     # Save to JSON for review
@@ -258,12 +178,12 @@ def main():
     
     print("Events saved to events.json")
     
-    # Update script.js automatically
-    if update_script_js(js_events):
-        print("✅ script.js updated successfully!")
+    # Publish to the events store automatically
+    if update_events_store(js_events):
+        print("✅ events.jsonl updated successfully!")
         sys.exit(0)
     else:
-        print("❌ Failed to update script.js", file=sys.stderr)
+        print("❌ Failed to update events.jsonl", file=sys.stderr)
         sys.exit(1)
 
 if __name__ == "__main__":
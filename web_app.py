@@ -2,16 +2,24 @@
 Web interface for Winter Sports TV Schedule settings
 """
 
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, render_template, request, jsonify
 from flask_cors import CORS
+import base64
+import hashlib
+import json
 import logging
 import os
+import re
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict
-from config import get_config
+from typing import Callable, Dict, List, Optional, Tuple
+from config import get_config, get_config_metrics, reload_config
 from home_assistant import HomeAssistantNotifier
-from mongodb_client import MongoDBClient
-from events_manager import EventsManager
+from mongodb_client import MongoDBClient, get_pool_stats
+from events_manager import EventsManager, event_today
+from event_store import EVENTS_STORE_PATH, inline_script_path
 
 logger = logging.getLogger(__name__)
 
@@ -60,14 +68,137 @@ def update_env_file(updates: Dict[str, str]):
         with open(env_path, 'w', encoding='utf-8') as f:
             f.writelines(updated_lines)
         
+        # Apply now instead of at the next change check
+        reload_config()
+        
         logger.info(f"Updated .env file with: {list(updates.keys())}")
         return True
-        
+    
     except Exception as e:
         logger.error(f"Error updating .env file: {e}")
         return False
 
 
+# How long a known events version is trusted before asking MongoDB again
+EVENTS_CACHE_REVALIDATE_SECONDS = 5.0
+
+# Largest page size accepted by /api/events
+MAX_EVENTS_PAGE_SIZE = 500
+
+DATE_PARAM_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+
+def encode_events_cursor(key: Tuple) -> str:
+    """Encode a (date, time, id) keyset position as an opaque cursor"""
+    raw = json.dumps(list(key), separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_events_cursor(cursor: str) -> Tuple:
+    """Decode a cursor from encode_events_cursor (raises ValueError)"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except Exception:
+        raise ValueError('invalid cursor')
+    
+    if not isinstance(key, list) or len(key) != 3:
+        raise ValueError('invalid cursor')
+    return tuple(key)
+
+
+def parse_events_query(args) -> Dict:
+    """Parse and validate /api/events filter parameters (raises ValueError)"""
+    sports: List[str] = []
+    for value in args.getlist('sport'):
+        sports.extend(s.strip() for s in value.split(',') if s.strip())
+    
+    date_from = args.get('from') or None
+    date_to = args.get('to') or None
+    for name, value in (('from', date_from), ('to', date_to)):
+        if value and not DATE_PARAM_PATTERN.match(value):
+            raise ValueError(f'{name} must be a date in YYYY-MM-DD format')
+    
+    limit = args.get('limit')
+    if limit is not None:
+        if not limit.isdigit() or not 1 <= int(limit) <= MAX_EVENTS_PAGE_SIZE:
+            raise ValueError(f'limit must be between 1 and {MAX_EVENTS_PAGE_SIZE}')
+        limit = int(limit)
+    
+    cursor = args.get('cursor')
+    
+    return {
+        'sports': sports or None,
+        'date_from': date_from,
+        'date_to': date_to,
+        'channel': args.get('channel') or None,
+        'limit': limit,
+        'after': decode_events_cursor(cursor) if cursor else None,
+    }
+
+
+class EventsResponseCache:
+    """In-process cache of serialized /api/events responses.
+    
+    Entries are keyed by the events collection version (bumped by
+    EventsManager on every write) plus the request query, so polls between
+    changes are served from memory. The version itself is only re-read from
+    MongoDB every ``revalidate_seconds``.
+    """
+    
+    def __init__(self, revalidate_seconds: float = EVENTS_CACHE_REVALIDATE_SECONDS, max_entries: int = 64):
+        self.revalidate_seconds = revalidate_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._version: Optional[int] = None
+        self._version_checked_at = 0.0
+        self._entries: 'OrderedDict[Tuple, Tuple[bytes, str]]' = OrderedDict()
+        self.stats = {'hits': 0, 'misses': 0, 'not_modified': 0, 'version_checks': 0}
+    
+    def get_version(self, load_version: Callable[[], Optional[int]]) -> Optional[int]:
+        """Get the current events version, re-reading it when stale"""
+        with self._lock:
+            if time.monotonic() - self._version_checked_at < self.revalidate_seconds:
+                return self._version
+        
+        version = load_version()
+        
+        with self._lock:
+            self.stats['version_checks'] += 1
+            if version != self._version:
+                self._entries.clear()
+            self._version = version
+            self._version_checked_at = time.monotonic()
+            return version
+    
+    def get(self, key: Tuple) -> Optional[Tuple[bytes, str]]:
+        """Get a cached (body, etag) pair"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.stats['hits'] += 1
+            else:
+                self.stats['misses'] += 1
+            return entry
+    
+    def put(self, key: Tuple, body: bytes) -> Tuple[bytes, str]:
+        """Store a serialized body and return it with its strong ETag"""
+        etag = hashlib.sha1(body).hexdigest()
+        with self._lock:
+            self._entries[key] = (body, etag)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return body, etag
+    
+    def invalidate(self):
+        """Drop all entries and force a version re-check on the next request"""
+        with self._lock:
+            self._entries.clear()
+            self._version_checked_at = 0.0
+
+
 def create_app():
     """Create and configure the Flask app"""
     app = Flask(__name__, 
@@ -78,12 +209,54 @@ def create_app():
     # Enable CORS
     CORS(app)
     
-    config = get_config()
+    events_cache = EventsResponseCache()
+    app.config['EVENTS_CACHE'] = events_cache
+    
+    def load_events_version() -> Optional[int]:
+        events_manager = EventsManager()
+        version = events_manager.get_version()
+        events_manager.close()
+        return version
+    
+    def cached_json_response(cache_key: Tuple, build_payload: Callable[[], Dict]):
+        """JSON response cached per events version and revalidated by ETag.
+        
+        build_payload runs on a cache miss. If it returns a response rather
+        than a dict (e.g. an error), that response is returned uncached.
+        """
+        version = events_cache.get_version(load_events_version)
+        cache_key = (version,) + cache_key
+        
+        cached = events_cache.get(cache_key) if version is not None else None
+        if cached is None:
+            payload = build_payload()
+            if not isinstance(payload, dict):
+                return payload
+            
+            body = app.json.dumps(payload).encode('utf-8')
+            
+            if version is not None:
+                cached = events_cache.put(cache_key, body)
+            else:
+                cached = (body, hashlib.sha1(body).hexdigest())
+        
+        body, etag = cached
+        
+        if etag in request.if_none_match:
+            events_cache.stats['not_modified'] += 1
+            response = Response(status=304)
+        else:
+            response = Response(body, mimetype='application/json')
+        
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
     
     @app.after_request
     def after_request(response):
-        # Add cache-control headers for API endpoints
-        if request.path.startswith('/api/'):
+        # Add cache-control headers for API endpoints (cached responses
+        # carry an ETag and revalidate instead)
+        if request.path.startswith('/api/') and not response.headers.get('ETag'):
             response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
             response.headers['Pragma'] = 'no-cache'
             response.headers['Expires'] = '0'
@@ -92,7 +265,7 @@ def create_app():
     @app.route('/')
     def index():
         """Main page"""
-        return render_template('index.html', config=config)
+        return render_template('index.html', config=get_config())
     
     @app.route('/settings')
     def settings():
@@ -112,6 +285,25 @@ def create_app():
         from flask import send_from_directory
         return send_from_directory('.', 'script.js')
     
+    @app.route('/events.jsonl')
+    def events_store():
+        """Serve the events store (revalidated with ETag/Last-Modified)"""
+        from flask import send_file
+        if not EVENTS_STORE_PATH.exists():
+            return jsonify({'status': 'error', 'error': 'No events published yet'}), 404
+        return send_file(EVENTS_STORE_PATH, mimetype='application/x-ndjson',
+                         conditional=True, etag=True, max_age=0)
+    
+    @app.route('/events.js')
+    def events_script():
+        """Serve the events store as a script (see event_store.py)"""
+        from flask import send_file
+        script_path = inline_script_path()
+        if not script_path.exists():
+            return jsonify({'status': 'error', 'error': 'No events published yet'}), 404
+        return send_file(script_path, mimetype='text/javascript',
+                         conditional=True, etag=True, max_age=0)
+    
     @app.route('/styles.css')
     def styles_css():
         """Serve styles.css"""
@@ -161,7 +353,7 @@ def create_app():
                 'status': 'success',
                 'message': 'Reminder settings saved successfully!'
             })
-            
+        
         except Exception as e:
             logger.error(f"Error updating reminder config: {e}")
             return jsonify({'error': str(e), 'status': 'error'}), 500
@@ -206,7 +398,7 @@ def create_app():
                 'status': 'success',
                 'message': 'Time settings saved successfully!'
             })
-            
+        
         except Exception as e:
             logger.error(f"Error updating time config: {e}")
             return jsonify({'error': str(e), 'status': 'error'}), 500
@@ -251,7 +443,7 @@ def create_app():
                 'status': 'success',
                 'message': 'Sport filters saved successfully!'
             })
-            
+        
         except Exception as e:
             logger.error(f"Error updating sport filters: {e}")
             return jsonify({'error': str(e), 'status': 'error'}), 500
@@ -272,7 +464,7 @@ def create_app():
                     'status': 'error',
                     'error': 'Failed to connect to Home Assistant'
                 }), 500
-                
+        
         except Exception as e:
             logger.error(f"Error testing Home Assistant: {e}")
             return jsonify({'error': str(e), 'status': 'error'}), 500
@@ -293,7 +485,7 @@ def create_app():
                     'status': 'error',
                     'error': 'Failed to send test notification'
                 }), 500
-                
+        
         except Exception as e:
             logger.error(f"Error sending test notification: {e}")
             return jsonify({'error': str(e), 'status': 'error'}), 500
@@ -317,7 +509,7 @@ def create_app():
                     'status': 'warning',
                     'message': 'MongoDB connection failed (optional - reminders will still work)'
                 })
-                
+        
         except Exception as e:
             logger.error(f"Error testing MongoDB: {e}")
             return jsonify({
@@ -325,19 +517,44 @@ def create_app():
                 'message': 'MongoDB connection failed (optional - reminders will still work)'
             })
     
+    @app.route('/api/metrics')
+    def metrics():
+        """Runtime metrics (MongoDB connection pool reuse, config reloads)"""
+        return jsonify({
+            'status': 'success',
+            'mongodb': get_pool_stats(),
+            'events_cache': dict(events_cache.stats),
+            'config': get_config_metrics()
+        })
+    
     @app.route('/api/events')
     def get_events():
-        """Get all events from MongoDB"""
+        """Get events from MongoDB
+        
+        Optional filters: sport (repeatable or comma-separated), from/to
+        (YYYY-MM-DD), channel, limit and cursor (from next_cursor).
+        """
         try:
+            query = parse_events_query(request.args)
+        except ValueError as e:
+            return jsonify({'status': 'error', 'error': str(e), 'events': [], 'count': 0}), 400
+        
+        def build_payload():
             events_manager = EventsManager()
-            events = events_manager.get_all_events()
+            events, next_key = events_manager.query_events(**query)
             events_manager.close()
             
-            return jsonify({
+            payload = {
                 'status': 'success',
                 'events': events,
                 'count': len(events)
-            })
+            }
+            if query['limit']:
+                payload['next_cursor'] = encode_events_cursor(next_key) if next_key else None
+            return payload
+        
+        try:
+            return cached_json_response((request.query_string,), build_payload)
         except Exception as e:
             logger.error(f"Error getting events: {e}")
             return jsonify({
@@ -347,13 +564,41 @@ def create_app():
                 'count': 0
             }), 500
     
+    @app.route('/api/stats')
+    def get_stats():
+        """Event statistics (counts by sport, channel and day) for dashboards
+        
+        Optional: days (upcoming window, default 7).
+        """
+        days = request.args.get('days', '7')
+        if not days.isdigit() or not 0 < int(days) <= 366:
+            return jsonify({'status': 'error', 'error': 'days must be between 1 and 366'}), 400
+        days = int(days)
+        
+        def build_payload():
+            events_manager = EventsManager()
+            stats = events_manager.get_stats(days=days)
+            events_manager.close()
+            
+            if stats is None:
+                return jsonify({'status': 'error', 'error': 'Statistics unavailable'}), 503
+            return {'status': 'success', 'stats': stats}
+        
+        try:
+            # The upcoming window moves with the date
+            return cached_json_response(('stats', event_today().isoformat(), days), build_payload)
+        except Exception as e:
+            logger.error(f"Error getting event statistics: {e}")
+            return jsonify({'status': 'error', 'error': str(e)}), 500
+    
     @app.route('/api/events/import', methods=['POST'])
     def import_events():
-        """Import events from script.js into MongoDB"""
+        """Import events from the events store into MongoDB"""
         try:
             events_manager = EventsManager()
-            count = events_manager.import_events_from_js()
+            count = events_manager.import_events_from_store()
             events_manager.close()
+            events_cache.invalidate()
             
             if count > 0:
                 return jsonify({